@@ -1,15 +1,9 @@
 import os
-from databricks import sql
-import pandas as pd
+import threading
 import dash
-from dash import dcc, html, Input, Output, State, callback_context, ALL, MATCH, no_update
-import yaml
+from dash import html
 
 import dash_bootstrap_components as dbc
-import dash_ag_grid as dag
-from databricks.sdk.core import Config
-from databricks.sdk import WorkspaceClient
-from mlflow_service import mlflow_workspace_service as mlflow_service
 
 from components.tabs.eol_table_tab import create_eol_tab
 
@@ -25,48 +19,57 @@ warehouse_id = os.getenv('DATABRICKS_WAREHOUSE_ID')
 if not warehouse_id:
     print("Warning: DATABRICKS_WAREHOUSE_ID not set. Some features may not work.")
 
-def sqlQuery(query: str) -> pd.DataFrame:
-    """Execute a SQL query and return the result as a pandas DataFrame."""
-    cfg = Config()  # Pull environment variables for auth
-    with sql.connect(
-        server_hostname=cfg.host,
-        http_path=f"/sql/1.0/warehouses/{os.getenv('DATABRICKS_WAREHOUSE_ID')}",
-        credentials_provider=lambda: cfg.authenticate
-    ) as connection:
-        with connection.cursor() as cursor:
-            cursor.execute(query)
-            return cursor.fetchall_arrow().to_pandas()
-
 # Initialize the Dash app with Bootstrap styling
 app = dash.Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP], suppress_callback_exceptions=True)
 
-# Create tabs
-project_tab, project_store = create_project_tab()
-eol_tab = create_eol_tab()
-# Feature lookups tab
-feature_lookup_tab, feature_lookup_store = create_feature_lookup_tab()
-mlops_tab = create_mlops_tab()
+# The layout, built once by the first page load (see serve_layout)
+_layout = None
+_layout_lock = threading.Lock()
 
-# Define the app layout
-app.layout = dbc.Container([
-    html.Div(id='dummy-trigger', style={'display': 'none'}),
-    dbc.Row([dbc.Col(html.H1("MLops Dashboard"), width=12)]),
+def build_layout():
+    """Build the app layout (runs the warehouse queries and MLflow fetches behind the tabs)."""
+    # Create tabs
+    project_tab, project_store = create_project_tab()
+    eol_tab = create_eol_tab()
+    # Feature lookups tab
+    feature_lookup_tab, feature_lookup_store = create_feature_lookup_tab()
+    mlops_tab = create_mlops_tab()
     
-    # Store components
-    project_store,
-    feature_lookup_store,
+    return dbc.Container([
+        html.Div(id='dummy-trigger', style={'display': 'none'}),
+        dbc.Row([dbc.Col(html.H1("MLops Dashboard"), width=12)]),
+        
+        # Store components
+        project_store,
+        feature_lookup_store,
+        
+        # Tabs
+        dbc.Tabs([
+            project_tab,
+            eol_tab,
+            feature_lookup_tab,
+            mlops_tab
+        ],
+        id="tabs",
+        active_tab="tab-project"
+        )
+    ], fluid=True)
+
+def serve_layout():
+    """The app layout, built on the first page load and reused afterwards.
     
-    # Tabs
-    dbc.Tabs([
-        project_tab,
-        eol_tab,
-        feature_lookup_tab,
-        mlops_tab
-    ],
-    id="tabs",
-    active_tab="tab-project"
-    )
-], fluid=True)
+    Building it at import would slow down startup, and rebuilding it on every
+    page load would repeat the queries behind the tabs; the grids refresh
+    their data through their own callbacks.
+    """
+    global _layout
+    with _layout_lock:
+        if _layout is None:
+            _layout = build_layout()
+        return _layout
+
+# Define the app layout
+app.layout = serve_layout
 
 
 register_new_project_callbacks(app)
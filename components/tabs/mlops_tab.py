@@ -1,9 +1,29 @@
 import pandas as pd
-from dash import html, dcc, Input, Output
+from dash import html, dcc, Input, Output, State, ctx
 import dash_bootstrap_components as dbc
 import dash_ag_grid as dag
-from databricks.sdk import WorkspaceClient
-from mlflow_service import mlflow_workspace_service as mlflow_service
+import plotly.graph_objects as go
+from mlflow_service import (
+    mlflow_workspace_service as mlflow_service,
+    DEFAULT_EXPERIMENT_NAME,
+    LOGGED_MODEL_STANDARD_COLUMNS,
+    concat_experiment_frames,
+    project_columns,
+    RUN_SNAPSHOT_MAX_AGE,
+    LOGGED_MODELS_MAX_AGE
+)
+from jobs_service import jobs_service, JOBS_MAX_AGE, RUN_STATUS_MAX_AGE
+from utils.concurrency import map_concurrently
+from utils.offload import records
+
+# Metric columns shown in a grid until the user picks columns for the experiment
+DEFAULT_PICKED_COLUMNS = 5
+
+# Child runs listed for the sweep clicked in the sweeps grid
+SWEEP_CHILDREN_LIMIT = 1000
+
+# How often the workspace-unreachable banner is re-checked (milliseconds)
+DEGRADED_CHECK_INTERVAL = 15_000
 
 def create_logged_models_column_defs(columns):
     """Create column definitions for logged models with special handling for metrics and parameters."""
@@ -11,7 +31,7 @@ def create_logged_models_column_defs(columns):
     
     # Sort columns to maintain dataset grouping
     # Standard columns first, then dataset-specific metrics grouped by dataset, then general metrics, then parameters
-    standard_columns = ['model_id', 'model_name', 'creation_timestamp', 'last_updated_timestamp', 'user_id', 'description']
+    standard_columns = ['experiment_name', 'model_id', 'model_name', 'source_run_id', 'creation_timestamp', 'last_updated_timestamp', 'user_id', 'description']
     param_columns = [col for col in columns if col.startswith('param_')]
     metric_columns = [col for col in columns if col not in standard_columns and not col.startswith('param_')]
     
@@ -88,50 +108,240 @@ def create_logged_models_column_defs(columns):
     
     return column_defs
 
-def get_jobs_data():
-    """Fetch all jobs from Databricks workspace."""
-    try:
-        wc = WorkspaceClient()
-        jobs = list(wc.jobs.list())
-        
-        jobs_data = []
-        for job in jobs:
-            job_info = {
-                'job_id': job.job_id,
-                'job_name': job.settings.name if job.settings and job.settings.name else 'Unnamed Job',
-                'created_time': pd.to_datetime(job.created_time / 1000, unit='s') if job.created_time else None,
-                'creator_user_name': job.creator_user_name,
-                'run_as_user_name': job.settings.run_as.user_name if job.settings and job.settings.run_as else None,
-                'max_concurrent_runs': job.settings.max_concurrent_runs if job.settings else None,
-                'timeout_seconds': job.settings.timeout_seconds if job.settings else None,
-                'schedule': job.settings.schedule.quartz_cron_expression if job.settings and job.settings.schedule else None,
-                'email_notifications': bool(job.settings.email_notifications) if job.settings else False,
-                'webhook_notifications': bool(job.settings.webhook_notifications) if job.settings else False,
-                'continuous': job.settings.continuous.enabled if job.settings and job.settings.continuous else False,
-                'tags': str(job.settings.tags) if job.settings and job.settings.tags else None
-            }
-            jobs_data.append(job_info)
-        
-        return pd.DataFrame(jobs_data)
-    except Exception as e:
-        print(f"Error fetching jobs: {str(e)}")
-        return pd.DataFrame()
+def metric_history_options(run_columns):
+    """Dropdown options for the metric history plot, from the metric_ column names of a runs frame."""
+    return [{'label': col.replace('metric_', '', 1), 'value': col.replace('metric_', '', 1)}
+            for col in run_columns if col.startswith('metric_')]
+
+def create_metric_history_figure(history_df, run_names=None):
+    """Line chart of per-step metric values, one WebGL trace per run."""
+    figure = go.Figure()
+    run_names = run_names or {}
+    for run_id, series in history_df.groupby('run_id', sort=False):
+        figure.add_trace(go.Scattergl(
+            x=series['step'],
+            y=series['value'],
+            mode='lines',
+            name=run_names.get(run_id, run_id)
+        ))
+    figure.update_layout(xaxis_title='Step', yaxis_title='Value', margin={'t': 30})
+    return figure
+
+def leaderboard_options(source, experiment_names):
+    """(metric options, group-by options) for the leaderboard, from the cached runs or logged models."""
+    if source == 'models':
+        experiment_name = experiment_names[0] if len(experiment_names) == 1 else experiment_names
+        df = mlflow_service.get_logged_models(experiment_name)
+        metrics = [col for col in df.columns
+                   if col not in LOGGED_MODEL_STANDARD_COLUMNS and col != 'experiment_name' and not col.startswith('param_')]
+        groups = [col for col in ['experiment_name', 'user_id'] if col in df.columns]
+    else:
+        df = get_experiment_runs(experiment_names)
+        metrics = mlflow_service.get_metrics_columns(df)
+        groups = [col for col in ['experiment_name', 'status'] if col in df.columns]
+    groups += mlflow_service.get_parameters_columns(df)
+    return [{'label': col, 'value': col} for col in metrics], [{'label': col, 'value': col} for col in groups]
+
+def grid_column_defs(df):
+    return [{"headerName": col.replace('_', ' ').title(), "field": col} for col in df.columns] if not df.empty else []
+
+def create_pareto_figure(front_df, x_metric, y_metric):
+    """Scatter of the Pareto front of two metrics, joined in order of the first."""
+    figure = go.Figure()
+    if not front_df.empty:
+        label_column = 'run_name' if 'run_name' in front_df.columns else 'model_name'
+        figure.add_trace(go.Scatter(
+            x=front_df[x_metric],
+            y=front_df[y_metric],
+            mode='lines+markers',
+            line={'shape': 'hv'},
+            text=front_df[label_column] if label_column in front_df.columns else None,
+            name='Pareto front'
+        ))
+    figure.update_layout(xaxis_title=x_metric, yaxis_title=y_metric, margin={'t': 30})
+    return figure
+
+def get_jobs_data(max_age=JOBS_MAX_AGE):
+    """Summaries of all jobs in the workspace with their latest run status (cached; pass max_age=0 to re-fetch)."""
+    return jobs_service.get_jobs_with_status(max_age, status_max_age=min(max_age, RUN_STATUS_MAX_AGE))
+
+def jobs_column_defs(jobs_df):
+    """Jobs grid columns: every summary and run status column except the internal settings digest."""
+    headers = {
+        'last_duration': "Last Duration (s)",
+        'runs': "Runs (30d)",
+        'p50_duration': "P50 Duration (s)",
+        'p95_duration': "P95 Duration (s)",
+        'duration_trend': "Duration Trend (7d vs rest)",
+        'failure_rate_trend': "Failure Rate Trend (7d vs rest)"
+    }
+    return [{"headerName": headers.get(col, col.replace('_', ' ').title()), "field": col}
+            for col in jobs_df.columns if col != 'settings_version']
+
+def get_experiment_runs(experiment_names, max_age=RUN_SNAPSHOT_MAX_AGE, columns=None):
+    """Runs of the selected experiments; several experiments are fetched concurrently."""
+    if len(experiment_names) == 1:
+        return mlflow_service.get_runs(experiment_names[0], max_age=max_age, columns=columns)
+    return mlflow_service.get_runs_for_experiments(experiment_names, max_age=max_age, columns=columns)
+
+def runs_grid_frame(runs_df, columns=()):
+    """What the runs grid shows: the summary columns plus the picked ones; the rest loads per run on click."""
+    return project_columns(runs_df, ['experiment_name', *columns])
+
+def discover_columns(source, experiment_names):
+    """Metric and param_ columns that can be picked for the runs or logged models grid of these experiments."""
+    discover = mlflow_service.discover_logged_model_columns if source == 'models' else mlflow_service.discover_run_columns
+    columns = {}
+    for experiment_columns in map_concurrently(discover, experiment_names):
+        columns.update(dict.fromkeys(experiment_columns))
+    return list(columns)
+
+def default_columns(columns):
+    """The first few metric columns, shown until the user picks their own."""
+    return [col for col in columns if not col.startswith('param_')][:DEFAULT_PICKED_COLUMNS]
+
+def column_selection_key(experiment_names):
+    """Key of an experiment selection in the per-session column store."""
+    return '|'.join(sorted(experiment_names))
+
+def create_run_detail(details):
+    """Params, metrics and tags of one run as three small tables."""
+    if details is None:
+        return dbc.Alert("Could not load the run details.", color='warning')
+    
+    def table(title, df):
+        body = dbc.Table.from_dataframe(df, size='sm', striped=True, bordered=False) if not df.empty else html.P("None")
+        return dbc.Col([html.H6(f"{title} ({len(df)})"), html.Div(body, style={'maxHeight': '300px', 'overflowY': 'auto'})], width=4)
+    
+    return html.Div([
+        html.H5(f"Run: {details['run_name'] or details['run_id']} ({details['status']})"),
+        dbc.Row([
+            table("Parameters", details['params'].sort_values('key')),
+            table("Metrics", details['metrics'].sort_values('key')),
+            table("Tags", details['tags'].sort_values('key'))
+        ])
+    ])
+
+def get_sweeps(experiment_names, metric=None):
+    """One row per parent run of the selected experiments, with its children rolled up."""
+    frames = []
+    for name in experiment_names:
+        hierarchy = mlflow_service.get_run_hierarchy(name)
+        frames.append(hierarchy.parents_frame(mlflow_service.get_runs(name), metric) if hierarchy is not None else None)
+    if len(experiment_names) == 1:
+        return frames[0] if frames[0] is not None else pd.DataFrame()
+    return concat_experiment_frames(experiment_names, frames)
+
+def get_sweep_children(experiment_names, parent_run_id, metric=None):
+    """Child runs of one parent, best first by metric (lower is better), capped at SWEEP_CHILDREN_LIMIT."""
+    for name in experiment_names:
+        hierarchy = mlflow_service.get_run_hierarchy(name)
+        if hierarchy is None or parent_run_id not in hierarchy.aggregates.index:
+            continue
+        children = hierarchy.children_of(parent_run_id)
+        if metric in children.columns:
+            children = children.sort_values(metric, na_position='last')
+        return project_columns(children, [metric] if metric else []).head(SWEEP_CHILDREN_LIMIT)
+    return pd.DataFrame()
+
+def create_model_source_run(link):
+    """The run that produced a logged model, with its params, from the run/model linkage."""
+    if link is None:
+        return html.P("No source run found for this model.", className='text-muted')
+    run_columns = {col: value for col, value in link.items() if col.startswith('run_') and not col.startswith('run_param_')}
+    params = pd.DataFrame({
+        'key': [col.replace('run_param_', '', 1) for col in link.index if col.startswith('run_param_')],
+        'value': [link[col] for col in link.index if col.startswith('run_param_')]
+    }).dropna()
+    return html.Div([
+        html.H5(f"Model {link['model_name']} was logged by run {run_columns.get('run_name') or link['source_run_id']}"),
+        html.P(f"Run ID: {link['source_run_id']} | Status: {run_columns.get('run_status')} | Started: {run_columns.get('run_start_time')}"),
+        dbc.Table.from_dataframe(params, size='sm', striped=True) if not params.empty else html.P("No parameters")
+    ])
+
+def create_job_detail(details):
+    """Settings, notifications and tasks of one job as three small tables."""
+    if details is None:
+        return dbc.Alert("Could not load the job details.", color='warning')
+    
+    def table(title, df, width):
+        body = dbc.Table.from_dataframe(df, size='sm', striped=True, bordered=False) if not df.empty else html.P("None")
+        return dbc.Col([html.H6(f"{title} ({len(df)})"), html.Div(body, style={'maxHeight': '300px', 'overflowY': 'auto'})], width=width)
+    
+    return html.Div([
+        html.H5(f"Job: {details['job_name']} ({details['job_id']})"),
+        dbc.Row([
+            table("Settings", details['settings'].dropna(), 4),
+            table("Notifications", details['notifications'], 3),
+            table("Tasks", details['tasks'], 5)
+        ])
+    ])
+
+def experiments_title(experiment_names):
+    if len(experiment_names) == 1:
+        return f"Experiment: {experiment_names[0]}"
+    return f"Experiments: {len(experiment_names)} selected"
 
 def create_mlops_tab():
     """Create the MLOps tab layout."""
-    # Fetch initial data
-    mlflow_runs = mlflow_service.get_runs()
-    logged_models = mlflow_service.get_logged_models()
+    # Fetch initial data (the summary is computed from the same run snapshot)
+    # Only the default picked columns are materialized for the grids
+    run_columns = mlflow_service.discover_run_columns()
+    model_columns = mlflow_service.discover_logged_model_columns()
+    mlflow_runs = mlflow_service.get_runs(columns=default_columns(run_columns))
+    runs_summary = mlflow_service.get_experiment_summary()
+    logged_models = mlflow_service.get_logged_models(columns=default_columns(model_columns))
+    mlflow_service.watch_experiments([DEFAULT_EXPERIMENT_NAME])
+    jobs_service.watch_job_runs()
     jobs_data = get_jobs_data()
     
     tab = dbc.Tab(
         dbc.Container([
+            # Picked grid columns per experiment selection, kept for the browser session
+            dcc.Store(id='column-selection-store', storage_type='session', data={}),
+            
+            # Persisted snapshots are still served when the workspace cannot be reached (see update_degraded_alert)
+            dbc.Alert(
+                "The Databricks workspace is unreachable. Showing the last saved data (read-only).",
+                id='degraded-alert',
+                color='warning',
+                is_open=False,
+                className='mt-3'
+            ),
+            dcc.Interval(id='degraded-check-interval', interval=DEGRADED_CHECK_INTERVAL),
+            
             # MLflow Runs Section
             dbc.Row([dbc.Col(html.H2("MLflow Experiment Runs"), width=12, className='mt-4')]),
+            dbc.Row([
+                dbc.Col(
+                    dbc.InputGroup([
+                        dbc.Input(id='experiment-prefix-input', placeholder="Experiment path prefix, e.g. /ML/"),
+                        dbc.Button("Find Experiments", id='find-experiments-button', color='secondary')
+                    ]),
+                    width=4
+                ),
+                dbc.Col(
+                    dcc.Dropdown(
+                        id='mlops-experiment-dropdown',
+                        options=[DEFAULT_EXPERIMENT_NAME],
+                        value=[DEFAULT_EXPERIMENT_NAME],
+                        multi=True,
+                        clearable=False
+                    ),
+                    width=8
+                )
+            ], className='mt-2'),
             dbc.Row([
                 dbc.Col([
-                    html.H4(f"Experiment: {mlflow_service.get_experiment_summary()['experiment_name']}"),
-                    html.P(f"Total Runs: {mlflow_service.get_experiment_summary()['total_runs']}"),
+                    html.H4(experiments_title([runs_summary['experiment_name']]), id='runs-experiment-title', className='mt-2'),
+                    html.P(f"Total Runs: {runs_summary['total_runs']}", id='runs-total-text'),
+                    dcc.Dropdown(
+                        id='runs-column-picker',
+                        options=run_columns,
+                        value=default_columns(run_columns),
+                        multi=True,
+                        placeholder="Metric and parameter columns to show"
+                    ),
                     dbc.Button("Refresh Runs", id='refresh-runs-button', color='secondary', className='mt-2')
                 ], width=12)
             ]),
@@ -139,19 +349,126 @@ def create_mlops_tab():
                 dbc.Col([
                     dag.AgGrid(
                         id='mlflow-runs-grid',
-                        columnDefs=[{"headerName": col.replace('_', ' ').title(), "field": col} for col in mlflow_runs.columns] if not mlflow_runs.empty else [],
-                        rowData=mlflow_runs.to_dict('records') if not mlflow_runs.empty else [],
+                        columnDefs=grid_column_defs(mlflow_runs),
+                        rowData=records(mlflow_runs),
                         defaultColDef={"sortable": True, "filter": True, "resizable": True},
+                        dashGridOptions={"rowSelection": "multiple"},
+                        getRowId="params.data.run_id",
                         style={'height': '400px', 'width': '100%'}
                     )
                 ], width=12)
             ]),
             
+            # Details of the run last clicked in the grid above, loaded on demand
+            dbc.Row([
+                dbc.Col(
+                    dcc.Loading(html.Div(html.P("Click a run to see its parameters, metrics and tags.", className='text-muted'),
+                                         id='run-detail-panel', className='mt-3')),
+                    width=12
+                )
+            ]),
+            
+            # Metric history for the runs selected in the grid above
+            dbc.Row([
+                dbc.Col([
+                    html.H4("Metric History", className='mt-3'),
+                    dcc.Dropdown(
+                        id='metric-history-dropdown',
+                        options=metric_history_options(run_columns),
+                        placeholder="Select a metric, then select runs in the grid"
+                    ),
+                    dcc.Graph(id='metric-history-graph', figure=go.Figure())
+                ], width=12)
+            ]),
+            
+            # Sweeps: parent runs rolled up over their children, children listed on click
+            dbc.Row([
+                dbc.Col([
+                    html.H4("Sweeps", className='mt-3'),
+                    dcc.Dropdown(
+                        id='sweep-metric-dropdown',
+                        options=[col for col in run_columns if col.startswith('metric_')],
+                        placeholder="Summarize children by metric"
+                    )
+                ], width=12)
+            ]),
+            dbc.Row([
+                dbc.Col(dag.AgGrid(
+                    id='sweeps-grid',
+                    defaultColDef={"sortable": True, "filter": True, "resizable": True},
+                    getRowId="params.data.run_id",
+                    style={'height': '300px', 'width': '100%'}
+                ), width=6),
+                dbc.Col(dag.AgGrid(
+                    id='sweep-children-grid',
+                    defaultColDef={"sortable": True, "filter": True, "resizable": True},
+                    style={'height': '300px', 'width': '100%'}
+                ), width=6)
+            ], className='mt-2'),
+            
+            # Leaderboard over the cached runs or logged models of the selected experiments
+            dbc.Row([dbc.Col(html.H2("Leaderboard"), width=12, className='mt-4')]),
+            dbc.Row([
+                dbc.Col(dbc.RadioItems(
+                    id='leaderboard-source',
+                    options=[{'label': 'Runs', 'value': 'runs'}, {'label': 'Logged Models', 'value': 'models'}],
+                    value='runs',
+                    inline=True
+                ), width=3),
+                dbc.Col(dcc.Dropdown(id='leaderboard-metric-dropdown', placeholder="Rank by metric"), width=3),
+                dbc.Col(dbc.RadioItems(
+                    id='leaderboard-direction',
+                    options=[{'label': 'Lower is better', 'value': 'min'}, {'label': 'Higher is better', 'value': 'max'}],
+                    value='min',
+                    inline=True
+                ), width=3),
+                dbc.Col(dbc.InputGroup([
+                    dbc.InputGroupText("Top"),
+                    dbc.Input(id='leaderboard-k', type='number', min=1, value=10)
+                ]), width=3)
+            ], className='mt-2'),
+            dbc.Row([
+                dbc.Col(dcc.Dropdown(id='leaderboard-group-dropdown', placeholder="Rank groups by (optional)"), width=4),
+                dbc.Col(dcc.Dropdown(id='leaderboard-pareto-dropdown', placeholder="Pareto front against (optional)"), width=4),
+                dbc.Col(dbc.RadioItems(
+                    id='leaderboard-pareto-direction',
+                    options=[{'label': 'Lower is better', 'value': 'min'}, {'label': 'Higher is better', 'value': 'max'}],
+                    value='min',
+                    inline=True
+                ), width=4)
+            ], className='mt-2'),
+            dbc.Row([
+                dbc.Col([
+                    html.H5("Top K", className='mt-3'),
+                    dag.AgGrid(
+                        id='leaderboard-grid',
+                        defaultColDef={"sortable": True, "filter": True, "resizable": True},
+                        style={'height': '300px', 'width': '100%'}
+                    )
+                ], width=6),
+                dbc.Col([
+                    html.H5("By Group", className='mt-3'),
+                    dag.AgGrid(
+                        id='leaderboard-groups-grid',
+                        defaultColDef={"sortable": True, "filter": True, "resizable": True},
+                        style={'height': '300px', 'width': '100%'}
+                    )
+                ], width=6)
+            ]),
+            dbc.Row([dbc.Col(dcc.Graph(id='leaderboard-pareto-graph', figure=go.Figure()), width=12)]),
+            
             # Logged Models Section
             dbc.Row([dbc.Col(html.H2("Logged Models"), width=12, className='mt-4')]),
             dbc.Row([
                 dbc.Col([
-                    html.H4(f"Total Logged Models: {len(logged_models)}"),
+                    html.H4(f"Total Logged Models: {len(logged_models)}", id='logged-models-total-text'),
+                    dcc.Dropdown(
+                        id='models-column-picker',
+                        options=model_columns,
+                        value=default_columns(model_columns),
+                        multi=True,
+                        placeholder="Metric and parameter columns to show"
+                    ),
                     dbc.Button("Refresh Models", id='refresh-models-button', color='secondary', className='mt-2')
                 ], width=12)
             ]),
@@ -161,13 +478,20 @@ def create_mlops_tab():
                     dag.AgGrid(
                         id='logged-models-grid',
                         columnDefs=create_logged_models_column_defs(logged_models.columns),
-                        rowData=logged_models.to_dict('records') if not logged_models.empty else [],
+                        rowData=records(logged_models),
                         defaultColDef={"sortable": True, "filter": True, "resizable": True},
+                        getRowId="params.data.model_id",
                         style={'height': '400px', 'width': '100%'}
                     )
                 ], width=12)
             ]),
             
+            # Source run of the model last clicked in the grid above
+            dbc.Row([
+                dbc.Col(html.Div(html.P("Click a model to see the run that produced it.", className='text-muted'),
+                                 id='model-source-run-panel', className='mt-3'), width=12)
+            ]),
+            
             # Jobs Section
             dbc.Row([dbc.Col(html.H2("Databricks Jobs"), width=12, className='mt-4')]),
             dbc.Row([
@@ -181,12 +505,19 @@ def create_mlops_tab():
                 dbc.Col([
                     dag.AgGrid(
                         id='jobs-grid',
-                        columnDefs=[{"headerName": col.replace('_', ' ').title(), "field": col} for col in jobs_data.columns] if not jobs_data.empty else [],
-                        rowData=jobs_data.to_dict('records') if not jobs_data.empty else [],
+                        columnDefs=jobs_column_defs(jobs_data),
+                        rowData=records(jobs_data),
                         defaultColDef={"sortable": True, "filter": True, "resizable": True},
+                        getRowId="params.data.job_id",
                         style={'height': '400px', 'width': '100%'}
                     )
                 ], width=12)
+            ]),
+            
+            # Full settings of the job last clicked in the grid above, loaded on demand
+            dbc.Row([
+                dbc.Col(html.Div(html.P("Click a job to see its schedule, notifications and tasks.", className='text-muted'),
+                                 id='job-detail-panel', className='mt-3'), width=12)
             ])
         ], fluid=True),
         label="MLOps",
@@ -197,42 +528,232 @@ def create_mlops_tab():
 
 def register_mlops_callbacks(app):
     """Register all callbacks for the MLOps tab."""
-    
+
+    @app.callback(
+        Output('degraded-alert', 'is_open'),
+        Input('degraded-check-interval', 'n_intervals')
+    )
+    def update_degraded_alert(n_intervals):
+        """Show the banner while either service serves persisted data."""
+        return mlflow_service.is_degraded() or jobs_service.degraded
+
+    @app.callback(
+        Output('mlops-experiment-dropdown', 'options'),
+        Input('find-experiments-button', 'n_clicks'),
+        [State('experiment-prefix-input', 'value'),
+         State('mlops-experiment-dropdown', 'value')],
+        prevent_initial_call=True
+    )
+    def find_experiments(n_clicks, prefix, selected):
+        """Offer every experiment under the given path prefix, keeping the current selection."""
+        selected = selected or [DEFAULT_EXPERIMENT_NAME]
+        names = mlflow_service.find_experiments(prefix or '/')
+        # Selected experiments stay in the options, or the dropdown would drop them from its value
+        return sorted(set(names) | set(selected))
+
+    @app.callback(
+        [Output('runs-column-picker', 'options'),
+         Output('runs-column-picker', 'value'),
+         Output('models-column-picker', 'options'),
+         Output('models-column-picker', 'value'),
+         Output('metric-history-dropdown', 'options'),
+         Output('sweep-metric-dropdown', 'options')],
+        Input('mlops-experiment-dropdown', 'value'),
+        State('column-selection-store', 'data')
+    )
+    def load_column_pickers(experiment_names, selections):
+        """Offer the columns of the selected experiments and restore this session's picks."""
+        experiment_names = experiment_names or [DEFAULT_EXPERIMENT_NAME]
+        key = column_selection_key(experiment_names)
+        selections = selections or {}
+        run_columns = discover_columns('runs', experiment_names)
+        model_columns = discover_columns('models', experiment_names)
+        picked_runs = selections.get('runs', {}).get(key, default_columns(run_columns))
+        picked_models = selections.get('models', {}).get(key, default_columns(model_columns))
+        return (run_columns, picked_runs, model_columns, picked_models, metric_history_options(run_columns),
+                [col for col in run_columns if col.startswith('metric_')])
+
+    @app.callback(
+        Output('column-selection-store', 'data'),
+        [Input('runs-column-picker', 'value'),
+         Input('models-column-picker', 'value')],
+        [State('mlops-experiment-dropdown', 'value'),
+         State('column-selection-store', 'data')],
+        prevent_initial_call=True
+    )
+    def save_column_selection(run_columns, model_columns, experiment_names, selections):
+        """Remember the picked columns for this experiment selection."""
+        key = column_selection_key(experiment_names or [DEFAULT_EXPERIMENT_NAME])
+        selections = selections or {}
+        selections.setdefault('runs', {})[key] = run_columns or []
+        selections.setdefault('models', {})[key] = model_columns or []
+        return selections
+
     @app.callback(
         [Output('mlflow-runs-grid', 'columnDefs'),
-         Output('mlflow-runs-grid', 'rowData')],
-        Input('refresh-runs-button', 'n_clicks')
+         Output('mlflow-runs-grid', 'rowData'),
+         Output('runs-experiment-title', 'children'),
+         Output('runs-total-text', 'children')],
+        [Input('refresh-runs-button', 'n_clicks'),
+         Input('runs-column-picker', 'value')],
+        State('mlops-experiment-dropdown', 'value')
     )
-    def refresh_mlflow_runs(n_clicks):
+    def refresh_mlflow_runs(n_clicks, columns, experiment_names):
         """Refresh MLflow runs data."""
-        mlflow_runs = mlflow_service.get_runs()
+        experiment_names = experiment_names or [DEFAULT_EXPERIMENT_NAME]
+        mlflow_service.watch_experiments(experiment_names)
         
-        if not mlflow_runs.empty:
-            column_defs = [{"headerName": col.replace('_', ' ').title(), "field": col} for col in mlflow_runs.columns]
-            row_data = mlflow_runs.to_dict('records')
-        else:
-            column_defs = []
-            row_data = []
+        # Switching experiments reuses their snapshots; clicks force an incremental sync
+        max_age = 0 if ctx.triggered_id == 'refresh-runs-button' else RUN_SNAPSHOT_MAX_AGE
         
-        return column_defs, row_data
+        # Only the summary and picked columns are sent to the browser; the rest loads per run
+        columns = columns or []
+        mlflow_runs = runs_grid_frame(get_experiment_runs(experiment_names, max_age=max_age, columns=columns), columns)
+        column_defs = grid_column_defs(mlflow_runs)
+        row_data = records(mlflow_runs)
+        
+        return column_defs, row_data, experiments_title(experiment_names), f"Total Runs: {len(mlflow_runs)}"
+
+    @app.callback(
+        Output('run-detail-panel', 'children'),
+        Input('mlflow-runs-grid', 'cellClicked'),
+        prevent_initial_call=True
+    )
+    def show_run_detail(cell):
+        """Load (or reuse the cached) params, metrics and tags of the clicked run."""
+        if not cell or not cell.get('rowId'):
+            return html.P("Click a run to see its parameters, metrics and tags.", className='text-muted')
+        return create_run_detail(mlflow_service.get_run_details(cell['rowId']))
+
+    @app.callback(
+        [Output('sweeps-grid', 'columnDefs'),
+         Output('sweeps-grid', 'rowData')],
+        [Input('sweep-metric-dropdown', 'value'),
+         Input('mlflow-runs-grid', 'rowData')],
+        State('mlops-experiment-dropdown', 'value')
+    )
+    def refresh_sweeps(metric, _row_data, experiment_names):
+        """Roll up child runs per parent whenever the runs grid is refreshed."""
+        sweeps = get_sweeps(experiment_names or [DEFAULT_EXPERIMENT_NAME], metric)
+        return grid_column_defs(sweeps), records(sweeps)
+
+    @app.callback(
+        [Output('sweep-children-grid', 'columnDefs'),
+         Output('sweep-children-grid', 'rowData')],
+        Input('sweeps-grid', 'cellClicked'),
+        [State('sweep-metric-dropdown', 'value'),
+         State('mlops-experiment-dropdown', 'value')],
+        prevent_initial_call=True
+    )
+    def show_sweep_children(cell, metric, experiment_names):
+        """List the children of the clicked parent run."""
+        if not cell or not cell.get('rowId'):
+            return [], []
+        children = get_sweep_children(experiment_names or [DEFAULT_EXPERIMENT_NAME], cell['rowId'], metric)
+        return grid_column_defs(children), records(children)
+
+    @app.callback(
+        Output('metric-history-graph', 'figure'),
+        [Input('mlflow-runs-grid', 'selectedRows'),
+         Input('metric-history-dropdown', 'value')]
+    )
+    def update_metric_history(selected_rows, metric_name):
+        """Plot the downsampled per-step history of a metric for the selected runs."""
+        if not selected_rows or not metric_name:
+            return go.Figure()
+        
+        run_names = {row['run_id']: row.get('run_name') or row['run_id'] for row in selected_rows}
+        history = mlflow_service.get_metric_history(list(run_names), [metric_name])
+        return create_metric_history_figure(history, run_names)
 
     @app.callback(
         [Output('logged-models-grid', 'columnDefs'),
-         Output('logged-models-grid', 'rowData')],
-        Input('refresh-models-button', 'n_clicks')
+         Output('logged-models-grid', 'rowData'),
+         Output('logged-models-total-text', 'children')],
+        [Input('refresh-models-button', 'n_clicks'),
+         Input('models-column-picker', 'value')],
+        State('mlops-experiment-dropdown', 'value')
     )
-    def refresh_logged_models(n_clicks):
+    def refresh_logged_models(n_clicks, columns, experiment_names):
         """Refresh logged models data."""
-        logged_models = mlflow_service.get_logged_models()
+        experiment_names = experiment_names or [DEFAULT_EXPERIMENT_NAME]
+        max_age = 0 if ctx.triggered_id == 'refresh-models-button' else LOGGED_MODELS_MAX_AGE
+        experiment_name = experiment_names[0] if len(experiment_names) == 1 else experiment_names
+        logged_models = mlflow_service.get_logged_models(experiment_name, columns=columns or [], max_age=max_age)
         
         if not logged_models.empty:
             column_defs = create_logged_models_column_defs(logged_models.columns)
-            row_data = logged_models.to_dict('records')
+            row_data = records(logged_models)
         else:
             column_defs = []
             row_data = []
         
-        return column_defs, row_data
+        return column_defs, row_data, f"Total Logged Models: {len(logged_models)}"
+
+    @app.callback(
+        [Output('leaderboard-metric-dropdown', 'options'),
+         Output('leaderboard-group-dropdown', 'options'),
+         Output('leaderboard-pareto-dropdown', 'options')],
+        [Input('leaderboard-source', 'value'),
+         Input('mlops-experiment-dropdown', 'value')]
+    )
+    def update_leaderboard_options(source, experiment_names):
+        """Offer the metrics and group-by columns of the selected source."""
+        metric_options, group_options = leaderboard_options(source, experiment_names or [DEFAULT_EXPERIMENT_NAME])
+        return metric_options, group_options, metric_options
+
+    @app.callback(
+        [Output('leaderboard-grid', 'columnDefs'),
+         Output('leaderboard-grid', 'rowData'),
+         Output('leaderboard-groups-grid', 'columnDefs'),
+         Output('leaderboard-groups-grid', 'rowData'),
+         Output('leaderboard-pareto-graph', 'figure')],
+        [Input('leaderboard-metric-dropdown', 'value'),
+         Input('leaderboard-direction', 'value'),
+         Input('leaderboard-k', 'value'),
+         Input('leaderboard-group-dropdown', 'value'),
+         Input('leaderboard-pareto-dropdown', 'value'),
+         Input('leaderboard-pareto-direction', 'value')],
+        [State('leaderboard-source', 'value'),
+         State('mlops-experiment-dropdown', 'value')]
+    )
+    def update_leaderboard(metric, direction, k, group_by, pareto_metric, pareto_direction, source, experiment_names):
+        """Rank the selected source by a metric, optionally per group and against a second metric."""
+        if not metric:
+            return [], [], [], [], go.Figure()
+        
+        experiment_names = experiment_names or [DEFAULT_EXPERIMENT_NAME]
+        pareto_metrics = [metric, pareto_metric] if pareto_metric and pareto_metric != metric else None
+        board = mlflow_service.get_leaderboard(
+            metric,
+            experiment_name=experiment_names[0] if len(experiment_names) == 1 else experiment_names,
+            source=source,
+            k=int(k or 10),
+            higher_is_better=direction == 'max',
+            pareto_metrics=pareto_metrics,
+            pareto_higher_is_better=[direction == 'max', pareto_direction == 'max'],
+            group_by=group_by
+        )
+        
+        top, groups = board['top'], board['groups']
+        figure = create_pareto_figure(board['pareto'], metric, pareto_metric) if pareto_metrics else go.Figure()
+        return grid_column_defs(top), records(top), grid_column_defs(groups), records(groups), figure
+
+    @app.callback(
+        Output('model-source-run-panel', 'children'),
+        Input('logged-models-grid', 'cellClicked'),
+        State('mlops-experiment-dropdown', 'value'),
+        prevent_initial_call=True
+    )
+    def show_model_source_run(cell, experiment_names):
+        """Look up the clicked model's source run in the run/model linkage."""
+        if not cell or not cell.get('rowId'):
+            return html.P("Click a model to see the run that produced it.", className='text-muted')
+        for experiment_name in experiment_names or [DEFAULT_EXPERIMENT_NAME]:
+            link = mlflow_service.get_model_source_run(cell['rowId'], experiment_name)
+            if link is not None:
+                return create_model_source_run(link)
+        return create_model_source_run(None)
 
     @app.callback(
         [Output('jobs-grid', 'columnDefs'),
@@ -241,13 +762,24 @@ def register_mlops_callbacks(app):
     )
     def refresh_jobs(n_clicks):
         """Refresh jobs data."""
-        jobs_data = get_jobs_data()
+        jobs_data = get_jobs_data(max_age=0 if n_clicks else JOBS_MAX_AGE)
         
         if not jobs_data.empty:
-            column_defs = [{"headerName": col.replace('_', ' ').title(), "field": col} for col in jobs_data.columns]
-            row_data = jobs_data.to_dict('records')
+            column_defs = jobs_column_defs(jobs_data)
+            row_data = records(jobs_data)
         else:
             column_defs = []
             row_data = []
         
-        return column_defs, row_data 
\ No newline at end of file
+        return column_defs, row_data
+
+    @app.callback(
+        Output('job-detail-panel', 'children'),
+        Input('jobs-grid', 'cellClicked'),
+        prevent_initial_call=True
+    )
+    def show_job_detail(cell):
+        """Load the clicked job's full settings (cached per job until its listed settings change)."""
+        if not cell or cell.get('rowId') is None:
+            return html.P("Click a job to see its schedule, notifications and tasks.", className='text-muted')
+        return create_job_detail(jobs_service.get_job_details(int(cell['rowId'])))
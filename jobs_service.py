@@ -0,0 +1,477 @@
+import hashlib
+import itertools
+import json
+import threading
+import time
+
+import pandas as pd
+# The Databricks SDK is imported on first use (through utils.workspace_clients), not here.
+from utils.concurrency import map_concurrently, prefetch
+from utils.frame_types import compact_frame
+from utils.job_run_analytics import STATISTICS_COLUMNS, job_run_statistics, merge_job_runs
+from utils.snapshot_store import PersistentFrame, snapshot_store as default_snapshot_store
+from utils.ttl_cache import TTLCache
+
+# Jobs per jobs/list request (the API maximum)
+JOBS_PAGE_SIZE = 100
+
+# How long the jobs list is served before it is re-fetched (seconds)
+JOBS_MAX_AGE = 300
+
+# Columns of the jobs list, decoded straight from the jobs/list JSON; settings_version is not shown
+JOB_SUMMARY_COLUMNS = [
+    'job_id', 'job_name', 'creator_user_name', 'created_time', 'schedule', 'continuous',
+    'max_concurrent_runs', 'tags', 'settings_version'
+]
+
+# Jobs whose full settings are kept for the detail panel
+JOB_DETAIL_CACHE_SIZE = 500
+
+# Details are re-fetched after this long even when the listed settings did not change (seconds)
+JOB_DETAIL_MAX_AGE = 1800
+
+# Keys of the job settings shown in their own tables rather than as key/value rows
+_DETAIL_TABLE_KEYS = ('tasks', 'email_notifications', 'webhook_notifications', 'job_clusters', 'environments')
+
+# Runs per runs/list request (the API maximum)
+JOB_RUNS_PAGE_SIZE = 25
+
+# Up to this many jobs, recent runs are read per job concurrently; beyond it, the run history is used
+RUN_STATUS_PER_JOB_MAX_JOBS = 50
+RUN_STATUS_MAX_WORKERS = 16
+
+# How long run status columns are served before they are re-fetched (seconds)
+RUN_STATUS_MAX_AGE = 60
+
+# Life cycle states of a run that has not finished
+ACTIVE_JOB_RUN_STATES = ('QUEUED', 'PENDING', 'RUNNING', 'BLOCKED', 'WAITING_FOR_RETRY', 'TERMINATING')
+
+# Columns added to the jobs list by get_jobs_with_status
+RUN_STATUS_COLUMNS = ['last_result', 'last_duration', 'last_run_start', 'running_count']
+
+# Job runs kept in the local run history (seconds); the analytics windows must fit in it
+JOB_RUN_HISTORY_RETENTION = 30 * 24 * 3600
+
+# How often the background refresher ingests new job runs (seconds)
+JOB_RUN_HISTORY_REFRESH_INTERVAL = 300
+
+# Each ingest re-reads runs started this long before the watermark, for runs the last scan just missed (ms)
+JOB_RUN_SYNC_OVERLAP_MS = 60_000
+
+
+def settings_version(settings):
+    """Short digest of a job's listed settings.
+
+    The Jobs API has no settings-modified time, so this digest of what
+    jobs/list returns stands in for it: it changes whenever the name,
+    schedule, notifications or other listed settings are edited.
+    """
+    return hashlib.sha1(json.dumps(settings or {}, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def jobs_json_to_frame(jobs):
+    """Job summaries from jobs/list JSON, decoding only the JOB_SUMMARY_COLUMNS fields."""
+    columns = {column: [] for column in JOB_SUMMARY_COLUMNS}
+    for job in jobs:
+        settings = job.get('settings') or {}
+        tags = settings.get('tags')
+        columns['job_id'].append(job.get('job_id'))
+        columns['job_name'].append(settings.get('name') or 'Unnamed Job')
+        columns['creator_user_name'].append(job.get('creator_user_name'))
+        columns['created_time'].append(job.get('created_time'))
+        columns['schedule'].append((settings.get('schedule') or {}).get('quartz_cron_expression'))
+        columns['continuous'].append('continuous' in settings)
+        columns['max_concurrent_runs'].append(settings.get('max_concurrent_runs'))
+        columns['tags'].append(str(tags) if tags else None)
+        columns['settings_version'].append(settings_version(settings))
+    df = pd.DataFrame(columns)
+    df['created_time'] = pd.to_datetime(df['created_time'], unit='ms')
+    return compact_frame(df)
+
+
+def job_details_from_job(job):
+    """Full settings of one Job as small DataFrames: settings (key/value), notifications and tasks."""
+    settings = job.settings.as_dict() if job.settings else {}
+    rows = [('run_as_user_name', job.run_as_user_name)]
+    for key, value in sorted(settings.items()):
+        if key not in _DETAIL_TABLE_KEYS:
+            rows.append((key, json.dumps(value) if isinstance(value, (dict, list)) else value))
+
+    notifications = []
+    for kind in ('email_notifications', 'webhook_notifications'):
+        for event, targets in sorted((settings.get(kind) or {}).items()):
+            if isinstance(targets, list):
+                for target in targets:
+                    notifications.append((kind.split('_')[0], event, target.get('id') if isinstance(target, dict) else target))
+
+    tasks = []
+    for task in settings.get('tasks', []):
+        tasks.append({
+            'task_key': task.get('task_key'),
+            'type': next((key for key in task if key.endswith('_task')), None),
+            'depends_on': ', '.join(dependency['task_key'] for dependency in task.get('depends_on', [])),
+            'compute': (task.get('existing_cluster_id') or task.get('job_cluster_key') or task.get('environment_key')
+                        or ('new cluster' if 'new_cluster' in task else None)),
+            'timeout_seconds': task.get('timeout_seconds')
+        })
+
+    return {
+        'job_id': job.job_id,
+        'job_name': settings.get('name') or 'Unnamed Job',
+        'settings': pd.DataFrame(rows, columns=['key', 'value']),
+        'notifications': pd.DataFrame(notifications, columns=['kind', 'event', 'destination']),
+        'tasks': pd.DataFrame(tasks, columns=['task_key', 'type', 'depends_on', 'compute', 'timeout_seconds'])
+    }
+
+
+def job_runs_json_to_frame(runs):
+    """One row per run from runs/list JSON: ids, times, duration in seconds and state."""
+    columns = {column: [] for column in
+               ['job_id', 'run_id', 'start_time', 'end_time', 'duration', 'life_cycle_state', 'result_state']}
+    for run in runs:
+        state = run.get('state') or {}
+        start_time, end_time = run.get('start_time') or None, run.get('end_time') or None
+        # Multi-task runs report run_duration; single-task runs split it into phases
+        duration = run.get('run_duration') or (
+            sum(run.get(phase) or 0 for phase in ('setup_duration', 'execution_duration', 'cleanup_duration')) or None)
+        if duration is None and start_time and end_time:
+            duration = end_time - start_time
+        columns['job_id'].append(run.get('job_id'))
+        columns['run_id'].append(run.get('run_id'))
+        columns['start_time'].append(start_time)
+        columns['end_time'].append(end_time)
+        columns['duration'].append(duration / 1000 if duration else None)
+        columns['life_cycle_state'].append(state.get('life_cycle_state'))
+        columns['result_state'].append(state.get('result_state'))
+    df = pd.DataFrame(columns)
+    df['duration'] = pd.to_numeric(df['duration'])
+    for column in ('start_time', 'end_time'):
+        df[column] = pd.to_datetime(pd.to_numeric(df[column]), unit='ms')
+    return df
+
+
+def latest_run_status(runs_df):
+    """Per-job run status, indexed by job_id: RUN_STATUS_COLUMNS from the latest run and the active count.
+
+    last_result is the latest run's result state, or its life cycle state
+    while it has not finished; last_duration is that of the latest finished run.
+    """
+    if runs_df.empty:
+        return pd.DataFrame(columns=RUN_STATUS_COLUMNS, index=pd.Index([], name='job_id'))
+    runs = runs_df.drop_duplicates('run_id').sort_values('start_time', ascending=False, kind='stable')
+    # head(1) rather than first(), which would fill each column from any run where it is not null
+    latest = runs.groupby('job_id', sort=False).head(1).set_index('job_id')
+    finished = runs[runs['end_time'].notna()]
+    status = pd.DataFrame({
+        # Plain objects: compacted histories hold both as categoricals with different categories
+        'last_result': latest['result_state'].astype(object).fillna(latest['life_cycle_state'].astype(object)),
+        'last_duration': finished.groupby('job_id', sort=False).head(1).set_index('job_id')['duration'],
+        'last_run_start': latest['start_time']
+    })
+    active = runs[runs['life_cycle_state'].isin(ACTIVE_JOB_RUN_STATES)]
+    status['running_count'] = active.groupby('job_id').size().reindex(status.index, fill_value=0)
+    return status
+
+
+class JobRunHistory:
+    """Runs of every job over the last JOB_RUN_HISTORY_RETENTION, ingested incrementally and kept as Parquet.
+
+    Each ingest() reads the runs started since a watermark with one
+    workspace-wide runs/list scan and upserts them by run_id. The
+    watermark is the start time of the newest run, less an overlap. Runs
+    the history holds as unfinished are tracked apart from it: while any
+    are open, the active runs are listed (active_only) and those no longer
+    active are read with get_run, so a long-running job does not hold the
+    watermark back. Statistics (see utils.job_run_analytics) and the latest run status
+    of every job are recomputed after every ingest and on load.
+    """
+
+    def __init__(self, iter_run_pages, get_run, store, key='job_run_history'):
+        self.iter_run_pages = iter_run_pages
+        self.get_run = get_run
+        self.store = store
+        self.key = key
+        self.runs = None
+        self.statistics = None
+        self.run_status = None
+        self.watermark = None  # epoch ms
+        self.fetched_at = None
+        self.degraded = False
+        self._lock = threading.Lock()
+        self._ingest_lock = threading.Lock()
+        self._disk_checked = False
+
+    def _load_from_disk(self):
+        with self._lock:
+            if self._disk_checked:
+                return
+            self._disk_checked = True
+        loaded = self.store.load(self.key)
+        if loaded is None:
+            return
+        runs, metadata = loaded
+        statistics, run_status = job_run_statistics(runs), latest_run_status(runs)
+        with self._lock:
+            if self.runs is None:
+                self.runs, self.statistics, self.run_status = runs, statistics, run_status
+                self.watermark = metadata.get('watermark')
+                self.fetched_at = metadata.get('fetched_at')
+
+    def _next_watermark(self, runs):
+        if runs.empty:
+            return self.watermark
+        return int(runs['start_time'].max().value // 1_000_000) - JOB_RUN_SYNC_OVERLAP_MS
+
+    def _open_run_ids(self):
+        runs = self.runs
+        if runs is None or runs.empty:
+            return set()
+        return set(runs.loc[runs['life_cycle_state'].astype(object).isin(ACTIVE_JOB_RUN_STATES), 'run_id'].tolist())
+
+    def _read_open_runs(self, open_run_ids):
+        """Current JSON of runs the history holds as unfinished, and the run_ids of those that no longer exist."""
+        active = [run for page in prefetch(self.iter_run_pages(active_only=True)) for run in page]
+        ended = sorted(open_run_ids - {run.get('run_id') for run in active})
+        ended_runs = map_concurrently(self.get_run, ended, max_workers=RUN_STATUS_MAX_WORKERS)
+        gone = {run_id for run_id, run in zip(ended, ended_runs) if run is None}
+        return active + [run for run in ended_runs if run is not None], gone
+
+    def ingest(self, max_age=None):
+        """Read runs changed since the watermark into the history. Returns the statistics, or None on failure.
+
+        With max_age, an ingest finished less than max_age seconds ago is
+        reused instead of reading again.
+        """
+        self._load_from_disk()
+        with self._ingest_lock:
+            started_at = time.time()
+            if max_age is not None and self.fetched_at is not None and started_at - self.fetched_at < max_age \
+                    and not self.degraded:
+                return self.statistics
+            retention_start = int((started_at - JOB_RUN_HISTORY_RETENTION) * 1000)
+            since = max(self.watermark or retention_start, retention_start)
+            try:
+                changed = [run for page in prefetch(self.iter_run_pages(start_time_from=since)) for run in page]
+                gone = set()
+                open_run_ids = self._open_run_ids() - {run.get('run_id') for run in changed}
+                if open_run_ids:
+                    reread, gone = self._read_open_runs(open_run_ids)
+                    changed += reread
+            except Exception as e:
+                print(f"Error ingesting job runs: {str(e)}")
+                self.degraded = self.runs is not None
+                return None
+            runs = merge_job_runs(self.runs, job_runs_json_to_frame(changed),
+                                  since=pd.to_datetime(retention_start, unit='ms'))
+            if gone:
+                runs = runs[~runs['run_id'].isin(list(gone))].reset_index(drop=True)
+            runs = compact_frame(runs) if not runs.empty else runs
+            statistics, run_status = job_run_statistics(runs), latest_run_status(runs)
+            watermark = self._next_watermark(runs)
+            with self._lock:
+                self.runs, self.statistics, self.run_status = runs, statistics, run_status
+                self.watermark, self.fetched_at, self.degraded = watermark, started_at, False
+            self.store.save_async(self.key, runs, watermark=watermark, fetched_at=started_at)
+            return statistics
+
+    def get_run_status(self):
+        """The latest run status (see latest_run_status), from disk until the first ingest; None if there is none yet."""
+        self._load_from_disk()
+        return self.run_status
+
+    def get_statistics(self):
+        """The latest statistics (indexed by job_id), from disk until the first ingest; empty if there are none yet."""
+        self._load_from_disk()
+        statistics = self.statistics
+        if statistics is None:
+            return pd.DataFrame(columns=STATISTICS_COLUMNS, index=pd.Index([], name='job_id'))
+        return statistics
+
+
+class DatabricksJobsService:
+    """Jobs of the workspace for the MLOps tab.
+
+    The list is read page by page from jobs/list without tasks and only
+    the summary columns are decoded; it is cached in memory and persisted
+    locally like the MLflow snapshots. Full settings are fetched per job
+    with jobs/get when a job is opened and cached until its listed
+    settings change.
+    """
+
+    def __init__(self, snapshot_store=None):
+        self.snapshot_store = snapshot_store if snapshot_store is not None else default_snapshot_store
+        self.jobs_frame = PersistentFrame(self.snapshot_store, 'jobs_summary', self.fetch_jobs, JOBS_MAX_AGE)
+        self._job_details = TTLCache(JOB_DETAIL_CACHE_SIZE, JOB_DETAIL_MAX_AGE)
+        self._lock = threading.Lock()
+        self.run_status_frame = PersistentFrame(self.snapshot_store, 'job_run_status', self.fetch_run_status,
+                                                RUN_STATUS_MAX_AGE)
+        self.run_history = JobRunHistory(self.iter_run_pages, self.get_run, self.snapshot_store)
+        self._run_history_thread = None
+        self._run_history_interval = JOB_RUN_HISTORY_REFRESH_INTERVAL
+
+    @property
+    def workspace_client(self):
+        from utils.workspace_clients import get_workspace_client
+        return get_workspace_client()
+
+    def iter_job_pages(self, page_size=JOBS_PAGE_SIZE):
+        """Yield the raw job JSON objects of jobs/list, one page at a time."""
+        query = {'limit': page_size, 'expand_tasks': False}
+        while True:
+            response = self.workspace_client.api_client.do('GET', '/api/2.2/jobs/list', query=query,
+                                                           headers={'Accept': 'application/json'})
+            yield response.get('jobs', [])
+            if not response.get('next_page_token'):
+                return
+            query['page_token'] = response['next_page_token']
+
+    def fetch_jobs(self):
+        """Every job as a summary DataFrame; each next page is requested while the last is collected. Raises on failure."""
+        jobs = []
+        for page in prefetch(self.iter_job_pages()):
+            jobs.extend(page)
+        return jobs_json_to_frame(jobs)
+
+    def iter_run_pages(self, job_id=None, active_only=False, start_time_from=None, max_pages=None):
+        """Yield the raw run JSON objects of runs/list (newest first), one page at a time."""
+        query = {'limit': JOB_RUNS_PAGE_SIZE, 'expand_tasks': False}
+        if job_id is not None:
+            query['job_id'] = job_id
+        if active_only:
+            query['active_only'] = True
+        if start_time_from is not None:
+            query['start_time_from'] = int(start_time_from)
+        for _ in itertools.count() if max_pages is None else range(max_pages):
+            response = self.workspace_client.api_client.do('GET', '/api/2.2/jobs/runs/list', query=query,
+                                                           headers={'Accept': 'application/json'})
+            yield response.get('runs', [])
+            if not response.get('next_page_token'):
+                return
+            query['page_token'] = response['next_page_token']
+
+    def get_run(self, run_id):
+        """The raw JSON of one run from runs/get, or None if it no longer exists. Raises on other failures."""
+        from databricks.sdk.errors import InvalidParameterValue, NotFound
+
+        try:
+            return self.workspace_client.api_client.do('GET', '/api/2.2/jobs/runs/get', query={'run_id': run_id},
+                                                       headers={'Accept': 'application/json'})
+        except (NotFound, InvalidParameterValue):
+            # Deleted runs are reported as a missing resource or an unknown run_id
+            return None
+
+    def get_recent_runs(self, job_ids):
+        """The latest page of runs of each given job, read concurrently on a bounded pool, as one frame. Raises on failure."""
+        pages = map_concurrently(lambda job_id: next(self.iter_run_pages(job_id=job_id), []), list(job_ids),
+                                 max_workers=RUN_STATUS_MAX_WORKERS)
+        return job_runs_json_to_frame([run for page in pages for run in page])
+
+    def fetch_run_status(self):
+        """RUN_STATUS_COLUMNS for every listed job, with a job_id column. Raises on failure.
+
+        Up to RUN_STATUS_PER_JOB_MAX_JOBS jobs, the latest runs are read per
+        job. For more jobs the status comes from the run history, whose
+        ingest only reads the runs started since its watermark, so latency
+        does not grow with the number of jobs or with the history window.
+        Until the history has been built (by watch_job_runs, in the
+        background) the status columns are left empty; if an ingest fails,
+        the last history is served.
+        """
+        jobs = self.get_jobs()
+        if jobs.empty:
+            return pd.DataFrame(columns=['job_id', *RUN_STATUS_COLUMNS])
+        job_ids = jobs['job_id'].tolist()
+        if len(job_ids) <= RUN_STATUS_PER_JOB_MAX_JOBS:
+            status = latest_run_status(self.get_recent_runs(job_ids))
+        else:
+            # The first ingest scans the whole retention window, so it is never run here
+            if self.run_history.get_run_status() is None:
+                self.watch_job_runs(self._run_history_interval)
+                return pd.DataFrame(columns=['job_id', *RUN_STATUS_COLUMNS])
+            self.run_history.ingest(max_age=RUN_STATUS_MAX_AGE)
+            status = self.run_history.get_run_status()
+            status = status[status.index.isin(job_ids)]
+        return status.rename_axis('job_id').reset_index()
+
+    def get_jobs_with_status(self, max_age=JOBS_MAX_AGE, status_max_age=RUN_STATUS_MAX_AGE):
+        """Job summaries joined with the run status columns and the run statistics (each cached on its own schedule).
+
+        The statistics come from the run history as last ingested; they are
+        left out until the first ingest (see watch_job_runs) has finished.
+        """
+        jobs = self.get_jobs(max_age)
+        if jobs.empty:
+            return jobs
+        status = self.run_status_frame.get(status_max_age)
+        if not status.empty:
+            jobs = jobs.merge(status, on='job_id', how='left')
+            jobs['running_count'] = jobs['running_count'].fillna(0).astype(int)
+        statistics = self.run_history.get_statistics()
+        if not statistics.empty:
+            jobs = jobs.merge(statistics.round(3), left_on='job_id', right_index=True, how='left')
+            jobs['runs'] = jobs['runs'].fillna(0).astype(int)
+        return jobs
+
+    def get_job_run_statistics(self):
+        """p50/p95 duration, failure rate and their trends per job (see utils.job_run_analytics)."""
+        return self.run_history.get_statistics()
+
+    def watch_job_runs(self, interval=JOB_RUN_HISTORY_REFRESH_INTERVAL):
+        """Ingest new job runs now and then every interval seconds on a background thread."""
+        with self._lock:
+            self._run_history_interval = interval
+            if self._run_history_thread is not None:
+                return
+            self._run_history_thread = threading.Thread(target=self._refresh_run_history, name='watch-job-runs',
+                                                        daemon=True)
+        self._run_history_thread.start()
+
+    def _refresh_run_history(self):
+        while True:
+            # One failed pass must not end the thread, or the statistics would stay frozen
+            try:
+                self.run_history.ingest()
+            except Exception as e:
+                print(f"Error refreshing job run history: {str(e)}")
+                self.run_history.degraded = True
+            time.sleep(self._run_history_interval)
+
+    def get_jobs(self, max_age=JOBS_MAX_AGE):
+        """Job summaries (cached; pass max_age=0 to re-fetch)."""
+        return self.jobs_frame.get(max_age)
+
+    @property
+    def degraded(self):
+        """True while persisted jobs data is served because the workspace cannot be reached."""
+        return self.jobs_frame.degraded or self.run_status_frame.degraded or self.run_history.degraded
+
+    def _listed_version(self, job_id):
+        jobs = self.jobs_frame.df
+        if jobs is None or jobs.empty:
+            return None
+        match = jobs.loc[jobs['job_id'] == job_id, 'settings_version']
+        return match.iloc[0] if not match.empty else None
+
+    def get_job_details(self, job_id, version=None):
+        """Full settings, notifications and tasks of one job for the detail panel, or None on error.
+
+        version defaults to the job's settings_version in the cached jobs
+        list; cached details fetched for another version are re-fetched.
+        """
+        if version is None:
+            version = self._listed_version(job_id)
+        details = self._job_details.get(job_id, version=version)
+        if details is not None:
+            return details
+        try:
+            job = self.workspace_client.jobs.get(job_id)
+        except Exception as e:
+            print(f"Error getting job {job_id}: {str(e)}")
+            return None
+        details = job_details_from_job(job)
+        self._job_details.put(job_id, details, version=version)
+        return details
+
+
+# Global instance
+jobs_service = DatabricksJobsService()
@@ -0,0 +1,193 @@
+import queue
+import threading
+import time
+
+from databricks.sdk.service.ml import Metric, Param, RunTag
+
+# Per-request limits of the MLflow log-batch API
+MAX_METRICS_PER_BATCH = 1000
+MAX_PARAMS_PER_BATCH = 100
+MAX_TAGS_PER_BATCH = 100
+MAX_ENTITIES_PER_BATCH = 1000
+
+# Buffered values are sent at least this often (seconds)
+DEFAULT_FLUSH_INTERVAL = 5.0
+
+# Logging calls block once this many values are waiting for the background thread
+DEFAULT_MAX_QUEUE_SIZE = 10000
+
+_STOP = object()
+
+
+class _FlushRequest:
+    def __init__(self):
+        self.done = threading.Event()
+
+
+class _RunBuffer:
+    """Values waiting to be sent for one run. Params and tags keep one value per key.
+
+    BatchLogger.log_param rejects a param logged again with a different
+    value, so only repeats of the same value collapse here.
+    """
+
+    def __init__(self):
+        self.metrics = []
+        self.params = {}
+        self.tags = {}
+
+    def __len__(self):
+        return len(self.metrics) + len(self.params) + len(self.tags)
+
+    def is_full(self):
+        return (len(self.metrics) >= MAX_METRICS_PER_BATCH
+                or len(self.params) >= MAX_PARAMS_PER_BATCH
+                or len(self.tags) >= MAX_TAGS_PER_BATCH
+                or len(self) >= MAX_ENTITIES_PER_BATCH)
+
+    def take_batch(self):
+        """Remove and return up to one API request worth of (metrics, params, tags)."""
+        params = [Param(key=key, value=value) for key, value in list(self.params.items())[:MAX_PARAMS_PER_BATCH]]
+        for param in params:
+            del self.params[param.key]
+        tags = [RunTag(key=key, value=value) for key, value in list(self.tags.items())[:MAX_TAGS_PER_BATCH]]
+        for tag in tags:
+            del self.tags[tag.key]
+        metric_room = min(MAX_METRICS_PER_BATCH, MAX_ENTITIES_PER_BATCH - len(params) - len(tags))
+        metrics, self.metrics = self.metrics[:metric_room], self.metrics[metric_room:]
+        return metrics, params, tags
+
+
+class BatchLogger:
+    """Buffers metrics, params and tags per run and sends them with experiments.log_batch.
+
+    Logging calls only enqueue; a background thread groups values by run
+    and sends a batch whenever a run's buffer reaches the API limits or
+    flush_interval seconds have passed. The queue is bounded, so producers
+    block (backpressure) when the thread falls behind. Call close(), or use
+    the logger as a context manager, to send everything that is left.
+
+    Failed batches are reported and counted in `errors`, not retried.
+    MLflow params cannot change once logged, so log_param raises ValueError
+    when a run's param is logged again with a different value.
+    """
+
+    def __init__(self, workspace_client, flush_interval=DEFAULT_FLUSH_INTERVAL,
+                 max_queue_size=DEFAULT_MAX_QUEUE_SIZE):
+        self.workspace_client = workspace_client
+        self.flush_interval = flush_interval
+        self.errors = 0
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._buffers = {}  # run_id -> _RunBuffer, only touched by the worker thread
+        self._logged_params = {}  # run_id -> {key: value} of every param accepted so far
+        self._params_lock = threading.Lock()
+        self._closed = False
+        self._close_lock = threading.Lock()
+        self._worker = threading.Thread(target=self._run, name='mlflow-batch-logger', daemon=True)
+        self._worker.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _put(self, item):
+        # Checked and enqueued under the lock, so nothing can land in the queue behind _STOP
+        with self._close_lock:
+            if self._closed:
+                raise RuntimeError("BatchLogger is closed")
+            self._queue.put(item)
+
+    def log_metric(self, run_id, key, value, step=None, timestamp=None):
+        """Queue a metric value. timestamp defaults to now (epoch milliseconds)."""
+        if timestamp is None:
+            timestamp = int(time.time() * 1000)
+        self._put(('metric', run_id, Metric(key=key, value=value, step=step or 0, timestamp=timestamp)))
+
+    def log_metrics(self, run_id, metrics, step=None, timestamp=None):
+        """Queue several metric values ({key: value}) sharing a step and timestamp."""
+        if timestamp is None:
+            timestamp = int(time.time() * 1000)
+        for key, value in metrics.items():
+            self.log_metric(run_id, key, value, step=step, timestamp=timestamp)
+
+    def log_param(self, run_id, key, value):
+        """Queue a parameter. Raises ValueError if the run's param was already logged with another value."""
+        value = str(value)
+        with self._params_lock:
+            logged = self._logged_params.setdefault(run_id, {})
+            if key in logged and logged[key] != value:
+                raise ValueError(f"Param '{key}' of run {run_id} was already logged as '{logged[key]}', not '{value}'")
+            logged[key] = value
+        self._put(('param', run_id, (key, value)))
+
+    def set_tag(self, run_id, key, value):
+        """Queue a run tag."""
+        self._put(('tag', run_id, (key, str(value))))
+
+    def flush(self, timeout=None):
+        """Send everything queued so far and wait for it. Returns False on timeout."""
+        request = _FlushRequest()
+        self._put(request)
+        return request.done.wait(timeout)
+
+    def close(self, timeout=None):
+        """Send everything that is left and stop the background thread."""
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._queue.put(_STOP)
+        self._worker.join(timeout)
+
+    def _add(self, kind, run_id, value):
+        buffer = self._buffers.setdefault(run_id, _RunBuffer())
+        if kind == 'metric':
+            buffer.metrics.append(value)
+        elif kind == 'param':
+            buffer.params[value[0]] = value[1]
+        else:
+            buffer.tags[value[0]] = value[1]
+        if buffer.is_full():
+            self._send(run_id, buffer, full_only=True)
+
+    def _send(self, run_id, buffer, full_only=False):
+        while len(buffer) and (not full_only or buffer.is_full()):
+            metrics, params, tags = buffer.take_batch()
+            try:
+                self.workspace_client.experiments.log_batch(
+                    run_id=run_id,
+                    metrics=metrics or None,
+                    params=params or None,
+                    tags=tags or None
+                )
+            except Exception as e:
+                self.errors += 1
+                print(f"Error logging batch for run {run_id}: {str(e)}")
+
+    def _flush_all(self):
+        for run_id, buffer in list(self._buffers.items()):
+            self._send(run_id, buffer)
+        self._buffers.clear()
+
+    def _run(self):
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            try:
+                item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                item = None
+
+            if item is _STOP:
+                self._flush_all()
+                return
+            if isinstance(item, _FlushRequest):
+                self._flush_all()
+                item.done.set()
+            elif item is not None:
+                self._add(*item)
+
+            if time.monotonic() >= deadline:
+                self._flush_all()
+                deadline = time.monotonic() + self.flush_interval
@@ -0,0 +1,308 @@
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from mlflow_service import (
+    DEFAULT_EXPERIMENT_NAME,
+    LOGGED_MODELS_PAGE_SIZE,
+    LOGGED_MODEL_STANDARD_COLUMNS,
+    SEARCH_RUNS_PAGE_SIZE,
+    ExperimentIdCache,
+    LoggedModelTable,
+    logged_model_metric_column,
+    parse_logged_models_order_by,
+    summarize_runs,
+    wide_logged_models,
+)
+from utils.frame_types import compact_frame
+from utils.run_hierarchy import PARENT_RUN_COLUMN, PARENT_RUN_TAG
+
+# Seconds to wait for a response before giving up
+REST_TIMEOUT = 60
+
+# Attempts per request while the workspace answers 429 (the shared limiter backs off between them)
+REST_MAX_ATTEMPTS = 6
+
+
+def _millis_to_datetimes(values):
+    """Epoch-millisecond values (None allowed) to a datetime64 array, in one call."""
+    return pd.to_datetime(np.array([np.nan if value is None else value for value in values], dtype='float64'), unit='ms')
+
+
+def runs_json_to_frame(runs, columns=None):
+    """Decode search_runs JSON straight into columns, matching MLflowWorkspaceService._runs_to_frame.
+
+    Metric values go into preallocated float arrays and params into
+    per-key lists, so no per-run dict is ever built. When columns is
+    given, only those metric_/param_ columns are decoded.
+    """
+    wanted = set(columns) if columns is not None else None
+    count = len(runs)
+    standard = {'run_name': [], 'run_id': [], 'status': [], 'start_time': [], 'end_time': []}
+    metrics = {}
+    params = {}
+    parents = [None] * count
+
+    for i, run in enumerate(runs):
+        info = run.get('info', {})
+        standard['run_name'].append(info.get('run_name'))
+        standard['run_id'].append(info.get('run_id'))
+        standard['status'].append(info.get('status'))
+        standard['start_time'].append(int(info['start_time']) if info.get('start_time') else None)
+        standard['end_time'].append(int(info['end_time']) if info.get('end_time') else None)
+
+        data = run.get('data', {})
+        for metric in data.get('metrics', ()):
+            column = f"metric_{metric['key']}"
+            if wanted is None or column in wanted:
+                if column not in metrics:
+                    metrics[column] = np.full(count, np.nan)
+                metrics[column][i] = float(metric.get('value', np.nan))
+        for param in data.get('params', ()):
+            column = f"param_{param['key']}"
+            if wanted is None or column in wanted:
+                if column not in params:
+                    params[column] = [None] * count
+                params[column][i] = param.get('value')
+        for tag in data.get('tags', ()):
+            if tag.get('key') == PARENT_RUN_TAG:
+                parents[i] = tag.get('value')
+
+    if not count:
+        return pd.DataFrame()
+    frame = {
+        'run_name': standard['run_name'],
+        'run_id': standard['run_id'],
+        'status': standard['status'],
+        'start_time': _millis_to_datetimes(standard['start_time']),
+        'end_time': _millis_to_datetimes(standard['end_time'])
+    }
+    if any(parent is not None for parent in parents):
+        frame[PARENT_RUN_COLUMN] = parents
+    frame.update(metrics)
+    frame.update(params)
+    return compact_frame(pd.DataFrame(frame))
+
+
+def logged_models_json_to_table(models, columns=None):
+    """Decode search_logged_models JSON into a LoggedModelTable, matching collect_logged_models."""
+    wanted = set(columns) if columns is not None else None
+    model_columns = {column: [] for column in LOGGED_MODEL_STANDARD_COLUMNS}
+    metric_rows = {'model_id': [], 'dataset': [], 'key': [], 'value': [], 'column': []}
+    param_rows = {'model_id': [], 'key': [], 'value': []}
+
+    for model in models:
+        info = model.get('info', {})
+        data = model.get('data') or info
+        model_id = info.get('model_id')
+        model_columns['model_id'].append(model_id)
+        model_columns['model_name'].append(info.get('name'))
+        model_columns['source_run_id'].append(info.get('source_run_id'))
+        model_columns['catalog_name'].append('mlflow')
+        model_columns['schema_name'].append('logged_models')
+        model_columns['creation_timestamp'].append(info.get('creation_timestamp_ms'))
+        model_columns['last_updated_timestamp'].append(info.get('last_updated_timestamp_ms'))
+        model_columns['user_id'].append(info.get('creator_id'))
+        model_columns['description'].append(info.get('description') or '')
+
+        for metric in data.get('metrics', ()):
+            if metric.get('key') is None:
+                continue
+            dataset_name = metric.get('dataset_name') or None
+            column = logged_model_metric_column(dataset_name, metric['key'])
+            if wanted is not None and column not in wanted:
+                continue
+            metric_rows['model_id'].append(model_id)
+            metric_rows['dataset'].append(dataset_name)
+            metric_rows['key'].append(metric['key'])
+            metric_rows['value'].append(metric.get('value'))
+            metric_rows['column'].append(column)
+        for param in data.get('params', ()):
+            if param.get('key') is None or wanted is not None and f"param_{param['key']}" not in wanted:
+                continue
+            param_rows['model_id'].append(model_id)
+            param_rows['key'].append(param['key'])
+            param_rows['value'].append(param.get('value'))
+
+    for column in ('creation_timestamp', 'last_updated_timestamp'):
+        model_columns[column] = _millis_to_datetimes([int(value) if value else None for value in model_columns[column]])
+    metrics = pd.DataFrame(metric_rows)
+    metrics['value'] = pd.to_numeric(metrics['value'], errors='coerce')
+    return LoggedModelTable(pd.DataFrame(model_columns), metrics, pd.DataFrame(param_rows))
+
+
+class MLflowRestService:
+    """Thin MLflow REST client for Databricks, a lighter alternative to the SDK-backed service.
+
+    Requests share one keep-alive session on the process-wide connection
+    pool (see utils.workspace_clients) and accept gzip. Pages are followed by page token and responses
+    are decoded straight into columns. get_runs and get_logged_models
+    return the same frames as MLflowWorkspaceService, which can use this
+    client as its backend (MLOPS_MLFLOW_BACKEND=rest).
+
+    Host and credentials come from the shared WorkspaceClient's config
+    unless passed in.
+    """
+
+    def __init__(self, host=None, token=None, timeout=REST_TIMEOUT):
+        self.host = host
+        self.token = token
+        self.timeout = timeout
+        self._session = None
+        self._session_lock = threading.Lock()
+        self._experiment_ids = ExperimentIdCache()
+
+    @property
+    def session(self):
+        """Lazily created keep-alive session shared by every request."""
+        with self._session_lock:
+            if self._session is None:
+                import requests
+                from utils.workspace_clients import workspace_clients
+
+                session = workspace_clients.mount(requests.Session())
+                session.headers.update({'Accept-Encoding': 'gzip', 'Content-Type': 'application/json'})
+                self._session = session
+            return self._session
+
+    def _auth(self):
+        """(base URL, auth headers); from the shared client's config unless a host and token were given."""
+        if self.host and self.token:
+            return self.host.rstrip('/'), {'Authorization': f'Bearer {self.token}'}
+        from utils.workspace_clients import workspace_clients
+
+        config = workspace_clients.config
+        return config.host.rstrip('/'), config.authenticate()
+
+    def _request(self, method, path, params=None, body=None):
+        base_url, headers = self._auth()
+        for attempt in range(REST_MAX_ATTEMPTS):
+            response = self.session.request(
+                method,
+                f"{base_url}/api/2.0/mlflow/{path}",
+                params=params,
+                json=body,
+                headers=headers,
+                timeout=self.timeout
+            )
+            if response.status_code != 429:
+                break
+            # Retry-After pauses the family in the limiter; without one, back off here
+            if not response.headers.get('Retry-After'):
+                time.sleep(min(2 ** attempt, 30))
+        response.raise_for_status()
+        return response.json()
+
+    def test_connection(self):
+        """True if the workspace answers an authenticated MLflow request."""
+        try:
+            self._request('POST', 'experiments/search', body={'max_results': 1})
+            return True
+        except Exception as e:
+            print(f"REST connection test failed: {str(e)}")
+            return False
+
+    def get_experiment_id(self, experiment_name=DEFAULT_EXPERIMENT_NAME):
+        """Experiment ID for a name (cached), or None if it does not exist."""
+        experiment_id = self._experiment_ids.get(experiment_name)
+        if experiment_id is not None:
+            return experiment_id
+        try:
+            response = self._request('GET', 'experiments/get-by-name', params={'experiment_name': experiment_name})
+        except Exception as e:
+            print(f"Error getting experiment '{experiment_name}': {str(e)}")
+            return None
+        experiment_id = response['experiment']['experiment_id']
+        self._experiment_ids.put(experiment_name, experiment_id)
+        return experiment_id
+
+    def _experiment_ids_for(self, experiment_name):
+        names = [experiment_name] if isinstance(experiment_name, str) else list(experiment_name)
+        return [experiment_id for experiment_id in map(self.get_experiment_id, names) if experiment_id is not None]
+
+    def iter_run_pages(self, experiment_ids, filter_string=None, order_by=None, max_results=None):
+        """Yield lists of run JSON objects, one search page at a time."""
+        body = {'experiment_ids': list(experiment_ids)}
+        if filter_string:
+            body['filter'] = filter_string
+        if order_by:
+            body['order_by'] = list(order_by)
+        remaining = max_results
+        while True:
+            body['max_results'] = min(remaining, SEARCH_RUNS_PAGE_SIZE) if remaining else SEARCH_RUNS_PAGE_SIZE
+            response = self._request('POST', 'runs/search', body=body)
+            runs = response.get('runs', [])
+            if remaining:
+                runs = runs[:remaining]
+                remaining -= len(runs)
+            yield runs
+            body['page_token'] = response.get('next_page_token')
+            if not body['page_token'] or not runs or remaining == 0:
+                return
+
+    def iter_logged_model_pages(self, experiment_ids, filter_string=None, order_by=None, max_results=None):
+        """Yield lists of logged model JSON objects, one search page at a time."""
+        body = {'experiment_ids': list(experiment_ids)}
+        if filter_string:
+            body['filter'] = filter_string
+        if order_by:
+            body['order_by'] = [order.as_dict() for order in parse_logged_models_order_by(order_by)]
+        remaining = max_results
+        while True:
+            body['max_results'] = min(remaining, LOGGED_MODELS_PAGE_SIZE) if remaining else LOGGED_MODELS_PAGE_SIZE
+            response = self._request('POST', 'logged-models/search', body=body)
+            models = response.get('models', [])
+            if remaining:
+                models = models[:remaining]
+                remaining -= len(models)
+            yield models
+            body['page_token'] = response.get('next_page_token')
+            if not body['page_token'] or not models or remaining == 0:
+                return
+
+    def search_runs_frame(self, experiment_ids, filter_string=None, order_by=None, columns=None, max_results=None):
+        """Every matching run as a runs DataFrame. Errors propagate to the caller."""
+        runs = [run for page in self.iter_run_pages(experiment_ids, filter_string, order_by, max_results) for run in page]
+        return runs_json_to_frame(runs, columns)
+
+    def search_logged_models_table(self, experiment_ids, filter_string=None, order_by=None, columns=None,
+                                   max_results=None):
+        """Every matching logged model as a LoggedModelTable. Errors propagate to the caller."""
+        models = [model for page in self.iter_logged_model_pages(experiment_ids, filter_string, order_by, max_results)
+                  for model in page]
+        return logged_models_json_to_table(models, columns)
+
+    def get_runs(self, experiment_name=DEFAULT_EXPERIMENT_NAME, filter_string=None, order_by=None, columns=None,
+                 max_results=None):
+        """Runs of an experiment, in the same shape as MLflowWorkspaceService.get_runs (uncached)."""
+        try:
+            experiment_ids = self._experiment_ids_for(experiment_name)
+            if not experiment_ids:
+                return pd.DataFrame()
+            return self.search_runs_frame(experiment_ids, filter_string, order_by, columns, max_results)
+        except Exception as e:
+            print(f"Error fetching MLflow runs over REST: {str(e)}")
+            return pd.DataFrame()
+
+    def get_logged_models(self, experiment_name=DEFAULT_EXPERIMENT_NAME, filter_string=None, order_by=None,
+                          columns=None, max_results=None):
+        """Logged models, in the same shape as MLflowWorkspaceService.get_logged_models (uncached)."""
+        try:
+            experiment_ids = self._experiment_ids_for(experiment_name)
+            if not experiment_ids:
+                return pd.DataFrame()
+            return wide_logged_models(
+                self.search_logged_models_table(experiment_ids, filter_string, order_by, columns, max_results))
+        except Exception as e:
+            print(f"Error fetching logged models over REST: {str(e)}")
+            return pd.DataFrame()
+
+    def get_experiment_summary(self, experiment_name=DEFAULT_EXPERIMENT_NAME):
+        """Run counts by status and date range, like MLflowWorkspaceService.get_experiment_summary."""
+        return summarize_runs(self.get_runs(experiment_name, columns=[]), experiment_name)
+
+
+# Global instance
+mlflow_rest_service = MLflowRestService()
@@ -1,32 +1,617 @@
+import itertools
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
 import pandas as pd
-import mlflow
-from databricks.sdk import WorkspaceClient
+
+# mlflow and the Databricks SDK take over a second to import, so they are
+# imported on first use rather than here.
+from utils.concurrency import map_concurrently, prefetch
+from utils.downsample import downsample_indices
+from utils.frame_types import compact_frame, frame_memory_bytes
+from utils.leaderboard import StreamingLeaderboard
+from utils.offload import offload
+from utils.run_hierarchy import PARENT_RUN_COLUMN, PARENT_RUN_TAG, RunHierarchy
+from utils.run_model_links import RunModelLinks
+from utils.snapshot_store import PersistentFrame, snapshot_key, snapshot_store as default_snapshot_store
+from utils.ttl_cache import TTLCache
+
+DEFAULT_EXPERIMENT_NAME = '/ML/mlflow_workshop/mlflow3-ml-example'
+
+# How long a resolved experiment name -> ID mapping is trusted (seconds)
+EXPERIMENT_ID_CACHE_TTL = 300
+
+# How long a run snapshot is served before get_runs syncs again (seconds)
+RUN_SNAPSHOT_MAX_AGE = 60
+
+# Incremental syncs cannot see deleted runs, so re-download everything this often (seconds)
+RUN_FULL_REFRESH_INTERVAL = 1800
+
+# Overlap applied to sync watermarks to tolerate clock skew with the workspace (milliseconds)
+RUN_SYNC_OVERLAP_MS = 60_000
+
+ACTIVE_RUN_STATUSES = ('RUNNING', 'SCHEDULED')
+
+# Largest page search_runs accepts
+SEARCH_RUNS_PAGE_SIZE = 1000
+
+# search_logged_models rejects large pages (1000 errors), so keep this small and paginate
+LOGGED_MODELS_PAGE_SIZE = 10
+
+# Experiments whose logged models are paged concurrently
+LOGGED_MODELS_MAX_WORKERS = 8
+
+# Columns every runs DataFrame carries regardless of column selection
+RUN_STANDARD_COLUMNS = ['run_name', 'run_id', 'status', 'start_time', 'end_time']
+
+# Backend for run and logged-model searches: 'sdk' (WorkspaceClient) or 'rest' (see mlflow_rest_service)
+MLFLOW_BACKEND = os.getenv('MLOPS_MLFLOW_BACKEND', 'sdk')
+
+
+class ExperimentIdCache:
+    """Thread-safe experiment name -> ID cache with a time-to-live."""
+
+    def __init__(self, ttl=EXPERIMENT_ID_CACHE_TTL):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = {}  # name -> (experiment_id, stored_at)
+
+    def get(self, experiment_name):
+        """Return the cached ID for a name, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(experiment_name)
+            if entry is None:
+                return None
+            experiment_id, stored_at = entry
+            if time.monotonic() - stored_at > self.ttl:
+                del self._entries[experiment_name]
+                return None
+            return experiment_id
+
+    def put(self, experiment_name, experiment_id):
+        """Store a single name -> ID mapping."""
+        if not experiment_name or not experiment_id:
+            return
+        with self._lock:
+            self._entries[experiment_name] = (experiment_id, time.monotonic())
+
+    def update(self, mapping):
+        """Store many name -> ID mappings at once (bulk warm-up)."""
+        now = time.monotonic()
+        with self._lock:
+            for experiment_name, experiment_id in mapping.items():
+                if experiment_name and experiment_id:
+                    self._entries[experiment_name] = (experiment_id, now)
+
+    def invalidate(self, experiment_name=None):
+        """Drop one mapping, or the whole cache when no name is given."""
+        with self._lock:
+            if experiment_name is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(experiment_name, None)
+
+
+class RunSnapshot:
+    """A downloaded runs DataFrame for one experiment plus its sync watermarks.
+    
+    fetched_at is when the data was last brought up to date (full or
+    incremental); full_fetched_at is when every run was last downloaded.
+    Both are wall-clock seconds taken when the download started.
+    
+    The parent/child RunHierarchy is built on first use; an incremental
+    sync passes on the previous one merged with the changed runs. A
+    snapshot made by merged() also records which runs changed since the
+    one it came from (changed_run_ids, previous_fetched_at).
+    """
+
+    def __init__(self, experiment_name, runs_df, fetched_at=None, full_fetched_at=None, from_disk=False,
+                 hierarchy=None, changed_run_ids=None, previous_fetched_at=None):
+        self.experiment_name = experiment_name
+        self.runs_df = runs_df
+        self.fetched_at = fetched_at if fetched_at is not None else time.time()
+        self.full_fetched_at = full_fetched_at if full_fetched_at is not None else self.fetched_at
+        # True when loaded from the local snapshot store rather than the workspace
+        self.from_disk = from_disk
+        self._hierarchy = hierarchy
+        self.changed_run_ids = changed_run_ids
+        self.previous_fetched_at = previous_fetched_at
+
+    @property
+    def hierarchy(self):
+        """RunHierarchy of the snapshot's parent and child runs."""
+        if self._hierarchy is None:
+            self._hierarchy = RunHierarchy.from_runs(self.runs_df)
+        return self._hierarchy
+
+    def merged(self, changed_df, fetched_at):
+        """A new snapshot with changed runs upserted, keeping the hierarchy up to date incrementally."""
+        return RunSnapshot(
+            self.experiment_name,
+            merge_runs(self.runs_df, changed_df),
+            fetched_at=fetched_at,
+            full_fetched_at=self.full_fetched_at,
+            hierarchy=self._hierarchy.merged(changed_df) if self._hierarchy is not None else None,
+            changed_run_ids=set(changed_df['run_id']) if not changed_df.empty else set(),
+            previous_fetched_at=self.fetched_at
+        )
+
+    @property
+    def age(self):
+        """Seconds since the snapshot was fetched."""
+        return time.time() - self.fetched_at
+
+    def is_fresh(self, max_age=RUN_SNAPSHOT_MAX_AGE):
+        """True while the snapshot is younger than max_age seconds."""
+        return max_age is not None and self.age < max_age
+
+    @property
+    def start_time_watermark(self):
+        """Highest run start_time seen, in epoch milliseconds (None if no runs)."""
+        if self.runs_df.empty or 'start_time' not in self.runs_df:
+            return None
+        latest = self.runs_df['start_time'].max()
+        return None if pd.isna(latest) else int(pd.Timestamp(latest).value // 1_000_000)
+
+    @property
+    def has_active_runs(self):
+        """True if any run was still in progress when the snapshot was taken."""
+        if self.runs_df.empty or 'status' not in self.runs_df:
+            return False
+        return bool(self.runs_df['status'].isin(ACTIVE_RUN_STATUSES).any())
+
+
+def concat_experiment_frames(experiment_names, frames):
+    """Stack per-experiment frames, tagging each row with an experiment_name column in front."""
+    tagged = [
+        frame.assign(experiment_name=name)[['experiment_name', *frame.columns]]
+        for name, frame in zip(experiment_names, frames)
+        if frame is not None and not frame.empty
+    ]
+    if not tagged:
+        return pd.DataFrame()
+    return pd.concat(tagged, ignore_index=True, sort=False)
+
+
+def project_columns(runs_df, columns=None, standard_columns=RUN_STANDARD_COLUMNS):
+    """Keep the standard columns plus the requested ones that exist."""
+    if columns is None or runs_df.empty:
+        return runs_df
+    wanted = set(columns)
+    return runs_df[[col for col in runs_df.columns if col in standard_columns or col in wanted]]
+
+
+def parse_logged_models_order_by(order_by):
+    """Turn ["metrics.val_rmse DESC", ...] into SearchLoggedModelsOrderBy objects.
+    
+    Entries that are already SearchLoggedModelsOrderBy are passed through.
+    A metric can be scoped to a dataset with "metrics.rmse@val ASC".
+    """
+    if not order_by:
+        return None
+    from databricks.sdk.service.ml import SearchLoggedModelsOrderBy
+    
+    clauses = []
+    for clause in order_by:
+        if isinstance(clause, SearchLoggedModelsOrderBy):
+            clauses.append(clause)
+            continue
+        parts = clause.split()
+        field_name, dataset_name = parts[0], None
+        if '@' in field_name:
+            field_name, dataset_name = field_name.split('@', 1)
+        ascending = len(parts) < 2 or parts[1].upper() != 'DESC'
+        clauses.append(SearchLoggedModelsOrderBy(field_name=field_name, ascending=ascending, dataset_name=dataset_name))
+    return clauses
+
+
+def merge_runs(runs_df, changed_df):
+    """Upsert changed runs into a runs DataFrame by run_id, newest first."""
+    if changed_df.empty:
+        return runs_df
+    if runs_df.empty:
+        merged = changed_df
+    else:
+        kept = runs_df[~runs_df['run_id'].isin(changed_df['run_id'])]
+        merged = pd.concat([kept, changed_df], ignore_index=True)
+    merged = merged.drop_duplicates('run_id', keep='last')
+    # Concatenating categoricals with different categories falls back to object
+    return compact_frame(merged.sort_values('start_time', ascending=False, kind='stable').reset_index(drop=True))
+
+
+def summarize_runs(runs_df, experiment_name):
+    """Summary statistics (run counts by status, date range) for a runs DataFrame."""
+    if runs_df.empty:
+        return {
+            'total_runs': 0,
+            'completed_runs': 0,
+            'failed_runs': 0,
+            'running_runs': 0,
+            'experiment_name': experiment_name
+        }
+    
+    status_counts = runs_df['status'].value_counts()
+    return {
+        'total_runs': len(runs_df),
+        'completed_runs': int(status_counts.get('FINISHED', 0)),
+        'failed_runs': int(status_counts.get('FAILED', 0)),
+        'running_runs': int(status_counts.get('RUNNING', 0)),
+        'experiment_name': experiment_name,
+        'date_range': {
+            'start': runs_df['start_time'].min(),
+            'end': runs_df['start_time'].max()
+        }
+    }
+
+
+# How long the unfiltered logged models frame is served before it is re-fetched (seconds)
+LOGGED_MODELS_MAX_AGE = 300
+
+# Experiments fetched concurrently by the multi-experiment views
+EXPERIMENT_FETCH_MAX_WORKERS = 8
+
+# Watched experiments not viewed for this long stop being refreshed (seconds), and at most this many are kept warm
+WATCH_EXPIRY = 900
+WATCHED_EXPERIMENTS_MAX = 20
+
+# Recent runs / logged models sampled to discover column names when nothing is cached yet
+KEY_DISCOVERY_SAMPLE_SIZE = 200
+
+# Largest page get_history accepts
+METRIC_HISTORY_PAGE_SIZE = 25000
+
+# Concurrent get_history calls when loading many series at once
+METRIC_HISTORY_MAX_WORKERS = 16
+
+# Cached full-resolution histories are re-fetched after this long (seconds)
+METRIC_HISTORY_MAX_AGE = 300
+
+# Upper bound on points held by the history cache (~16 bytes each)
+METRIC_HISTORY_CACHE_MAX_POINTS = 10_000_000
+
+# Default number of points per series sent to the browser
+METRIC_HISTORY_MAX_POINTS = 1000
+
+
+class MetricHistoryCache:
+    """Thread-safe LRU cache of full-resolution metric histories.
+    
+    Keyed by (run_id, metric_key); each entry holds sorted step and value
+    arrays. Evicts least recently used series once the total point count
+    exceeds max_points.
+    """
+
+    def __init__(self, max_points=METRIC_HISTORY_CACHE_MAX_POINTS):
+        self.max_points = max_points
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # (run_id, key) -> (steps, values, fetched_at)
+        self._points = 0
+
+    def get(self, run_id, metric_key, max_age=METRIC_HISTORY_MAX_AGE):
+        """Return (steps, values) if cached and younger than max_age, else None."""
+        with self._lock:
+            entry = self._entries.get((run_id, metric_key))
+            if entry is None:
+                return None
+            steps, values, fetched_at = entry
+            if max_age is not None and time.time() - fetched_at > max_age:
+                return None
+            self._entries.move_to_end((run_id, metric_key))
+            return steps, values
+
+    def put(self, run_id, metric_key, steps, values):
+        with self._lock:
+            previous = self._entries.pop((run_id, metric_key), None)
+            if previous is not None:
+                self._points -= len(previous[0])
+            self._entries[(run_id, metric_key)] = (steps, values, time.time())
+            self._points += len(steps)
+            while self._points > self.max_points and len(self._entries) > 1:
+                _, (old_steps, _, _) = self._entries.popitem(last=False)
+                self._points -= len(old_steps)
+
+    def footprint(self):
+        """(series, points, bytes) currently cached."""
+        with self._lock:
+            nbytes = sum(steps.nbytes + values.nbytes for steps, values, _ in self._entries.values())
+            return len(self._entries), self._points, nbytes
+
+    def invalidate(self, run_id=None):
+        """Drop the histories of one run, or everything."""
+        with self._lock:
+            for key in [k for k in self._entries if run_id is None or k[0] == run_id]:
+                self._points -= len(self._entries.pop(key)[0])
+
+
+def compare_run_frame(runs_df, baseline_run_id=None, metric_keys=None):
+    """Params that differ and metric deltas against a baseline, from a runs frame with one row per run.
+    
+    Returns (params, metrics, deltas, relative_deltas, baseline_run_id).
+    Every frame is indexed by key (without the metric_/param_ prefix) with
+    one column per run_id; deltas are metric values minus the baseline's.
+    The first run is the baseline unless baseline_run_id names another.
+    """
+    runs = runs_df.drop_duplicates('run_id').set_index('run_id')
+    
+    params = runs[[col for col in runs.columns if col.startswith('param_')]].T
+    params = params[params.nunique(axis=1, dropna=False) > 1]
+    params.index = params.index.str.slice(len('param_'))
+    
+    metric_columns = [col for col in runs.columns if col.startswith('metric_')]
+    if metric_keys is not None:
+        wanted = {f'metric_{key}' for key in metric_keys}
+        metric_columns = [col for col in metric_columns if col in wanted]
+    metrics = runs[metric_columns].apply(pd.to_numeric, errors='coerce').T
+    metrics.index = metrics.index.str.slice(len('metric_'))
+    
+    if baseline_run_id not in runs.index:
+        baseline_run_id = runs.index[0] if len(runs) else None
+    if baseline_run_id is None:
+        return params, metrics, metrics.copy(), metrics.copy(), None
+    baseline = metrics[baseline_run_id]
+    deltas = metrics.sub(baseline, axis=0)
+    relative_deltas = deltas.div(baseline.abs().replace(0, np.nan), axis=0)
+    return params, metrics, deltas, relative_deltas, baseline_run_id
+
+
+# Runs whose details (params, metrics, tags) are kept for the detail panel
+RUN_DETAIL_CACHE_SIZE = 500
+
+# Details of finished runs are re-fetched after this long, those of active runs much sooner (seconds)
+RUN_DETAIL_MAX_AGE = 3600
+RUN_DETAIL_ACTIVE_MAX_AGE = 15
+
+
+def run_details_from_run(run):
+    """Params, latest metrics and tags of one Run as small key/value DataFrames."""
+    data = getattr(run, 'data', None)
+    metrics = getattr(data, 'metrics', None) or []
+    params = getattr(data, 'params', None) or []
+    tags = getattr(data, 'tags', None) or []
+    return {
+        'run_id': run.info.run_id,
+        'run_name': run.info.run_name,
+        'status': run.info.status.value if run.info.status else None,
+        'params': pd.DataFrame({'key': [p.key for p in params], 'value': [p.value for p in params]}),
+        'metrics': pd.DataFrame({
+            'key': [m.key for m in metrics],
+            'value': [m.value for m in metrics],
+            'step': [m.step for m in metrics],
+            'timestamp': pd.to_datetime([m.timestamp for m in metrics], unit='ms')
+        }),
+        'tags': pd.DataFrame({'key': [t.key for t in tags], 'value': [t.value for t in tags]})
+    }
+
+
+def run_detail_max_age(details):
+    """How long cached run details are served: briefly while the run is active."""
+    return RUN_DETAIL_ACTIVE_MAX_AGE if details['status'] in ACTIVE_RUN_STATUSES else RUN_DETAIL_MAX_AGE
+
+
+# Descriptive columns at the front of every logged models DataFrame
+LOGGED_MODEL_STANDARD_COLUMNS = [
+    'model_id', 'model_name', 'source_run_id', 'catalog_name', 'schema_name',
+    'creation_timestamp', 'last_updated_timestamp', 'user_id', 'description'
+]
+
+
+def logged_model_metric_column(dataset_name, metric_key):
+    """Wide column name for a metric: '<dataset>_<metric>', or just the metric without a dataset."""
+    return f"{dataset_name}_{metric_key}" if dataset_name else metric_key
+
+
+def _millis_to_datetime(value):
+    return pd.to_datetime(value, unit='ms') if value else None
+
+
+class LoggedModelTable:
+    """Logged models in long format.
+    
+    models has one row per model (the standard columns). metrics has one
+    row per (model_id, dataset, key, value) and params one row per
+    (model_id, key, value), so storage grows with the values actually
+    logged rather than models x distinct keys.
+    """
+
+    def __init__(self, models, metrics, params):
+        self.models = models
+        self.metrics = metrics
+        self.params = params
+
+    def to_wide(self, sparse=False):
+        """Pivot into the one-row-per-model frame the grids use.
+        
+        Metric columns come first (general, then grouped by dataset),
+        followed by param_ columns; missing combinations are NaN.
+        """
+        if self.models.empty:
+            return pd.DataFrame()
+        wide = self.models
+        
+        if not self.metrics.empty:
+            # Dedupe on the display column: a general metric 'val_rmse' and 'rmse' on dataset 'val' share one
+            metrics = self.metrics.drop_duplicates(['model_id', 'column'], keep='last')
+            metrics = metrics.assign(sort_dataset=metrics['dataset'].fillna('')).sort_values(['sort_dataset', 'key'])
+            column_order = list(dict.fromkeys(metrics['column']))
+            metric_wide = metrics.pivot(index='model_id', columns='column', values='value')[column_order]
+            if sparse:
+                metric_wide = metric_wide.astype(pd.SparseDtype('float64'))
+            wide = wide.join(metric_wide, on='model_id')
+        
+        if not self.params.empty:
+            params = self.params.drop_duplicates(['model_id', 'key'], keep='last')
+            param_wide = params.pivot(index='model_id', columns='key', values='value')
+            param_wide = param_wide[sorted(param_wide.columns)].add_prefix('param_')
+            wide = wide.join(param_wide, on='model_id')
+        
+        wide.columns.name = None
+        return compact_frame(wide.reset_index(drop=True))
+
+
+def logged_model_table_to_wide(models, metrics, params):
+    """LoggedModelTable(models, metrics, params).to_wide(), as a module-level function for offload()."""
+    return LoggedModelTable(models, metrics, params).to_wide()
+
+
+def wide_logged_models(table, sparse=False):
+    """Pivot a LoggedModelTable to wide, in the offload process pool when it is large."""
+    if sparse:
+        # Arrow has no sparse columns, so sparse frames are always built here
+        return table.to_wide(sparse=True)
+    return offload(logged_model_table_to_wide, table.models, table.metrics, table.params)
+
+
+def collect_logged_models(logged_models, columns=None):
+    """Single pass over LoggedModel objects into a LoggedModelTable.
+    
+    When columns is given, only those metric and param_ columns are kept.
+    """
+    wanted = set(columns) if columns is not None else None
+    model_rows = []
+    metric_rows = {'model_id': [], 'dataset': [], 'key': [], 'value': [], 'column': []}
+    param_rows = {'model_id': [], 'key': [], 'value': []}
+    
+    for model in logged_models:
+        info = model.info
+        # Metrics and params live on model.data; older payloads carried them on model.info
+        data = getattr(model, 'data', None) or info
+        model_id = getattr(info, 'model_id', None)
+        
+        model_rows.append({
+            'model_id': model_id,
+            'model_name': getattr(info, 'name', None),
+            'source_run_id': getattr(info, 'source_run_id', None),
+            'catalog_name': 'mlflow',  # Since we're using MLflow experiments
+            'schema_name': 'logged_models',
+            'creation_timestamp': _millis_to_datetime(getattr(info, 'creation_timestamp_ms', None) or getattr(info, 'creation_timestamp', None)),
+            'last_updated_timestamp': _millis_to_datetime(getattr(info, 'last_updated_timestamp_ms', None) or getattr(info, 'last_updated_timestamp', None)),
+            'user_id': getattr(info, 'user_id', None) or getattr(info, 'creator_id', None),
+            'description': getattr(info, 'description', '') or ''
+        })
+        
+        for metric in getattr(data, 'metrics', None) or []:
+            if getattr(metric, 'key', None) is None:
+                continue
+            metric_key = str(metric.key)
+            dataset_name = getattr(metric, 'dataset_name', None) or None
+            column = logged_model_metric_column(dataset_name, metric_key)
+            if wanted is not None and column not in wanted:
+                continue
+            metric_rows['model_id'].append(model_id)
+            metric_rows['dataset'].append(dataset_name)
+            metric_rows['key'].append(metric_key)
+            metric_rows['value'].append(metric.value)
+            metric_rows['column'].append(column)
+        
+        for param in getattr(data, 'params', None) or getattr(data, 'parameters', None) or []:
+            if getattr(param, 'key', None) is None:
+                continue
+            param_key = str(param.key)
+            if wanted is not None and f'param_{param_key}' not in wanted:
+                continue
+            param_rows['model_id'].append(model_id)
+            param_rows['key'].append(param_key)
+            param_rows['value'].append(param.value)
+    
+    metrics = pd.DataFrame(metric_rows)
+    metrics['value'] = pd.to_numeric(metrics['value'], errors='coerce')
+    return LoggedModelTable(
+        pd.DataFrame(model_rows, columns=LOGGED_MODEL_STANDARD_COLUMNS),
+        metrics,
+        pd.DataFrame(param_rows)
+    )
+
 
 class MLflowWorkspaceService:
-    def __init__(self):
-        # Set up MLflow tracking
-        mlflow.set_tracking_uri("databricks")
+    def __init__(self, snapshot_store=None, backend=None):
+        # The workspace client (and MLflow tracking) are initialized lazily on first use
+        self._tracking_uri_set = False
+        
+        # Searches go through the SDK or the thin REST client (see _fetch_runs_frame)
+        self.backend = backend or MLFLOW_BACKEND
+        self._rest_client = None
+        
+        # Experiment name -> ID lookups are cached to avoid a REST call per request
+        self._experiment_ids = ExperimentIdCache()
+        
+        # Run snapshots shared by get_runs, summaries, plots and refresh callbacks
+        self._run_snapshots = {}  # experiment name -> RunSnapshot
+        self._run_fetch_locks = {}
+        self._run_snapshots_lock = threading.Lock()
+        self._run_snapshots_checked = set()
+        self._background_run_syncs = set()
         
-        # Initialize the workspace client lazily
-        self._workspace_client = None
+        # Snapshots are mirrored to local Parquet files for instant startup and offline use
+        self.snapshot_store = snapshot_store if snapshot_store is not None else default_snapshot_store
+        self._logged_model_frames = {}  # experiment name -> PersistentFrame
+        
+        # experiment name -> (RunModelLinks, lock, {'runs_at', 'models_at'}) (see get_model_links)
+        self._model_links = {}
+        
+        # Experiments kept warm by the background refresher (see watch_experiments)
+        self._watched_experiments = {}  # experiment name -> time.monotonic() it was last viewed
+        self._watch_interval = RUN_SNAPSHOT_MAX_AGE
+        self._watch_thread = None
+        self._workspace_unreachable = False
+        
+        # Full per-step metric histories, downsampled on the way out
+        self._metric_histories = MetricHistoryCache()
+        self._run_details = TTLCache(RUN_DETAIL_CACHE_SIZE, max_age=run_detail_max_age)
     
     @property
     def workspace_client(self):
-        """Lazy initialization of workspace client."""
-        if self._workspace_client is None:
-            try:
-                self._workspace_client = WorkspaceClient()
-            except Exception as e:
-                print(f"Warning: Could not initialize WorkspaceClient: {e}")
-                print("Please ensure Databricks credentials are properly configured.")
-                raise
-        return self._workspace_client
+        """The shared WorkspaceClient (see utils.workspace_clients), looked up on every use."""
+        try:
+            from utils.workspace_clients import get_workspace_client
+            
+            client = get_workspace_client()
+            if not self._tracking_uri_set:
+                import mlflow
+                
+                # Set up MLflow tracking
+                mlflow.set_tracking_uri("databricks")
+                self._tracking_uri_set = True
+            return client
+        except Exception as e:
+            print(f"Warning: Could not initialize WorkspaceClient: {e}")
+            print("Please ensure Databricks credentials are properly configured.")
+            raise
+    
+    @property
+    def rest_client(self):
+        """Lazily created MLflowRestService used when backend is 'rest'."""
+        if self._rest_client is None:
+            from mlflow_rest_service import MLflowRestService
+            self._rest_client = MLflowRestService()
+        return self._rest_client
+    
+    def _resolve_experiment_id(self, experiment_name):
+        """Resolve an experiment name to its ID, using the cache when possible.
+        
+        Errors from the workspace client propagate to the caller.
+        """
+        experiment_id = self._experiment_ids.get(experiment_name)
+        if experiment_id is not None:
+            return experiment_id
+        
+        experiment = self.workspace_client.experiments.get_by_name(experiment_name)
+        if experiment is None or experiment.experiment is None:
+            return None
+        experiment_id = experiment.experiment.experiment_id
+        self._experiment_ids.put(experiment_name, experiment_id)
+        return experiment_id
+    
+    def invalidate_experiment_cache(self, experiment_name=None):
+        """Forget cached experiment IDs (one name, or all of them)."""
+        self._experiment_ids.invalidate(experiment_name)
     
     def get_experiment_id(self, experiment_name):
         """Get experiment ID by name."""
         try:
-            experiment = self.workspace_client.experiments.get_by_name(experiment_name)
-            return experiment.experiment.experiment_id if experiment else None
+            return self._resolve_experiment_id(experiment_name)
         except Exception as e:
             print(f"Error getting experiment ID: {str(e)}")
             return None
@@ -38,7 +623,9 @@ class MLflowWorkspaceService:
                 name=experiment_name,
                 artifact_location=artifact_location
             )
-            return experiment.experiment.experiment_id
+            experiment_id = experiment.experiment.experiment_id
+            self._experiment_ids.put(experiment_name, experiment_id)
+            return experiment_id
         except Exception as e:
             print(f"Error creating experiment: {str(e)}")
             return None
@@ -46,76 +633,408 @@ class MLflowWorkspaceService:
     def delete_experiment(self, experiment_name):
         """Delete an experiment following the documented API."""
         try:
-            experiment = self.workspace_client.experiments.get_by_name(experiment_name)
-            if experiment:
-                self.workspace_client.experiments.delete(experiment.experiment.experiment_id)
+            experiment_id = self._resolve_experiment_id(experiment_name)
+            if experiment_id:
+                self.workspace_client.experiments.delete(experiment_id)
+                self._experiment_ids.invalidate(experiment_name)
+                self.invalidate_runs(experiment_name)
+                self.snapshot_store.delete(snapshot_key('runs', experiment_name))
                 return True
             return False
         except Exception as e:
             print(f"Error deleting experiment: {str(e)}")
             return False
     
+    def find_experiments(self, prefix):
+        """Names of experiments whose path starts with prefix, sorted.
+        
+        The prefix match is pushed down to search_experiments; the name -> ID
+        cache is warmed with the results.
+        """
+        try:
+            escaped = prefix.replace("'", "\\'")
+            experiments = list(self.workspace_client.experiments.search_experiments(filter=f"name LIKE '{escaped}%'"))
+            self._experiment_ids.update({exp.name: exp.experiment_id for exp in experiments})
+            return sorted(exp.name for exp in experiments if exp.name and exp.name.startswith(prefix))
+        except Exception as e:
+            print(f"Error searching experiments: {str(e)}")
+            return []
+    
+    def watch_experiments(self, experiment_names, interval=RUN_SNAPSHOT_MAX_AGE):
+        """Keep the run and logged-model caches of the current selection warm.
+        
+        The watched set is replaced by experiment_names (at most
+        WATCHED_EXPERIMENTS_MAX of them). A single background thread re-syncs
+        any watched experiment whose cache is older than interval seconds,
+        several at a time, so page loads are served from memory; the set is
+        dropped once it has not been viewed for WATCH_EXPIRY seconds.
+        """
+        now = time.monotonic()
+        with self._run_snapshots_lock:
+            self._watched_experiments = {name: now for name in list(dict.fromkeys(experiment_names))[:WATCHED_EXPERIMENTS_MAX]}
+            self._watch_interval = interval
+            if self._watch_thread is not None:
+                return
+            self._watch_thread = threading.Thread(target=self._refresh_watched_experiments, name='watch-experiments', daemon=True)
+        self._watch_thread.start()
+    
+    def unwatch_experiments(self, experiment_names=None):
+        """Stop keeping some (or all) experiments warm."""
+        with self._run_snapshots_lock:
+            if experiment_names is None:
+                self._watched_experiments.clear()
+            else:
+                for name in experiment_names:
+                    self._watched_experiments.pop(name, None)
+    
+    def _refresh_watched_experiments(self):
+        while True:
+            time.sleep(max(1, self._watch_interval / 2))
+            with self._run_snapshots_lock:
+                expired_before = time.monotonic() - WATCH_EXPIRY
+                self._watched_experiments = {name: viewed_at for name, viewed_at in self._watched_experiments.items()
+                                             if viewed_at >= expired_before}
+                names = list(self._watched_experiments)
+                interval = self._watch_interval
+            
+            def refresh(name):
+                try:
+                    snapshot = self.get_run_snapshot(name)
+                    if snapshot is None or not snapshot.is_fresh(interval):
+                        self.sync_runs(name, max_age=interval)
+                    frame = self._logged_models_frame(name)
+                    if frame.age is None or frame.age > LOGGED_MODELS_MAX_AGE:
+                        frame.refresh()
+                except Exception as e:
+                    print(f"Error refreshing experiment '{name}': {str(e)}")
+            
+            map_concurrently(refresh, names, max_workers=EXPERIMENT_FETCH_MAX_WORKERS)
+    
     def list_experiments(self, max_results=1000):
         """List experiments following the documented API."""
         try:
-            experiments = self.workspace_client.experiments.list_experiments()
-            return [exp for exp in experiments]
+            experiments = [exp for exp in self.workspace_client.experiments.list_experiments()]
+            # Warm the name -> ID cache with everything we just listed
+            self._experiment_ids.update({exp.name: exp.experiment_id for exp in experiments})
+            return experiments
         except Exception as e:
             print(f"Error listing experiments: {str(e)}")
             return []
     
-    def get_runs(self, experiment_name='/ML/mlflow_workshop/mlflow3-ml-example'):
-        """Fetch MLflow runs for a given experiment."""
-        try:
-            # Get experiment by name
-            experiment = self.workspace_client.experiments.get_by_name(experiment_name)
-            if experiment is None:
-                print(f"Experiment '{experiment_name}' not found")
-                return pd.DataFrame()
+    def _runs_to_frame(self, runs, columns=None):
+        """Flatten workspace-client Run objects into a runs DataFrame.
+        
+        When columns is given, only those metric_/param_ columns are built;
+        the standard run columns are always included.
+        """
+        wanted = set(columns) if columns is not None else None
+        runs_data = []
+        for run in runs:
+            run_info = {
+                'run_name': run.info.run_name,
+                'run_id': run.info.run_id,
+                'status': run.info.status.value if run.info.status else None,
+                'start_time': pd.to_datetime(run.info.start_time, unit='ms'),
+                'end_time': pd.to_datetime(run.info.end_time, unit='ms') if run.info.end_time else None
+            }
             
-            # Search runs for the experiment using the documented API
-            runs = self.workspace_client.experiments.search_runs(
-                experiment_ids=[experiment.experiment.experiment_id],
-                max_results=1000  # Adjust as needed
-            )
+            # Child runs of a sweep point at their parent through a tag
+            if hasattr(run, 'data') and hasattr(run.data, 'tags'):
+                for tag in run.data.tags or []:
+                    if tag.key == PARENT_RUN_TAG:
+                        run_info[PARENT_RUN_COLUMN] = tag.value
             
-            runs_data = []
-            for run in runs:
-                run_info = {
-                    'run_name': run.info.run_name,
-                    'run_id': run.info.run_id,
-                    'status': str(run.info.status) if run.info.status else None,
-                    'start_time': pd.to_datetime(run.info.start_time, unit='ms'),
-                    'end_time': pd.to_datetime(run.info.end_time, unit='ms') if run.info.end_time else None
-                }
-                
-                # Add metrics - following the documented API structure
-                if hasattr(run, 'data') and hasattr(run.data, 'metrics'):
-                    for metric in run.data.metrics:
-                        run_info[f'metric_{str(metric.key)}'] = metric.value
-                
-                # Add parameters - following the documented API structure
-                if hasattr(run, 'data') and hasattr(run.data, 'params'):
-                    for param in run.data.params:
-                        run_info[f'param_{str(param.key)}'] = param.value
-                
-                runs_data.append(run_info)
+            # Add metrics - following the documented API structure
+            if hasattr(run, 'data') and hasattr(run.data, 'metrics'):
+                for metric in run.data.metrics or []:
+                    column = f'metric_{str(metric.key)}'
+                    if wanted is None or column in wanted:
+                        run_info[column] = metric.value
             
-            return pd.DataFrame(runs_data)
+            # Add parameters - following the documented API structure
+            if hasattr(run, 'data') and hasattr(run.data, 'params'):
+                for param in run.data.params or []:
+                    column = f'param_{str(param.key)}'
+                    if wanted is None or column in wanted:
+                        run_info[column] = param.value
+            
+            runs_data.append(run_info)
+        
+        return compact_frame(pd.DataFrame(runs_data))
+    
+    def _search_runs(self, experiment_id, filter_string=None, order_by=None, max_results=None):
+        """Page through search_runs for one experiment, optionally filtered and ordered.
+        
+        With max_results, iteration stops once that many runs were read, so
+        no further pages are requested.
+        """
+        runs = self.workspace_client.experiments.search_runs(
+            experiment_ids=[experiment_id],
+            filter=filter_string,
+            order_by=list(order_by) if order_by else None,
+            max_results=min(max_results, SEARCH_RUNS_PAGE_SIZE) if max_results else SEARCH_RUNS_PAGE_SIZE
+        )
+        return itertools.islice(runs, max_results) if max_results else runs
+    
+    def _fetch_runs_frame(self, experiment_id, filter_string=None, order_by=None, columns=None, max_results=None):
+        """Search one experiment's runs into a runs DataFrame through the configured backend."""
+        if self.backend == 'rest':
+            return self.rest_client.search_runs_frame([experiment_id], filter_string, order_by, columns, max_results)
+        return self._runs_to_frame(self._search_runs(experiment_id, filter_string, order_by, max_results), columns)
+    
+    def _fetch_logged_models_table(self, experiment_ids, filter_string=None, order_by=None, columns=None,
+                                   max_results=None):
+        """Search logged models into a LoggedModelTable through the configured backend."""
+        if self.backend == 'rest':
+            return self.rest_client.search_logged_models_table(experiment_ids, filter_string, order_by, columns,
+                                                               max_results)
+        return collect_logged_models(self._fetch_logged_models(experiment_ids, filter_string, order_by, max_results),
+                                     columns)
+    
+    def _incremental_run_filters(self, snapshot):
+        """search_runs filters that together cover every run changed since the snapshot.
+        
+        MLflow filters cannot be OR-ed, so this returns one filter per case:
+        runs started after the start_time watermark, runs that ended since the
+        last sync, and (when the snapshot had any) runs that are still active
+        and may have logged new metrics.
+        """
+        synced_at_ms = int(snapshot.fetched_at * 1000) - RUN_SYNC_OVERLAP_MS
+        start_watermark = snapshot.start_time_watermark
+        filters = [
+            f"attributes.start_time >= {start_watermark - RUN_SYNC_OVERLAP_MS if start_watermark else synced_at_ms}",
+            f"attributes.end_time >= {synced_at_ms}",
+        ]
+        if snapshot.has_active_runs:
+            filters.append("attributes.status = 'RUNNING'")
+        return filters
+    
+    def _run_fetch_lock(self, experiment_name):
+        """Per-experiment lock so concurrent callers share one download."""
+        with self._run_snapshots_lock:
+            return self._run_fetch_locks.setdefault(experiment_name, threading.Lock())
+    
+    def _store_run_snapshot(self, snapshot):
+        with self._run_snapshots_lock:
+            self._run_snapshots[snapshot.experiment_name] = snapshot
+        self._workspace_unreachable = False
+        self.snapshot_store.save_async(
+            snapshot_key('runs', snapshot.experiment_name),
+            snapshot.runs_df,
+            experiment_name=snapshot.experiment_name,
+            fetched_at=snapshot.fetched_at,
+            full_fetched_at=snapshot.full_fetched_at
+        )
+        return snapshot
+    
+    def _load_run_snapshot(self, experiment_name):
+        """Load the persisted RunSnapshot for an experiment, at most once per process."""
+        with self._run_snapshots_lock:
+            if experiment_name in self._run_snapshots_checked:
+                return None
+            self._run_snapshots_checked.add(experiment_name)
+        loaded = self.snapshot_store.load(snapshot_key('runs', experiment_name))
+        if loaded is None:
+            return None
+        runs_df, metadata = loaded
+        snapshot = RunSnapshot(
+            experiment_name,
+            runs_df,
+            fetched_at=metadata.get('fetched_at'),
+            full_fetched_at=metadata.get('full_fetched_at'),
+            from_disk=True
+        )
+        with self._run_snapshots_lock:
+            return self._run_snapshots.setdefault(experiment_name, snapshot)
+    
+    def get_run_snapshot(self, experiment_name=DEFAULT_EXPERIMENT_NAME):
+        """Return the cached RunSnapshot for an experiment (any age), or None.
+        
+        Falls back to the snapshot persisted by a previous process.
+        """
+        with self._run_snapshots_lock:
+            snapshot = self._run_snapshots.get(experiment_name)
+        if snapshot is None:
+            snapshot = self._load_run_snapshot(experiment_name)
+        return snapshot
+    
+    def sync_runs_in_background(self, experiment_name=DEFAULT_EXPERIMENT_NAME):
+        """Start sync_runs on a daemon thread unless one is already running for the experiment."""
+        with self._run_snapshots_lock:
+            if experiment_name in self._background_run_syncs:
+                return
+            self._background_run_syncs.add(experiment_name)
+        
+        def run():
+            try:
+                self.sync_runs(experiment_name)
+            finally:
+                with self._run_snapshots_lock:
+                    self._background_run_syncs.discard(experiment_name)
+        
+        threading.Thread(target=run, name='sync-runs', daemon=True).start()
+    
+    def memory_report(self):
+        """Memory held by each cached frame, largest first.
+        
+        One row per cache entry with kind, name, rows, columns and bytes
+        (deep pandas footprint; raw array size for metric histories).
+        """
+        rows = []
+        with self._run_snapshots_lock:
+            snapshots = list(self._run_snapshots.values())
+            model_frames = list(self._logged_model_frames.items())
+        for snapshot in snapshots:
+            rows.append(('runs', snapshot.experiment_name, len(snapshot.runs_df), snapshot.runs_df.shape[1],
+                         frame_memory_bytes(snapshot.runs_df)))
+            if snapshot._hierarchy is not None:
+                children = snapshot._hierarchy.children
+                rows.append(('run_hierarchy', snapshot.experiment_name, len(children), children.shape[1],
+                             frame_memory_bytes(children) + frame_memory_bytes(snapshot._hierarchy.aggregates)))
+        for experiment_name, frame in model_frames:
+            df = frame.df
+            if df is not None:
+                rows.append(('logged_models', experiment_name, len(df), df.shape[1], frame_memory_bytes(df)))
+        series, points, history_bytes = self._metric_histories.footprint()
+        rows.append(('metric_history', f"{series} series", points, 2, history_bytes))
+        
+        report = pd.DataFrame(rows, columns=['kind', 'name', 'rows', 'columns', 'bytes'])
+        report['mb'] = (report['bytes'] / 1e6).round(2)
+        return report.sort_values('bytes', ascending=False, kind='stable').reset_index(drop=True)
+    
+    def is_degraded(self):
+        """True while the workspace is unreachable and persisted snapshots are being served."""
+        return self._workspace_unreachable or any(
+            frame.degraded for frame in list(self._logged_model_frames.values()))
+    
+    def _download_runs(self, experiment_name):
+        """Download every run and replace the snapshot. Caller holds the fetch lock."""
+        started_at = time.time()
+        try:
+            experiment_id = self._resolve_experiment_id(experiment_name)
+            if experiment_id is None:
+                print(f"Experiment '{experiment_name}' not found")
+                return None
+            runs_df = self._fetch_runs_frame(experiment_id)
         except Exception as e:
             print(f"Error fetching MLflow runs: {str(e)}")
+            self._workspace_unreachable = True
+            return None
+        return self._store_run_snapshot(RunSnapshot(experiment_name, runs_df, fetched_at=started_at))
+    
+    def _sync_runs_incremental(self, snapshot):
+        """Fetch runs changed since the snapshot and merge them in. Caller holds the fetch lock."""
+        started_at = time.time()
+        try:
+            experiment_id = self._resolve_experiment_id(snapshot.experiment_name)
+            if experiment_id is None:
+                print(f"Experiment '{snapshot.experiment_name}' not found")
+                return None
+            frames = [self._fetch_runs_frame(experiment_id, filter_string)
+                      for filter_string in self._incremental_run_filters(snapshot)]
+            changed_df = compact_frame(pd.concat(frames, ignore_index=True, sort=False))
+        except Exception as e:
+            print(f"Error syncing MLflow runs: {str(e)}")
+            self._workspace_unreachable = True
+            return None
+        
+        return self._store_run_snapshot(snapshot.merged(changed_df, started_at))
+    
+    def refresh_runs(self, experiment_name=DEFAULT_EXPERIMENT_NAME):
+        """Download all runs and replace the snapshot. Returns the new snapshot, or None on failure."""
+        with self._run_fetch_lock(experiment_name):
+            return self._download_runs(experiment_name)
+    
+    def sync_runs(self, experiment_name=DEFAULT_EXPERIMENT_NAME, max_age=None):
+        """Bring the run snapshot up to date, downloading only what changed.
+        
+        Falls back to a full download when there is no snapshot yet or the
+        last full download is older than RUN_FULL_REFRESH_INTERVAL. If
+        max_age is given and another caller synced within that window while
+        we waited, its snapshot is returned as is. Returns None on failure.
+        """
+        with self._run_fetch_lock(experiment_name):
+            snapshot = self.get_run_snapshot(experiment_name)
+            if snapshot is not None and snapshot.is_fresh(max_age):
+                return snapshot
+            if snapshot is None or time.time() - snapshot.full_fetched_at > RUN_FULL_REFRESH_INTERVAL:
+                return self._download_runs(experiment_name)
+            return self._sync_runs_incremental(snapshot)
+    
+    def invalidate_runs(self, experiment_name=None):
+        """Drop the run snapshot for one experiment, or for all of them."""
+        with self._run_snapshots_lock:
+            if experiment_name is None:
+                self._run_snapshots.clear()
+            else:
+                self._run_snapshots.pop(experiment_name, None)
+    
+    def query_runs(self, experiment_name=DEFAULT_EXPERIMENT_NAME, filter_string=None, order_by=None,
+                   columns=None, max_results=None):
+        """Run a filtered/ordered search_runs query directly, bypassing the snapshot.
+        
+        filter_string and order_by use MLflow search syntax, e.g.
+        "metrics.val_rmse < 1 and attributes.status = 'FINISHED'" and
+        ["metrics.val_rmse ASC"]. columns limits the metric_/param_ columns
+        that are built and max_results caps the number of runs read.
+        """
+        try:
+            experiment_id = self._resolve_experiment_id(experiment_name)
+            if experiment_id is None:
+                print(f"Experiment '{experiment_name}' not found")
+                return pd.DataFrame()
+            return self._fetch_runs_frame(experiment_id, filter_string, order_by, columns, max_results)
+        except Exception as e:
+            print(f"Error querying MLflow runs: {str(e)}")
             return pd.DataFrame()
     
+    def get_runs(self, experiment_name=DEFAULT_EXPERIMENT_NAME, max_age=RUN_SNAPSHOT_MAX_AGE,
+                 filter_string=None, order_by=None, columns=None, max_results=None):
+        """Fetch MLflow runs for a given experiment.
+        
+        Served from the run snapshot while it is younger than max_age seconds;
+        otherwise the snapshot is synced incrementally (pass max_age=0 to
+        force a sync). If syncing fails, the last snapshot (however old) is
+        returned instead.
+        
+        On a cold start the snapshot persisted by the previous process is
+        returned immediately and synced in the background.
+        
+        Passing filter_string, order_by or max_results pushes the query down
+        to search_runs instead (see query_runs). columns alone is applied to
+        the snapshot.
+        """
+        if filter_string or order_by or max_results:
+            return self.query_runs(experiment_name, filter_string, order_by, columns, max_results)
+        
+        snapshot = self.get_run_snapshot(experiment_name)
+        if snapshot is not None and snapshot.is_fresh(max_age):
+            return project_columns(snapshot.runs_df, columns)
+        
+        # Persisted data from a previous process is served at once while it refreshes
+        if snapshot is not None and snapshot.from_disk and max_age:
+            self.sync_runs_in_background(experiment_name)
+            return project_columns(snapshot.runs_df, columns)
+        
+        synced = self.sync_runs(experiment_name, max_age=max_age)
+        if synced is not None:
+            return project_columns(synced.runs_df, columns)
+        
+        if snapshot is not None:
+            print(f"Serving stale runs for '{experiment_name}' ({snapshot.age:.0f}s old)")
+            return project_columns(snapshot.runs_df, columns)
+        return pd.DataFrame()
+    
     def create_run(self, experiment_name, run_name=None, tags=None):
         """Create a new run following the documented API."""
         try:
-            experiment = self.workspace_client.experiments.get_by_name(experiment_name)
-            if experiment is None:
+            experiment_id = self._resolve_experiment_id(experiment_name)
+            if experiment_id is None:
                 print(f"Experiment '{experiment_name}' not found")
                 return None
             
             run = self.workspace_client.experiments.create_run(
-                experiment_id=experiment.experiment.experiment_id,
+                experiment_id=experiment_id,
                 start_time=int(pd.Timestamp.now().timestamp() * 1000),
                 run_name=run_name,
                 tags=tags or []
@@ -134,6 +1053,24 @@ class MLflowWorkspaceService:
             print(f"Error getting run: {str(e)}")
             return None
     
+    def get_run_details(self, run_id, max_age=None):
+        """Params, metrics and tags of one run for the detail panel, or None on error.
+        
+        Fetched with get_run on first use and cached per run (LRU), so the
+        runs grid can stay narrow and only expanded runs cost a request.
+        Pass max_age=0 to re-fetch.
+        """
+        if max_age != 0:
+            details = self._run_details.get(run_id, max_age)
+            if details is not None:
+                return details
+        response = self.get_run(run_id)
+        if response is None:
+            return None
+        details = run_details_from_run(response.run)
+        self._run_details.put(run_id, details)
+        return details
+    
     def update_run(self, run_id, status=None, end_time=None):
         """Update a run following the documented API."""
         try:
@@ -145,6 +1082,7 @@ class MLflowWorkspaceService:
             
             if update_data:
                 self.workspace_client.experiments.update_run(run_id, **update_data)
+                self._run_details.invalidate(run_id)
             return True
         except Exception as e:
             print(f"Error updating run: {str(e)}")
@@ -163,6 +1101,7 @@ class MLflowWorkspaceService:
                 metric_data['timestamp'] = int(pd.Timestamp(timestamp).timestamp() * 1000)
             
             self.workspace_client.experiments.log_metric(run_id, **metric_data)
+            self._run_details.invalidate(run_id)
             return True
         except Exception as e:
             print(f"Error logging metric: {str(e)}")
@@ -172,11 +1111,23 @@ class MLflowWorkspaceService:
         """Log a parameter to a run following the documented API."""
         try:
             self.workspace_client.experiments.log_parameter(run_id, key=key, value=value)
+            self._run_details.invalidate(run_id)
             return True
         except Exception as e:
             print(f"Error logging parameter: {str(e)}")
             return False
     
+    def batch_logger(self, **options):
+        """Create a BatchLogger that sends metrics, params and tags through log_batch.
+        
+        Prefer this over log_metric/log_param in training loops; close it
+        (or use it as a context manager) to send the final batch. options
+        (flush_interval, max_queue_size) are passed to BatchLogger.
+        """
+        from mlflow_batch_logger import BatchLogger
+        
+        return BatchLogger(self.workspace_client, **options)
+    
     def get_metrics_columns(self, runs_df):
         """Get list of metric columns from runs dataframe."""
         return [col for col in runs_df.columns if col.startswith('metric_')]
@@ -185,185 +1136,475 @@ class MLflowWorkspaceService:
         """Get list of parameter columns from runs dataframe."""
         return [col for col in runs_df.columns if col.startswith('param_')]
     
-    def prepare_metrics_plot_data(self, runs_df):
-        """Prepare data for metrics timeline visualization."""
+    def prepare_metrics_plot_data(self, runs_df=None, experiment_name=DEFAULT_EXPERIMENT_NAME):
+        """Prepare data for metrics timeline visualization (latest value of each metric per run).
+        
+        Uses the shared run snapshot when no runs_df is passed in. For
+        per-step curves use get_metric_history.
+        """
+        if runs_df is None:
+            runs_df = self.get_runs(experiment_name)
         metric_cols = self.get_metrics_columns(runs_df)
         
         if not metric_cols:
             return pd.DataFrame()
         
-        plot_data = []
-        for _, row in runs_df.iterrows():
-            for metric_col in metric_cols:
-                if pd.notna(row[metric_col]):
-                    plot_data.append({
-                        'start_time': row['start_time'],
-                        'metric_name': metric_col.replace('metric_', ''),
-                        'metric_value': row[metric_col],
-                        'run_name': row['run_name'],
-                        'run_id': row['run_id']
-                    })
+        plot_data = runs_df.melt(
+            id_vars=['start_time', 'run_name', 'run_id'],
+            value_vars=metric_cols,
+            var_name='metric_name',
+            value_name='metric_value'
+        ).dropna(subset=['metric_value'])
+        plot_data['metric_name'] = plot_data['metric_name'].str.replace('metric_', '', n=1)
+        return plot_data[['start_time', 'metric_name', 'metric_value', 'run_name', 'run_id']].reset_index(drop=True)
+    
+    def _fetch_metric_history(self, run_id, metric_key):
+        """Download every logged step of one metric for one run, sorted by step."""
+        history = self.workspace_client.experiments.get_history(
+            metric_key=metric_key,
+            run_id=run_id,
+            max_results=METRIC_HISTORY_PAGE_SIZE
+        )
+        points = [(metric.step or 0, metric.value) for metric in history if metric.value is not None]
+        if not points:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+        steps = np.fromiter((p[0] for p in points), dtype=np.int64, count=len(points))
+        values = np.fromiter((p[1] for p in points), dtype=np.float64, count=len(points))
+        order = np.argsort(steps, kind='stable')
+        return steps[order], values[order]
+    
+    def load_metric_histories(self, run_ids, metric_keys, max_age=METRIC_HISTORY_MAX_AGE):
+        """Make sure every (run, metric) history is cached, fetching missing ones concurrently.
         
-        return pd.DataFrame(plot_data)
+        Returns {(run_id, metric_key): (steps, values)}; series that could
+        not be fetched are left out.
+        """
+        pairs = [(run_id, metric_key) for run_id in run_ids for metric_key in metric_keys]
+        histories = {}
+        missing = []
+        for run_id, metric_key in pairs:
+            cached = self._metric_histories.get(run_id, metric_key, max_age)
+            if cached is None:
+                missing.append((run_id, metric_key))
+            else:
+                histories[(run_id, metric_key)] = cached
+        
+        def fetch(pair):
+            try:
+                steps, values = self._fetch_metric_history(*pair)
+            except Exception as e:
+                print(f"Error fetching history of '{pair[1]}' for run {pair[0]}: {str(e)}")
+                return pair, None
+            self._metric_histories.put(pair[0], pair[1], steps, values)
+            return pair, (steps, values)
+        
+        for pair, history in map_concurrently(fetch, missing, max_workers=METRIC_HISTORY_MAX_WORKERS):
+            if history is not None:
+                histories[pair] = history
+        return histories
     
-    def get_experiment_summary(self, experiment_name='/ML/mlflow_workshop/mlflow3-ml-example'):
-        """Get summary statistics for an experiment."""
-        runs_df = self.get_runs(experiment_name)
+    def get_metric_history(self, run_ids, metric_keys, max_points=METRIC_HISTORY_MAX_POINTS, method='lttb',
+                           max_age=METRIC_HISTORY_MAX_AGE):
+        """Per-step metric histories for the given runs, downsampled for plotting.
         
-        if runs_df.empty:
-            return {
-                'total_runs': 0,
-                'completed_runs': 0,
-                'failed_runs': 0,
-                'running_runs': 0,
-                'experiment_name': experiment_name
-            }
+        Returns a long DataFrame (run_id, metric_name, step, value) with at
+        most max_points points per series, chosen by LTTB ('lttb') or
+        per-bucket min/max ('minmax'). Pass max_points=None for full
+        resolution.
+        """
+        if isinstance(run_ids, str):
+            run_ids = [run_ids]
+        if isinstance(metric_keys, str):
+            metric_keys = [metric_keys]
+        histories = self.load_metric_histories(run_ids, metric_keys, max_age=max_age)
         
-        summary = {
-            'total_runs': len(runs_df),
-            'completed_runs': len(runs_df[runs_df['status'] == 'FINISHED']),
-            'failed_runs': len(runs_df[runs_df['status'] == 'FAILED']),
-            'running_runs': len(runs_df[runs_df['status'] == 'RUNNING']),
-            'experiment_name': experiment_name,
-            'date_range': {
-                'start': runs_df['start_time'].min(),
-                'end': runs_df['start_time'].max()
-            }
+        frames = []
+        for (run_id, metric_key), (steps, values) in histories.items():
+            if max_points:
+                keep = downsample_indices(steps, values, max_points, method)
+                steps, values = steps[keep], values[keep]
+            frames.append(pd.DataFrame({
+                'run_id': run_id,
+                'metric_name': metric_key,
+                'step': steps,
+                'value': values
+            }))
+        if not frames:
+            return pd.DataFrame(columns=['run_id', 'metric_name', 'step', 'value'])
+        return pd.concat(frames, ignore_index=True)
+    
+    def _runs_by_id(self, run_ids):
+        """One row per run ID, in the given order, from the cached snapshots; runs not cached are fetched with get_run."""
+        with self._run_snapshots_lock:
+            snapshots = list(self._run_snapshots.values())
+        frames = [snapshot.runs_df[snapshot.runs_df['run_id'].isin(run_ids)] for snapshot in snapshots
+                  if not snapshot.runs_df.empty]
+        found = set().union(*(frame['run_id'] for frame in frames)) if frames else set()
+        missing = [run_id for run_id in run_ids if run_id not in found]
+        if missing:
+            responses = map_concurrently(self.get_run, missing, max_workers=METRIC_HISTORY_MAX_WORKERS)
+            frames.append(self._runs_to_frame([response.run for response in responses if response is not None]))
+        frames = [frame for frame in frames if not frame.empty]
+        if not frames:
+            return pd.DataFrame(columns=RUN_STANDARD_COLUMNS)
+        runs_df = pd.concat(frames, ignore_index=True, sort=False).drop_duplicates('run_id')
+        return runs_df.set_index('run_id').reindex([run_id for run_id in run_ids if run_id in set(runs_df['run_id'])]).reset_index()
+    
+    def compare_runs(self, run_ids, baseline_run_id=None, metric_keys=None, history_keys=None,
+                     max_points=METRIC_HISTORY_MAX_POINTS):
+        """Compare runs side by side in one pass over the cached snapshots.
+        
+        Returns a dict with:
+          runs: the standard columns of each run, in the given order
+          params: only the params whose values differ (key x run_id)
+          metrics: latest metric values (key x run_id), optionally limited to metric_keys
+          deltas / relative_deltas: metrics minus (or relative to) the baseline run
+          histories: the downsampled histories of history_keys, aligned on step
+                     (step x (metric_name, run_id); NaN where a run has no point)
+          baseline_run_id: the baseline used (the first run by default)
+        """
+        run_ids = list(dict.fromkeys(run_ids))
+        runs_df = self._runs_by_id(run_ids)
+        params, metrics, deltas, relative_deltas, baseline_run_id = compare_run_frame(runs_df, baseline_run_id, metric_keys)
+        
+        histories = pd.DataFrame()
+        if history_keys:
+            history = self.get_metric_history(list(runs_df['run_id']), history_keys, max_points=max_points)
+            if not history.empty:
+                histories = history.pivot_table(index='step', columns=['metric_name', 'run_id'], values='value', aggfunc='last')
+        
+        return {
+            'runs': runs_df[[col for col in RUN_STANDARD_COLUMNS if col in runs_df.columns]],
+            'params': params,
+            'metrics': metrics,
+            'deltas': deltas,
+            'relative_deltas': relative_deltas,
+            'histories': histories,
+            'baseline_run_id': baseline_run_id
         }
+    
+    def discover_run_columns(self, experiment_name=DEFAULT_EXPERIMENT_NAME):
+        """metric_ and param_ column names available for an experiment's runs.
         
-        return summary
+        Uses the cached snapshot's columns when there is one. Otherwise only
+        the keys of the KEY_DISCOVERY_SAMPLE_SIZE most recent runs are read,
+        without building a frame. Returns metric columns first, each group
+        sorted.
+        """
+        snapshot = self.get_run_snapshot(experiment_name)
+        if snapshot is not None:
+            return sorted(self.get_metrics_columns(snapshot.runs_df)) + sorted(self.get_parameters_columns(snapshot.runs_df))
+        try:
+            experiment_id = self._resolve_experiment_id(experiment_name)
+            if experiment_id is None:
+                return []
+            metrics, params = set(), set()
+            for run in self._search_runs(experiment_id, order_by=['attributes.start_time DESC'],
+                                         max_results=KEY_DISCOVERY_SAMPLE_SIZE):
+                data = getattr(run, 'data', None)
+                metrics.update(f'metric_{metric.key}' for metric in getattr(data, 'metrics', None) or [])
+                params.update(f'param_{param.key}' for param in getattr(data, 'params', None) or [])
+            return sorted(metrics) + sorted(params)
+        except Exception as e:
+            print(f"Error discovering run columns: {str(e)}")
+            return []
     
-    def get_logged_models(self):
-        """Get all logged models from MLflow using search_logged_models API."""
+    def discover_logged_model_columns(self, experiment_name=DEFAULT_EXPERIMENT_NAME):
+        """Metric and param_ column names available for an experiment's logged models.
+        
+        Uses the cached frame's columns when there is one; otherwise only the
+        keys of the first KEY_DISCOVERY_SAMPLE_SIZE models are read.
+        """
+        frame = self._logged_models_frame(experiment_name)
+        if frame.df is not None:
+            return [col for col in frame.df.columns if col not in LOGGED_MODEL_STANDARD_COLUMNS]
         try:
-            # Get the experiment ID for the default experiment
-            experiment = self.workspace_client.experiments.get_by_name('/ML/mlflow_workshop/mlflow3-ml-example')
-            if experiment is None:
-                print("Default experiment not found")
-                return pd.DataFrame()
-            
-            experiment_id = experiment.experiment.experiment_id
-            
-            # Use the search_logged_models API as documented in the Databricks SDK
+            experiment_ids = self._resolve_experiment_ids(experiment_name)
+            if not experiment_ids:
+                return []
+            metrics, params = set(), set()
+            for model in self._fetch_logged_models(experiment_ids, max_results=KEY_DISCOVERY_SAMPLE_SIZE):
+                data = getattr(model, 'data', None) or model.info
+                metrics.update(logged_model_metric_column(getattr(metric, 'dataset_name', None), metric.key)
+                               for metric in getattr(data, 'metrics', None) or [])
+                params.update(f'param_{param.key}' for param in getattr(data, 'params', None) or [])
+            return sorted(metrics) + sorted(params)
+        except Exception as e:
+            print(f"Error discovering logged model columns: {str(e)}")
+            return []
+    
+    def get_run_hierarchy(self, experiment_name=DEFAULT_EXPERIMENT_NAME, max_age=RUN_SNAPSHOT_MAX_AGE):
+        """RunHierarchy (parent runs, their children and per-parent aggregates) of an experiment, or None.
+        
+        Served from the run snapshot, syncing it first when older than max_age.
+        """
+        self.get_runs(experiment_name, max_age=max_age)
+        snapshot = self.get_run_snapshot(experiment_name)
+        return snapshot.hierarchy if snapshot is not None else None
+    
+    def get_runs_for_experiments(self, experiment_names, max_age=RUN_SNAPSHOT_MAX_AGE, columns=None):
+        """Runs of several experiments, each served from its own snapshot.
+        
+        Stale snapshots are synced concurrently on a bounded pool, so the
+        call costs about as much as the slowest experiment. The result has
+        an experiment_name column in front.
+        """
+        names = list(experiment_names)
+        frames = map_concurrently(
+            lambda name: self.get_runs(name, max_age=max_age, columns=columns),
+            names,
+            max_workers=EXPERIMENT_FETCH_MAX_WORKERS
+        )
+        return concat_experiment_frames(names, frames)
+    
+    def get_experiment_summary(self, experiment_name=DEFAULT_EXPERIMENT_NAME, max_age=RUN_SNAPSHOT_MAX_AGE):
+        """Get summary statistics for an experiment.
+        
+        Computed from the run snapshot; only downloads runs when the snapshot
+        is missing or older than max_age.
+        """
+        return summarize_runs(self.get_runs(experiment_name, max_age=max_age), experiment_name)
+    
+    def _iter_logged_model_pages(self, experiment_ids, filter_string=None, order_by=None, max_results=None):
+        """Yield pages of LoggedModel objects, following next_page_token until exhausted."""
+        page_token = None
+        remaining = max_results
+        while True:
             # This returns a SearchLoggedModelsResponse object
-            logged_models_response = self.workspace_client.experiments.search_logged_models(
-                experiment_ids=[experiment_id],
-                max_results=10 #don't chane this to 1000...it creates an error
+            response = self.workspace_client.experiments.search_logged_models(
+                experiment_ids=list(experiment_ids),
+                filter=filter_string,
+                order_by=parse_logged_models_order_by(order_by),
+                max_results=min(remaining, LOGGED_MODELS_PAGE_SIZE) if remaining else LOGGED_MODELS_PAGE_SIZE,
+                page_token=page_token
             )
-   
-            
-            models_data = []
-            all_metric_names = set()
-            all_param_names = set()
-            all_dataset_names = set()
-            dataset_metric_combinations = set()
-            
-            # First pass: collect all metric names, parameter names, dataset names
-            # SearchLoggedModelsResponse has a 'logged_models' attribute containing LoggedModelInfo objects
-            for model in logged_models_response.models: #do't change this to logged_models...it creates an error
-                # Access model.info to get the actual model information
-                model_info = model.info
-                
-                # Debug: Print model structure
-                
-                
-                # Collect metric names and dataset names
-                if hasattr(model_info, 'metrics') and model_info.metrics:
-                    print(f"DEBUG: Found metrics: {len(model_info.metrics)}")
-                    for metric in model_info.metrics:
-                        if hasattr(metric, 'key'):
-                            metric_key = str(metric.key)
-                            all_metric_names.add(metric_key)
-                            dataset_name = getattr(metric, 'dataset_name', None)
-                            if dataset_name:
-                                all_dataset_names.add(dataset_name)
-                                dataset_metric_combinations.add((dataset_name, metric_key))
-                            else:
-                                dataset_metric_combinations.add((None, metric_key))
-                
-                    
-                
-                # Collect parameter names
-                if hasattr(model_info, 'parameters') and model_info.parameters:
-                    print(f"DEBUG: Found parameters: {len(model_info.parameters)}")
-                    for param in model_info.parameters:
-                        if hasattr(param, 'key'):
-                            all_param_names.add(str(param.key))
-                
-            
-            
-            
-            # Second pass: create data with only existing metric-dataset combinations as columns
-            for model in logged_models_response.models:  #don't change this to logged_models...it creates an error
-                # Access model.info to get the actual model information
-                model_info_obj = model.info
-                
-                # LoggedModelInfo object has these attributes according to the documentation
-                model_info = {
-                    'model_id': getattr(model_info_obj, 'model_id', None),
-                    'model_name': getattr(model_info_obj, 'name', None),
-                    'catalog_name': 'mlflow',  # Since we're using MLflow experiments
-                    'schema_name': 'logged_models',
-                    'creation_timestamp': pd.to_datetime(getattr(model_info_obj, 'creation_timestamp', None), unit='ms') if getattr(model_info_obj, 'creation_timestamp', None) else None,
-                    'last_updated_timestamp': pd.to_datetime(getattr(model_info_obj, 'last_updated_timestamp', None), unit='ms') if getattr(model_info_obj, 'last_updated_timestamp', None) else None,
-                    'user_id': getattr(model_info_obj, 'user_id', None),
-                    'description': getattr(model_info_obj, 'description', '') or ''
-                }
-                
-            
-                
-                # Add metric columns organized by dataset
-                metrics_by_dataset = {}
-                if hasattr(model_info_obj, 'metrics') and model_info_obj.metrics:
-                    for metric in model_info_obj.metrics:
-                        if hasattr(metric, 'key') and hasattr(metric, 'value'):
-                            metric_key = str(metric.key)
-                            dataset_name = getattr(metric, 'dataset_name', None)
-                            if dataset_name not in metrics_by_dataset:
-                                metrics_by_dataset[dataset_name] = {}
-                            metrics_by_dataset[dataset_name][metric_key] = metric.value
-                
-                # Create columns only for existing metric-dataset combinations
-                for dataset_name, metric_name in sorted(dataset_metric_combinations, key=lambda x: (x[0] or '', x[1])):
-                    if dataset_name is None:
-                        # General metric (no dataset)
-                        column_name = metric_name
-                        model_info[column_name] = metrics_by_dataset.get(None, {}).get(metric_name, None)
-                    else:
-                        # Dataset-specific metric
-                        column_name = f"{dataset_name}_{metric_name}"
-                        model_info[column_name] = metrics_by_dataset.get(dataset_name, {}).get(metric_name, None)
-                
-                # Add parameter columns
-                params_dict = {}
-                if hasattr(model_info_obj, 'parameters') and model_info_obj.parameters:
-                    for param in model_info_obj.parameters:
-                        if hasattr(param, 'key') and hasattr(param, 'value'):
-                            param_key = str(param.key)
-                            params_dict[param_key] = param.value
-                
-                # Add all parameter columns (with None for missing values)
-                for param_name in all_param_names:
-                    model_info[f'param_{param_name}'] = params_dict.get(param_name, None)
-                
-                models_data.append(model_info)
+            models = response.models or []  # don't change this to logged_models...it creates an error
+            if remaining:
+                models = models[:remaining]
+                remaining -= len(models)
+            yield models
             
-            result_df = pd.DataFrame(models_data)
-           
+            page_token = response.next_page_token
+            if not page_token or not models or remaining == 0:
+                return
+    
+    def _fetch_logged_models(self, experiment_ids, filter_string=None, order_by=None, max_results=None):
+        """Fetch every logged model for the given experiment IDs.
+        
+        Each experiment is paged on its own stream, with the next page
+        prefetched while the current one is collected, and the streams run
+        concurrently on a bounded pool. Ordered queries stay a single stream
+        so the server's ordering is global across experiments.
+        """
+        if order_by or len(experiment_ids) == 1:
+            streams = [list(experiment_ids)]
+        else:
+            streams = [[experiment_id] for experiment_id in experiment_ids]
+        
+        def fetch_stream(stream_experiment_ids):
+            models = []
+            for page in prefetch(self._iter_logged_model_pages(stream_experiment_ids, filter_string, order_by, max_results)):
+                models.extend(page)
+            return models
+        
+        pages = map_concurrently(fetch_stream, streams, max_workers=LOGGED_MODELS_MAX_WORKERS)
+        models = [model for stream_models in pages for model in stream_models]
+        return models[:max_results] if max_results else models
+    
+    def _resolve_experiment_ids(self, experiment_names):
+        """Resolve one name or a list of names, skipping (and reporting) missing experiments."""
+        if isinstance(experiment_names, str):
+            experiment_names = [experiment_names]
+        experiment_ids = []
+        for name in experiment_names:
+            experiment_id = self._resolve_experiment_id(name)
+            if experiment_id is None:
+                print(f"Experiment '{name}' not found")
+            else:
+                experiment_ids.append(experiment_id)
+        return experiment_ids
+    
+    def get_logged_models_table(self, experiment_name=DEFAULT_EXPERIMENT_NAME, filter_string=None, order_by=None,
+                                columns=None, max_results=None):
+        """Get logged models in long format (see LoggedModelTable), or None on error.
+        
+        Takes the same arguments as get_logged_models. Use this for
+        experiments with thousands of distinct metrics, where the wide frame
+        would be mostly nulls.
+        """
+        try:
+            experiment_ids = self._resolve_experiment_ids(experiment_name)
+            if not experiment_ids:
+                return collect_logged_models([])
+            return self._fetch_logged_models_table(experiment_ids, filter_string, order_by, columns, max_results)
+        except Exception as e:
+            print(f"Error fetching logged models: {str(e)}")
+            return None
+    
+    def _logged_models_frame(self, experiment_name):
+        """PersistentFrame holding the unfiltered logged models of one experiment."""
+        with self._run_snapshots_lock:
+            frame = self._logged_model_frames.get(experiment_name)
+            if frame is None:
+                def load():
+                    experiment_ids = self._resolve_experiment_ids(experiment_name)
+                    if not experiment_ids:
+                        return pd.DataFrame()
+                    return wide_logged_models(self._fetch_logged_models_table(experiment_ids))
+                frame = PersistentFrame(
+                    self.snapshot_store,
+                    snapshot_key('logged_models', experiment_name),
+                    load,
+                    LOGGED_MODELS_MAX_AGE,
+                    experiment_name=experiment_name
+                )
+                self._logged_model_frames[experiment_name] = frame
+            return frame
+    
+    def get_logged_models(self, experiment_name=DEFAULT_EXPERIMENT_NAME, filter_string=None, order_by=None,
+                          columns=None, max_results=None, sparse=False, max_age=LOGGED_MODELS_MAX_AGE):
+        """Get all logged models from MLflow using search_logged_models API.
+        
+        experiment_name may be a single name or a list of names; every page
+        of every experiment is fetched. filter_string and order_by are
+        pushed down to search_logged_models, e.g. "metrics.val_rmse < 1" and
+        ["metrics.val_rmse ASC"]. columns limits which metric and param_
+        columns are built and max_results caps the number of models returned.
+        With sparse=True the metric columns use a pandas SparseDtype.
+        
+        The plain, unfiltered query is cached per experiment for max_age
+        seconds (pass 0 to re-fetch) and persisted locally, so it survives
+        restarts and outages; columns is then applied to the cached frame.
+        For several experiments the caches are read concurrently and the
+        result gains an experiment_name column.
+        """
+        if not (filter_string or order_by or max_results or sparse):
+            if isinstance(experiment_name, str):
+                models_df = self._logged_models_frame(experiment_name).get(max_age)
+                return project_columns(models_df, columns, LOGGED_MODEL_STANDARD_COLUMNS)
+            names = list(experiment_name)
+            frames = map_concurrently(
+                lambda name: project_columns(self._logged_models_frame(name).get(max_age), columns,
+                                             LOGGED_MODEL_STANDARD_COLUMNS),
+                names,
+                max_workers=EXPERIMENT_FETCH_MAX_WORKERS
+            )
+            return concat_experiment_frames(names, frames)
+        
+        try:
+            experiment_ids = self._resolve_experiment_ids(experiment_name)
+            if not experiment_ids:
+                return pd.DataFrame()
             
-            return result_df
-                
+            table = self._fetch_logged_models_table(experiment_ids, filter_string, order_by, columns, max_results)
+            return wide_logged_models(table, sparse=sparse)
         except Exception as e:
             print(f"Error fetching logged models: {str(e)}")
             return pd.DataFrame()
     
+    def iter_run_frames(self, experiment_name=DEFAULT_EXPERIMENT_NAME, filter_string=None, columns=None):
+        """Yield runs matching filter_string one search_runs page at a time, as DataFrames.
+        
+        Only the standard columns and the requested metric_/param_ columns
+        are built, and no page is kept after it has been yielded.
+        """
+        experiment_id = self._resolve_experiment_id(experiment_name)
+        if experiment_id is None:
+            print(f"Experiment '{experiment_name}' not found")
+            return
+        runs = iter(self._search_runs(experiment_id, filter_string))
+        for page in prefetch(iter(lambda: list(itertools.islice(runs, SEARCH_RUNS_PAGE_SIZE)), [])):
+            yield self._runs_to_frame(page, columns)
+    
+    def iter_logged_model_frames(self, experiment_name=DEFAULT_EXPERIMENT_NAME, filter_string=None):
+        """Yield logged models matching filter_string one search_logged_models page at a time, as wide DataFrames."""
+        experiment_ids = self._resolve_experiment_ids(experiment_name)
+        if not experiment_ids:
+            return
+        for page in prefetch(self._iter_logged_model_pages(experiment_ids, filter_string)):
+            yield collect_logged_models(page).to_wide()
+    
+    def get_leaderboard(self, metric, experiment_name=DEFAULT_EXPERIMENT_NAME, source='runs', k=10,
+                        higher_is_better=False, pareto_metrics=None, pareto_higher_is_better=None,
+                        group_by=None, filter_string=None, max_age=RUN_SNAPSHOT_MAX_AGE):
+        """Top-k rows, Pareto front and per-group ranking for a metric (see utils.leaderboard).
+        
+        source is 'runs' (metric is a metric_ column) or 'models' (a wide
+        logged-model column such as 'val_rmse'); experiment_name may be a
+        list of experiments. Without a filter the cached
+        snapshot is ranked in place; with one, matching rows are streamed
+        page by page so only the current candidates are held in memory.
+        
+        Returns a dict of DataFrames with keys 'top', 'pareto' and 'groups'.
+        """
+        board = StreamingLeaderboard(metric, k, higher_is_better, pareto_metrics, pareto_higher_is_better, group_by)
+        names = [experiment_name] if isinstance(experiment_name, str) else list(experiment_name)
+        try:
+            if source == 'models' and filter_string:
+                frames = itertools.chain.from_iterable(
+                    self.iter_logged_model_frames(name, filter_string) for name in names)
+            elif source == 'models':
+                frames = [self.get_logged_models(experiment_name, max_age=max_age)]
+            elif filter_string:
+                group_columns = [group_by] if isinstance(group_by, str) else list(group_by or [])
+                columns = [metric, *(pareto_metrics or []), *group_columns]
+                frames = itertools.chain.from_iterable(
+                    self.iter_run_frames(name, filter_string, columns) for name in names)
+            elif len(names) == 1:
+                frames = [self.get_runs(names[0], max_age=max_age)]
+            else:
+                frames = [self.get_runs_for_experiments(names, max_age=max_age)]
+            for frame in frames:
+                board.update(frame)
+        except Exception as e:
+            print(f"Error building leaderboard for '{metric}': {str(e)}")
+        return board.result()
+    
+    def get_model_links(self, experiment_name=DEFAULT_EXPERIMENT_NAME):
+        """RunModelLinks joining an experiment's logged models to their source runs.
+        
+        Both sides come from the caches (run snapshot and logged-model
+        frame). Only what changed since the last call is re-joined: models
+        refreshed in the frame, and runs an incremental sync brought in.
+        """
+        self.get_runs(experiment_name)
+        snapshot = self.get_run_snapshot(experiment_name)
+        frame = self._logged_models_frame(experiment_name)
+        models_df = frame.get()
+        with self._run_snapshots_lock:
+            links, lock, synced = self._model_links.setdefault(
+                experiment_name, (RunModelLinks(), threading.Lock(), {'runs_at': None, 'models_at': None}))
+        
+        with lock:
+            runs_at = snapshot.fetched_at if snapshot is not None else None
+            models_changed = synced['models_at'] != frame.fetched_at
+            if runs_at == synced['runs_at']:
+                changed_run_ids = set()
+            elif snapshot is not None and synced['runs_at'] is not None \
+                    and snapshot.previous_fetched_at == synced['runs_at']:
+                changed_run_ids = snapshot.changed_run_ids
+            else:
+                changed_run_ids = None
+            if models_changed or changed_run_ids != set():
+                links.sync(models_df, snapshot.runs_df if snapshot is not None else None, models_changed, changed_run_ids)
+                synced.update(runs_at=runs_at, models_at=frame.fetched_at)
+        return links
+    
+    def get_model_source_run(self, model_id, experiment_name=DEFAULT_EXPERIMENT_NAME):
+        """The model's linked row (name, source run, the run's status and params), or None."""
+        return self.get_model_links(experiment_name).source_run(model_id)
+    
+    def get_models_for_run(self, run_id, experiment_name=DEFAULT_EXPERIMENT_NAME):
+        """model_ids of the logged models produced by a run."""
+        return self.get_model_links(experiment_name).models_for_run(run_id)
+    
     def get_dataset_metrics_summary(self, models_df):
         """Analyze metrics by dataset and return a summary."""
         if models_df.empty:
             return {}
         
         # Extract metric columns
-        standard_columns = ['model_id', 'model_name', 'creation_timestamp', 'last_updated_timestamp', 'user_id', 'description']
+        standard_columns = ['model_id', 'model_name', 'source_run_id', 'creation_timestamp', 'last_updated_timestamp', 'user_id', 'description']
         metric_columns = [col for col in models_df.columns if col not in standard_columns and not col.startswith('param_')]
         
         # Group metrics by dataset based on column names
@@ -14,12 +14,11 @@ def test_jobs_functionality():
     
     try:
         # Import Databricks SDK
-        from databricks.sdk import WorkspaceClient
-        from databricks.sdk.service.jobs import Job, Run
+        from utils.workspace_clients import get_workspace_client
         
         # Initialize workspace client
         print("1. Initializing Databricks Workspace Client...")
-        wc = WorkspaceClient()
+        wc = get_workspace_client()
         print("   ✅ Workspace client initialized successfully")
         
         # List all jobs
@@ -75,35 +74,23 @@ def test_jobs_functionality():
                 print(f"     Tags: {job['tags']}")
             print()
         
-        # Test getting recent runs for each job
+        # Latest run of every job, read per job or from the run history rather than one list_runs call per job
         print("5. Recent Job Runs:")
+        from jobs_service import jobs_service
+        
+        status = jobs_service.fetch_run_status().set_index('job_id')
         for idx, job in jobs_df.iterrows():
-            try:
-                print(f"   Job '{job['job_name']}' (ID: {job['job_id']}):")
-                
-                # Get recent runs for this job
-                runs = list(wc.jobs.list_runs(job_id=job['job_id'], limit=5))
-                
-                if runs:
-                    print(f"     Recent runs ({len(runs)}):")
-                    for run in runs:
-                        run_state = run.state.life_cycle_state if run.state else 'UNKNOWN'
-                        run_result = run.state.result_state if run.state else 'UNKNOWN'
-                        start_time = datetime.fromtimestamp(run.start_time / 1000) if run.start_time else None
-                        end_time = datetime.fromtimestamp(run.end_time / 1000) if run.end_time else None
-                        
-                        print(f"       Run {run.run_id}: {run_state} -> {run_result}")
-                        print(f"         Started: {start_time}")
-                        if end_time:
-                            print(f"         Ended: {end_time}")
-                        print()
-                else:
-                    print("     No recent runs found")
-                    print()
-                    
-            except Exception as e:
-                print(f"     Error getting runs for job {job['job_id']}: {str(e)}")
+            print(f"   Job '{job['job_name']}' (ID: {job['job_id']}):")
+            if job['job_id'] not in status.index:
+                print("     No recent runs found")
                 print()
+                continue
+            job_status = status.loc[job['job_id']]
+            print(f"     Last result: {job_status['last_result']}")
+            print(f"     Last started: {job_status['last_run_start']}")
+            print(f"     Last duration: {job_status['last_duration']} s")
+            print(f"     Running now: {job_status['running_count']}")
+            print()
         
         # Test job statistics
         print("6. Job Statistics:")
@@ -131,9 +118,9 @@ def test_jobs_functionality():
 def get_job_details(job_id: int) -> Optional[Dict]:
     """Get detailed information about a specific job."""
     try:
-        from databricks.sdk import WorkspaceClient
+        from utils.workspace_clients import get_workspace_client
         
-        wc = WorkspaceClient()
+        wc = get_workspace_client()
         job = wc.jobs.get(job_id=job_id)
         
         return {
@@ -151,9 +138,9 @@ def get_job_details(job_id: int) -> Optional[Dict]:
 def list_job_runs(job_id: int, limit: int = 10) -> List[Dict]:
     """List recent runs for a specific job."""
     try:
-        from databricks.sdk import WorkspaceClient
+        from utils.workspace_clients import get_workspace_client
         
-        wc = WorkspaceClient()
+        wc = get_workspace_client()
         runs = list(wc.jobs.list_runs(job_id=job_id, limit=limit))
         
         runs_data = []
@@ -0,0 +1,48 @@
+"""Offline checks of utils.downsample (no workspace needed): python -m pytest tests/test_downsample.py"""
+
+import numpy as np
+
+from utils.downsample import downsample_indices, lttb_indices, minmax_indices
+
+
+def make_series(n=10_000, seed=0):
+    rng = np.random.default_rng(seed)
+    x = np.arange(n, dtype=float)
+    y = np.sin(x / 500) + rng.normal(0, 0.05, n)
+    # Spikes that a plot must not lose
+    y[n // 8], y[7 * n // 9] = 25.0, -25.0
+    return x, y
+
+
+def test_lttb_keeps_endpoints_and_extremes():
+    x, y = make_series()
+    indices = lttb_indices(x, y, 500)
+    assert len(indices) == 500
+    assert indices[0] == 0 and indices[-1] == len(x) - 1
+    assert np.all(np.diff(indices) > 0)
+    assert 1250 in indices and 7777 in indices
+
+
+def test_minmax_keeps_extremes_of_every_bucket():
+    x, y = make_series()
+    indices = minmax_indices(y, 500)
+    assert len(indices) <= 500
+    assert np.all(np.diff(indices) > 0)
+    assert int(np.argmax(y)) in indices and int(np.argmin(y)) in indices
+    edges = np.linspace(0, len(y), 250 + 1).astype(int)
+    for start, end in zip(edges[:-1], edges[1:]):
+        assert start + int(np.argmax(y[start:end])) in indices
+        assert start + int(np.argmin(y[start:end])) in indices
+
+
+def test_short_series_are_returned_whole():
+    x, y = make_series(100)
+    assert np.array_equal(lttb_indices(x, y, 500), np.arange(100))
+    assert np.array_equal(downsample_indices(x, y, 500, method='minmax'), np.arange(100))
+
+
+if __name__ == "__main__":
+    test_lttb_keeps_endpoints_and_extremes()
+    test_minmax_keeps_extremes_of_every_bucket()
+    test_short_series_are_returned_whole()
+    print("✅ downsampling keeps endpoints and extremes")
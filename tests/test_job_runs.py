@@ -0,0 +1,93 @@
+"""Offline checks of the job run status and history helpers (no workspace needed): python -m pytest tests/test_job_runs.py"""
+
+import time
+
+import pandas as pd
+
+from jobs_service import JOB_RUN_SYNC_OVERLAP_MS, JobRunHistory, job_runs_json_to_frame, latest_run_status
+from utils.frame_types import compact_frame
+from utils.snapshot_store import SnapshotStore
+
+
+def make_run(job_id, run_id, start_time, life_cycle_state='TERMINATED', result_state='SUCCESS'):
+    run = {'job_id': job_id, 'run_id': run_id, 'start_time': start_time,
+           'state': {'life_cycle_state': life_cycle_state}}
+    if result_state is not None:
+        run['state']['result_state'] = result_state
+        run.update(end_time=start_time + 5000, run_duration=5000)
+    return run
+
+
+def test_latest_run_status_of_compacted_history_with_running_run():
+    """Categorical state columns (as ingested and reloaded) with an active latest run."""
+    history = [make_run(job_id, job_id * 100 + k, 1_700_000_000_000 + k * 1000) for job_id in (1, 2) for k in range(4)]
+    history += [make_run(1, 199, 1_700_000_100_000, 'RUNNING', None),
+                make_run(2, 299, 1_700_000_100_000, result_state='FAILED')]
+    runs = compact_frame(job_runs_json_to_frame(history))
+    assert isinstance(runs['life_cycle_state'].dtype, pd.CategoricalDtype)
+    assert isinstance(runs['result_state'].dtype, pd.CategoricalDtype)
+    status = latest_run_status(runs)
+    assert status.loc[1, 'last_result'] == 'RUNNING'
+    assert status.loc[1, 'last_duration'] == 5.0
+    assert status.loc[1, 'running_count'] == 1
+    assert status.loc[2, 'last_result'] == 'FAILED'
+    assert status.loc[2, 'running_count'] == 0
+
+
+class FakeRunsApi:
+    """runs/list and runs/get over a dict of run JSON, recording the calls."""
+
+    def __init__(self, runs):
+        self.runs = {run['run_id']: run for run in runs}
+        self.calls = []
+
+    def iter_run_pages(self, job_id=None, active_only=False, start_time_from=None, max_pages=None):
+        self.calls.append(('list', active_only, start_time_from))
+        runs = sorted(self.runs.values(), key=lambda run: run['start_time'], reverse=True)
+        if active_only:
+            yield [run for run in runs if 'result_state' not in run['state']]
+        else:
+            yield [run for run in runs if run['start_time'] >= (start_time_from or 0)]
+
+    def get_run(self, run_id):
+        self.calls.append(('get', run_id))
+        return self.runs.get(run_id)
+
+
+def test_long_running_run_does_not_hold_the_watermark_back(tmp_path):
+    """An open run is re-read through active_only/runs/get while the watermark follows the newest run."""
+    now = int(time.time() * 1000)
+    long_running = make_run(1, 10, now - 10 * 24 * 3600 * 1000, 'RUNNING', None)
+    api = FakeRunsApi([long_running, make_run(2, 20, now - 3600 * 1000)])
+    history = JobRunHistory(api.iter_run_pages, api.get_run, SnapshotStore(str(tmp_path)))
+
+    history.ingest()
+    assert history.watermark == now - 3600 * 1000 - JOB_RUN_SYNC_OVERLAP_MS
+    assert history.run_status.loc[1, 'last_result'] == 'RUNNING'
+
+    # The run finishes; the next ingest scans from the watermark only and reads the run with runs/get
+    api.runs[10] = make_run(1, 10, long_running['start_time'], result_state='FAILED')
+    api.calls.clear()
+    history.ingest()
+    assert ('list', False, now - 3600 * 1000 - JOB_RUN_SYNC_OVERLAP_MS) in api.calls
+    assert ('get', 10) in api.calls
+    assert history.run_status.loc[1, 'last_result'] == 'FAILED'
+
+    # Nothing is open any more, so neither active runs nor single runs are read
+    api.calls.clear()
+    history.ingest()
+    assert [call[0] for call in api.calls] == ['list']
+
+    # A deleted open run leaves the history
+    api.runs[30] = make_run(3, 30, now - 60 * 1000, 'RUNNING', None)
+    history.ingest()
+    del api.runs[30]
+    history.ingest()
+    assert 30 not in history.runs['run_id'].tolist()
+
+
+if __name__ == "__main__":
+    import tempfile
+    test_latest_run_status_of_compacted_history_with_running_run()
+    test_long_running_run_does_not_hold_the_watermark_back(tempfile.mkdtemp())
+    print("✅ job run status and history checks passed")
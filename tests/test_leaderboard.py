@@ -0,0 +1,64 @@
+"""Offline checks of utils.leaderboard (no workspace needed): python -m pytest tests/test_leaderboard.py"""
+
+import numpy as np
+import pandas as pd
+
+from utils.leaderboard import StreamingLeaderboard, pareto_front, top_k
+
+
+def make_runs(n=500, seed=0):
+    rng = np.random.default_rng(seed)
+    runs = pd.DataFrame({
+        'run_id': [f'r{i}' for i in range(n)],
+        'metric_rmse': rng.random(n),
+        'metric_latency': rng.random(n),
+        'param_model': rng.choice(['xgb', 'rf', 'lr'], n)
+    })
+    runs.loc[::7, 'metric_rmse'] = np.nan
+    return runs
+
+
+def brute_force_front(runs, metrics):
+    values = runs[metrics].dropna().to_numpy()
+    ids = runs.loc[runs[metrics].notna().all(axis=1), 'run_id'].to_numpy()
+    return {run_id for run_id, point in zip(ids, values)
+            if not ((values <= point).all(axis=1) & (values < point).any(axis=1)).any()}
+
+
+def test_top_k_matches_a_full_sort():
+    runs = make_runs()
+    expected = runs.dropna(subset=['metric_rmse']).sort_values('metric_rmse', kind='stable').head(10)
+    assert top_k(runs, 'metric_rmse', k=10)['run_id'].tolist() == expected['run_id'].tolist()
+    best = top_k(runs, 'metric_rmse', k=3, higher_is_better=True)
+    assert best['metric_rmse'].tolist() == sorted(runs['metric_rmse'].dropna(), reverse=True)[:3]
+    # Fewer candidates than k: every row with the metric, none without
+    assert len(top_k(runs.head(14), 'metric_rmse', k=50)) == 12
+
+
+def test_pareto_front_matches_brute_force():
+    runs = make_runs()
+    metrics = ['metric_rmse', 'metric_latency']
+    front = pareto_front(runs, metrics)
+    assert set(front['run_id']) == brute_force_front(runs, metrics)
+    assert front['metric_rmse'].is_monotonic_increasing
+
+
+def test_streaming_leaderboard_matches_one_pass():
+    runs = make_runs()
+    board = StreamingLeaderboard('metric_rmse', k=5, pareto_metrics=['metric_rmse', 'metric_latency'],
+                                 group_by='param_model')
+    for start in range(0, len(runs), 64):
+        board.update(runs.iloc[start:start + 64])
+    result = board.result()
+    assert result['top']['run_id'].tolist() == top_k(runs, 'metric_rmse', k=5)['run_id'].tolist()
+    assert set(result['pareto']['run_id']) == brute_force_front(runs, ['metric_rmse', 'metric_latency'])
+    groups = result['groups'].set_index('param_model')
+    assert groups['best_metric_rmse'].to_dict() == runs.groupby('param_model')['metric_rmse'].min().to_dict()
+    assert board.rows_seen == len(runs)
+
+
+if __name__ == "__main__":
+    test_top_k_matches_a_full_sort()
+    test_pareto_front_matches_brute_force()
+    test_streaming_leaderboard_matches_one_pass()
+    print("✅ leaderboard checks passed")
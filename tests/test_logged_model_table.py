@@ -0,0 +1,29 @@
+"""Offline checks of LoggedModelTable.to_wide (no workspace needed): python -m pytest tests/test_logged_model_table.py"""
+
+import pandas as pd
+
+from mlflow_service import LoggedModelTable, LOGGED_MODEL_STANDARD_COLUMNS
+
+
+def make_table(metric_rows):
+    models = pd.DataFrame([{column: None for column in LOGGED_MODEL_STANDARD_COLUMNS} | {'model_id': 'm1'}])
+    metrics = pd.DataFrame(metric_rows, columns=['model_id', 'dataset', 'key', 'value', 'column'])
+    return LoggedModelTable(models, metrics, pd.DataFrame(columns=['model_id', 'key', 'value']))
+
+
+def test_general_metric_colliding_with_dataset_metric():
+    """'val_rmse' without a dataset and 'rmse' on dataset 'val' map to the same column; the last one wins."""
+    wide = make_table([
+        ('m1', None, 'val_rmse', 1.0, 'val_rmse'),
+        ('m1', 'val', 'rmse', 2.0, 'val_rmse'),
+        ('m1', None, 'mae', 3.0, 'mae'),
+    ]).to_wide()
+    assert len(wide) == 1
+    assert list(wide.columns).count('val_rmse') == 1
+    assert wide.loc[0, 'val_rmse'] == 2.0
+    assert wide.loc[0, 'mae'] == 3.0
+
+
+if __name__ == "__main__":
+    test_general_metric_colliding_with_dataset_metric()
+    print("✅ to_wide handles colliding metric columns")
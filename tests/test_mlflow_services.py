@@ -1,77 +1,72 @@
 #!/usr/bin/env python3
 """
-Test script to compare MLflow client service vs REST API service.
+Latency comparison of the SDK-backed MLflow service and the thin REST client.
+
+Both fetch the same runs and logged models with caches bypassed; each
+query is repeated and the median, fastest and slowest times are reported.
 """
 
-import pandas as pd
-from mlflow_service import mlflow_service
-from mlflow_rest_service import mlflow_rest_service
+import statistics
+import sys
 import time
 
-def test_mlflow_client():
-    """Test the MLflow client service."""
-    print("=== Testing MLflow Client Service ===")
-    try:
-        start_time = time.time()
-        runs = mlflow_service.get_runs()
-        end_time = time.time()
-        
-        print(f"✅ Success! Retrieved {len(runs)} runs in {end_time - start_time:.2f} seconds")
-        print(f"Columns: {list(runs.columns)}")
-        
-        if not runs.empty:
-            print(f"Sample run: {runs.iloc[0]['run_name']}")
-        
-        return True
-    except Exception as e:
-        print(f"❌ Failed: {str(e)}")
+from mlflow_service import mlflow_workspace_service as mlflow_service, DEFAULT_EXPERIMENT_NAME, wide_logged_models
+from mlflow_rest_service import mlflow_rest_service
+
+REPEATS = 5
+
+
+def time_call(label, fn):
+    """Call fn REPEATS times; returns (median seconds, last result)."""
+    timings = []
+    result = None
+    for _ in range(REPEATS):
+        start_time = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start_time)
+    print(f"{label:<28} median {statistics.median(timings):6.3f}s  "
+          f"min {min(timings):6.3f}s  max {max(timings):6.3f}s  ({len(result)} rows)")
+    return statistics.median(timings), result
+
+
+def compare(title, sdk_fn, rest_fn):
+    print(f"\n=== {title} ===")
+    sdk_median, sdk_df = time_call("SDK (WorkspaceClient)", sdk_fn)
+    rest_median, rest_df = time_call("REST (pooled session)", rest_fn)
+    print(f"Speedup: {sdk_median / rest_median:.2f}x" if rest_median else "Speedup: n/a")
+
+    missing = sorted(set(sdk_df.columns) - set(rest_df.columns))
+    extra = sorted(set(rest_df.columns) - set(sdk_df.columns))
+    if len(sdk_df) != len(rest_df) or missing or extra:
+        print(f"❌ Results differ: {len(sdk_df)} vs {len(rest_df)} rows, missing {missing}, extra {extra}")
         return False
+    print("✅ Same rows and columns")
+    return True
+
 
-def test_mlflow_rest():
-    """Test the MLflow REST API service."""
-    print("\n=== Testing MLflow REST API Service ===")
-    try:
-        # First test connection
-        if not mlflow_rest_service.test_connection():
-            print("❌ Connection test failed")
-            return False
-        
-        start_time = time.time()
-        runs = mlflow_rest_service.get_runs()
-        end_time = time.time()
-        
-        print(f"✅ Success! Retrieved {len(runs)} runs in {end_time - start_time:.2f} seconds")
-        print(f"Columns: {list(runs.columns)}")
-        
-        if not runs.empty:
-            print(f"Sample run: {runs.iloc[0]['run_name']}")
-        
-        return True
-    except Exception as e:
-        print(f"❌ Failed: {str(e)}")
+def compare_services(experiment_name=DEFAULT_EXPERIMENT_NAME):
+    """Compare both services side by side on one experiment."""
+    print(f"Comparing SDK vs REST on '{experiment_name}' ({REPEATS} repeats each)")
+    print("=" * 60)
+
+    if not mlflow_rest_service.test_connection():
+        print("❌ REST connection test failed. Check your Databricks configuration.")
         return False
 
-def compare_services():
-    """Compare both services side by side."""
-    print("Comparing MLflow Client vs REST API Services")
-    print("=" * 50)
-    
-    client_success = test_mlflow_client()
-    rest_success = test_mlflow_rest()
-    
-    print("\n" + "=" * 50)
-    print("SUMMARY:")
-    print(f"MLflow Client: {'✅ Working' if client_success else '❌ Failed'}")
-    print(f"REST API: {'✅ Working' if rest_success else '❌ Failed'}")
-    
-    if client_success and rest_success:
-        print("\nBoth services are working! You can choose either one.")
-    elif client_success:
-        print("\nUse the MLflow Client service (mlflow_service.py)")
-    elif rest_success:
-        print("\nUse the REST API service (mlflow_rest_service.py)")
-    else:
-        print("\nBoth services failed. Check your Databricks configuration.")
+    # Warm up both clients so auth and imports are not timed
+    mlflow_service.query_runs(experiment_name, max_results=1)
+    mlflow_rest_service.get_runs(experiment_name, max_results=1)
+
+    results = [
+        compare("Runs",
+                lambda: mlflow_service.query_runs(experiment_name),
+                lambda: mlflow_rest_service.get_runs(experiment_name)),
+        compare("Logged models",
+                lambda: wide_logged_models(mlflow_service.get_logged_models_table(experiment_name)),
+                lambda: mlflow_rest_service.get_logged_models(experiment_name)),
+    ]
+    return all(results)
+
 
 if __name__ == "__main__":
-    compare_services() 
\ No newline at end of file
+    compare_services(*sys.argv[1:2])
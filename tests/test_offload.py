@@ -0,0 +1,36 @@
+"""Offline checks of utils.offload (no workspace needed): python -m pytest tests/test_offload.py"""
+
+import json
+
+import numpy as np
+import pandas as pd
+
+from utils.offload import records
+
+
+def make_frame():
+    return pd.DataFrame({
+        'run_id': ['a', 'b', 'c'],
+        'start_time': pd.to_datetime([1700000000123, 1700000005000, None], unit='ms'),
+        'end_time': pd.to_datetime(['2024-01-01 10:00:00', None, '2024-01-02 10:00:00.500'], format='ISO8601', utc=True),
+        'metric_rmse': [0.1 + 0.2, 1 / 3, np.nan],
+        'epochs': [1, 2, 3],
+        'status': pd.Categorical(['FINISHED', 'RUNNING', 'FINISHED'])
+    })
+
+
+def test_inline_and_offloaded_records_match():
+    """records() formats rows the same whether they are built inline or in the process pool."""
+    df = make_frame()
+    inline = records(df, min_cells=float('inf'))
+    offloaded = records(df, min_cells=0)
+    # NaN != NaN, so compare the JSON text
+    assert json.dumps(inline) == json.dumps(offloaded)
+    assert inline[0]['start_time'] == '2023-11-14T22:13:20.123000'
+    assert inline[2]['start_time'] is None
+    assert inline[0]['metric_rmse'] == 0.1 + 0.2
+
+
+if __name__ == "__main__":
+    test_inline_and_offloaded_records_match()
+    print("✅ inline and offloaded records match")
@@ -0,0 +1,101 @@
+"""Offline checks of utils.rate_limit on a fake clock (no workspace needed): python -m pytest tests/test_rate_limit.py"""
+
+import pytest
+
+from utils import rate_limit
+from utils.rate_limit import AdaptiveLimiter, TokenBucket, parse_retry_after
+
+
+class FakeClock:
+    """Stands in for the time module: sleep() advances monotonic() instantly."""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+        self.slept = []
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limit, 'time', fake)
+    return fake
+
+
+def test_token_bucket_allows_a_burst_then_paces_at_the_rate(clock):
+    bucket = TokenBucket(rate=10.0, burst=5)
+    for _ in range(5):
+        bucket.acquire()
+    assert clock.slept == []
+    bucket.acquire()
+    assert clock.slept == [pytest.approx(0.1)]
+    # Idle time refills the bucket, but never beyond the burst size
+    clock.now += 60
+    for _ in range(5):
+        bucket.acquire()
+    assert len(clock.slept) == 1
+
+
+def test_limiter_halves_on_429_once_per_cooldown_and_grows_additively(clock):
+    limiter = AdaptiveLimiter('jobs', rate=1000.0, burst=1000, initial_concurrency=8)
+    limiter.acquire()
+    limiter.release(429)
+    assert limiter.limit == 4
+    # A second 429 within the cooldown belongs to the same overload
+    limiter.acquire()
+    limiter.release(429)
+    assert limiter.limit == 4
+    clock.now += rate_limit.DECREASE_COOLDOWN + 0.1
+    limiter.acquire()
+    limiter.release(429)
+    assert limiter.limit == 2
+    assert limiter.throttled == 3
+
+    # About one slot per window's worth of successes; server errors leave the window alone
+    for _ in range(2):
+        limiter.acquire()
+        limiter.release(200)
+    assert int(limiter.limit) == 2 and limiter.limit > 2
+    limit = limiter.limit
+    limiter.acquire()
+    limiter.release(503)
+    assert limiter.limit == limit
+
+
+def test_limiter_respects_its_bounds_and_retry_after(clock):
+    limiter = AdaptiveLimiter('mlflow', rate=1000.0, burst=1000, initial_concurrency=2,
+                              min_concurrency=1, max_concurrency=3)
+    for _ in range(50):
+        limiter.acquire()
+        limiter.release(200)
+    assert limiter.limit == 3
+    for _ in range(5):
+        clock.now += rate_limit.DECREASE_COOLDOWN + 0.1
+        limiter.acquire()
+        limiter.release(429)
+    assert limiter.limit == 1
+    limiter.acquire()
+    limiter.release(429, retry_after=2.0)
+    assert limiter.stats()['paused_for'] == pytest.approx(2.0)
+    assert limiter.stats()['in_flight'] == 0
+
+
+def test_parse_retry_after():
+    assert parse_retry_after('3') == 3.0
+    assert parse_retry_after('-1') == 0.0
+    assert parse_retry_after('100000') == rate_limit.MAX_RETRY_AFTER
+    assert parse_retry_after('not a date') is None
+    assert parse_retry_after(None) is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-q'])
@@ -0,0 +1,56 @@
+"""Offline checks of utils.run_hierarchy (no workspace needed): python -m pytest tests/test_run_hierarchy.py"""
+
+import numpy as np
+import pandas as pd
+
+from utils.run_hierarchy import PARENT_RUN_COLUMN, RunHierarchy
+
+
+def make_runs(n_children=60, seed=0):
+    rng = np.random.default_rng(seed)
+    parents = pd.DataFrame({'run_id': ['p1', 'p2', 'p3'], PARENT_RUN_COLUMN: None, 'status': 'FINISHED',
+                            'metric_rmse': np.nan})
+    children = pd.DataFrame({
+        'run_id': [f'c{i}' for i in range(n_children)],
+        PARENT_RUN_COLUMN: rng.choice(['p1', 'p2'], n_children),
+        'status': rng.choice(['FINISHED', 'RUNNING'], n_children),
+        'metric_rmse': rng.random(n_children)
+    })
+    return pd.concat([parents, children], ignore_index=True)
+
+
+def assert_same_aggregates(incremental, rebuilt):
+    left = incremental.aggregates.sort_index().sort_index(axis=1)
+    right = rebuilt.aggregates.sort_index().sort_index(axis=1)
+    pd.testing.assert_frame_equal(left, right, check_dtype=False, check_names=False)
+
+
+def test_merged_matches_a_full_rebuild():
+    runs = make_runs()
+    hierarchy = RunHierarchy.from_runs(runs.iloc[:40])
+
+    # New children, a finished run, a child moved to another parent and a new parent
+    changed = runs.iloc[40:].copy()
+    updates = pd.DataFrame({'run_id': ['c0', 'c1', 'c2'], PARENT_RUN_COLUMN: ['p1', 'p3', 'p3'],
+                            'status': ['FAILED', 'FINISHED', 'FINISHED'], 'metric_rmse': [0.0, 5.0, 6.0]})
+    changed = pd.concat([changed, updates], ignore_index=True)
+    merged = hierarchy.merged(changed)
+
+    final = pd.concat([runs[~runs['run_id'].isin(updates['run_id'])], updates], ignore_index=True)
+    assert_same_aggregates(merged, RunHierarchy.from_runs(final))
+    assert merged.aggregates.loc['p3', 'child_count'] == 2
+    # The old hierarchy is left as it was
+    assert 'p3' not in hierarchy.parent_ids
+
+
+def test_best_child():
+    hierarchy = RunHierarchy.from_runs(make_runs())
+    children = hierarchy.children_of('p1')
+    assert hierarchy.best_child('p1', 'metric_rmse')['metric_rmse'] == children['metric_rmse'].min()
+    assert hierarchy.best_child('p1', 'metric_rmse', higher_is_better=True)['metric_rmse'] == children['metric_rmse'].max()
+
+
+if __name__ == "__main__":
+    test_merged_matches_a_full_rebuild()
+    test_best_child()
+    print("✅ run hierarchy checks passed")
@@ -0,0 +1,46 @@
+"""Offline checks of utils.ttl_cache (no workspace needed): python -m pytest tests/test_ttl_cache.py"""
+
+from utils import ttl_cache
+from utils.ttl_cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+
+def test_entries_expire_and_the_least_recently_used_is_evicted(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(ttl_cache, 'time', clock)
+    cache = TTLCache(max_entries=2, max_age=10)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1
+    cache.put('c', 3)
+    assert cache.get('b') is None and cache.get('a') == 1 and len(cache) == 2
+    clock.now += 11
+    assert cache.get('a') is None
+    assert cache.get('a', max_age=60) == 1
+
+
+def test_max_age_per_value_and_versions(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(ttl_cache, 'time', clock)
+    cache = TTLCache(max_entries=10, max_age=lambda details: 15 if details['status'] == 'RUNNING' else 3600)
+    cache.put('running', {'status': 'RUNNING'})
+    cache.put('finished', {'status': 'FINISHED'}, version='v1')
+    clock.now += 60
+    assert cache.get('running') is None
+    assert cache.get('finished') is not None
+    assert cache.get('finished', version='v1') is not None
+    assert cache.get('finished', version='v2') is None
+    cache.invalidate('finished')
+    assert cache.get('finished') is None
+
+
+if __name__ == "__main__":
+    import pytest
+    pytest.main([__file__, '-q'])
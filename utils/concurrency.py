@@ -0,0 +1,71 @@
+"""Small threading helpers shared by the service layer."""
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Default upper bound on concurrent REST calls issued by one fan-out
+DEFAULT_MAX_WORKERS = 8
+
+_DONE = object()
+
+
+class _ProducerError:
+    def __init__(self, error):
+        self.error = error
+
+
+def prefetch(iterable, depth=2):
+    """Iterate over `iterable` on a background thread, keeping up to `depth` items ready.
+
+    Useful for paginated APIs: the next page is requested while the caller
+    is still processing the current one. Exceptions raised while producing
+    are re-raised in the consumer. Abandoning the generator stops the
+    producer after its current item.
+    """
+    items = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in iterable:
+                if not put(item):
+                    return
+        except BaseException as e:
+            put(_ProducerError(e))
+        finally:
+            put(_DONE)
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = items.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _ProducerError):
+                raise item.error
+            yield item
+    finally:
+        stop.set()
+
+
+def map_concurrently(fn, items, max_workers=DEFAULT_MAX_WORKERS):
+    """Apply fn to every item on a bounded thread pool, preserving input order.
+
+    Runs inline when there is at most one item. The first exception raised
+    by fn propagates to the caller.
+    """
+    items = list(items)
+    if len(items) <= 1:
+        return [fn(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+        return list(pool.map(fn, items))
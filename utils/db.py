@@ -1,7 +1,5 @@
 import yaml
 import pandas as pd
-from databricks import sql
-from databricks.sdk.core import Config
 import os
 # Load DB config once
 try:
@@ -18,7 +16,11 @@ except Exception as e:
 def sqlQuery(query: str) -> pd.DataFrame:
     """Execute a SQL query and return the result as a pandas DataFrame."""
     print(f"sqlQuery executing: {query}")
-    cfg = Config()  # Pull environment variables for auth
+    # Imported here so that importing this module stays cheap
+    from databricks import sql
+    from utils.workspace_clients import workspace_clients
+    
+    cfg = workspace_clients.config  # Resolved once per process from the environment
     with sql.connect(
         server_hostname=cfg.host,
         http_path=f"/sql/1.0/warehouses/{os.getenv('DATABRICKS_WAREHOUSE_ID')}",
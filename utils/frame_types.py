@@ -0,0 +1,78 @@
+"""Dtype compaction for the wide run and logged-model frames."""
+import numpy as np
+import pandas as pd
+
+# Strings with at most this share of distinct values (per row) become categoricals
+CATEGORICAL_MAX_UNIQUE_RATIO = 0.5
+
+_NULLABLE_INTS = [('Int8', np.int8), ('Int16', np.int16), ('Int32', np.int32), ('Int64', np.int64)]
+
+
+def _string_dtype():
+    try:
+        import pyarrow  # noqa: F401
+        return 'string[pyarrow]'
+    except ImportError:
+        return 'string'
+
+
+def _nullable_int_dtype(values):
+    low, high = values.min(), values.max()
+    for name, numpy_type in _NULLABLE_INTS:
+        info = np.iinfo(numpy_type)
+        if info.min <= low and high <= info.max:
+            return name
+    return 'Int64'
+
+
+def compact_column(series):
+    """The same values in a smaller dtype, or the series unchanged.
+
+    - int64 -> the smallest integer type that fits
+    - object holding only ints -> the smallest nullable Int type
+    - object holding only strings -> category when few distinct values,
+      otherwise an Arrow-backed string column
+    Floats are left as float64, so metric values and everything computed
+    from them (leaderboards, deltas) keep full precision. Datetimes,
+    booleans, categoricals and sparse columns are left alone too.
+    """
+    dtype = series.dtype
+    if isinstance(dtype, (pd.SparseDtype, pd.CategoricalDtype)) or pd.api.types.is_datetime64_any_dtype(dtype):
+        return series
+    if dtype == np.int64:
+        return pd.to_numeric(series, downcast='integer')
+    if isinstance(dtype, pd.StringDtype):
+        # Already a dedicated string column (the default for text from pandas 3 on)
+        return _compact_strings(series, series.dropna())
+    if dtype != object:
+        return series
+
+    present = series.dropna()
+    if present.empty:
+        return series
+    kinds = set(map(type, present))
+    if kinds <= {int, np.int64, np.int32}:
+        return series.astype(_nullable_int_dtype(present.astype(np.int64)))
+    if kinds == {str}:
+        return _compact_strings(series.astype(_string_dtype()), present)
+    return series
+
+
+def _compact_strings(series, present):
+    if not present.empty and present.nunique() <= CATEGORICAL_MAX_UNIQUE_RATIO * len(series):
+        return series.astype('category')
+    return series
+
+
+def compact_frame(df):
+    """Apply compact_column to every column of a DataFrame (returns a new frame)."""
+    if df is None or df.empty:
+        return df
+    return pd.DataFrame({col: compact_column(df[col]) for col in df.columns}, index=df.index)
+
+
+def frame_memory_bytes(df):
+    """Deep memory footprint of a DataFrame in bytes (0 for None)."""
+    if df is None:
+        return 0
+    return int(df.memory_usage(deep=True, index=True).sum())
@@ -0,0 +1,104 @@
+"""Summarize `python -X importtime` for a module, to track cold-start regressions per release.
+
+Usage:
+    python -m utils.import_profile                     # profile `import app`
+    python -m utils.import_profile mlflow_service --top 20
+    python -m utils.import_profile app --json import_profile.json --budget-ms 2500
+"""
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+
+_IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure_imports(module='app', python=sys.executable, cwd=REPO_ROOT):
+    """Import `module` in a fresh interpreter with -X importtime and parse the timings.
+
+    Returns a list of dicts (name, self_us, cumulative_us, depth), one per
+    imported module, in the order Python reported them.
+    """
+    result = subprocess.run(
+        [python, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True, text=True, cwd=cwd
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing '{module}' failed:\n{result.stderr[-2000:]}")
+
+    entries = []
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            entries.append({
+                'name': name,
+                'self_us': int(self_us),
+                'cumulative_us': int(cumulative_us),
+                'depth': len(indent) // 2
+            })
+    return entries
+
+
+def summarize_imports(entries, module='app', top=15):
+    """Total import time, time per top-level package and the slowest individual imports."""
+    total_us = sum(entry['self_us'] for entry in entries)
+    packages = {}
+    for entry in entries:
+        package = entry['name'].split('.')[0]
+        packages[package] = packages.get(package, 0) + entry['self_us']
+
+    by_package = sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]
+    slowest = sorted(entries, key=lambda entry: entry['cumulative_us'], reverse=True)[:top]
+    return {
+        'module': module,
+        'python': sys.version.split()[0],
+        'total_ms': round(total_us / 1000, 1),
+        'module_count': len(entries),
+        'packages': [{'package': name, 'self_ms': round(us / 1000, 1)} for name, us in by_package],
+        'slowest': [
+            {'name': entry['name'], 'cumulative_ms': round(entry['cumulative_us'] / 1000, 1)}
+            for entry in slowest
+        ]
+    }
+
+
+def format_report(summary):
+    """Plain-text report of a summarize_imports result."""
+    lines = [
+        f"Import profile for '{summary['module']}' (Python {summary['python']})",
+        f"Total: {summary['total_ms']} ms across {summary['module_count']} modules",
+        "",
+        "Self time by top-level package:",
+    ]
+    lines += [f"  {row['self_ms']:>9.1f} ms  {row['package']}" for row in summary['packages']]
+    lines += ["", "Slowest imports (cumulative):"]
+    lines += [f"  {row['cumulative_ms']:>9.1f} ms  {row['name']}" for row in summary['slowest']]
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('module', nargs='?', default='app', help="Module to import (default: app)")
+    parser.add_argument('--top', type=int, default=15, help="Rows to show per section")
+    parser.add_argument('--json', dest='json_path', help="Also write the summary to this JSON file")
+    parser.add_argument('--budget-ms', type=float, help="Exit with status 1 if total import time exceeds this")
+    args = parser.parse_args(argv)
+
+    summary = summarize_imports(measure_imports(args.module), module=args.module, top=args.top)
+    print(format_report(summary))
+    if args.json_path:
+        with open(args.json_path, 'w') as f:
+            json.dump(summary, f, indent=2)
+    if args.budget_ms is not None and summary['total_ms'] > args.budget_ms:
+        print(f"\nImport time {summary['total_ms']} ms exceeds budget of {args.budget_ms} ms")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""Per-job duration percentiles, failure rates and their trends over a window of job run history."""
+import pandas as pd
+
+# Rolling windows of the statistics: everything in `window`, and the recent part compared with the rest for trends
+STATISTICS_WINDOW = pd.Timedelta(days=30)
+RECENT_WINDOW = pd.Timedelta(days=7)
+
+# Result states that count as failures, and those left out of failure rates altogether
+FAILED_RESULT_STATES = ('FAILED', 'TIMEDOUT', 'UPSTREAM_FAILED', 'SUCCESS_WITH_FAILURES')
+NEUTRAL_RESULT_STATES = ('CANCELED', 'SKIPPED', 'EXCLUDED', 'DISABLED', 'UPSTREAM_CANCELED',
+                         'MAXIMUM_CONCURRENT_RUNS_REACHED')
+
+# Columns of job_run_statistics
+STATISTICS_COLUMNS = ['runs', 'p50_duration', 'p95_duration', 'failure_rate', 'duration_trend', 'failure_rate_trend']
+
+
+def merge_job_runs(history_df, changed_df, since=None):
+    """Upsert changed runs into the history by run_id, dropping runs that started before `since`."""
+    frames = [df for df in (history_df, changed_df) if df is not None and not df.empty]
+    if not frames:
+        return changed_df if changed_df is not None else history_df
+    # Plain objects, so categorical columns with different categories concatenate cleanly
+    merged = pd.concat([df.astype({col: object for col in df.columns if isinstance(df[col].dtype, pd.CategoricalDtype)})
+                        for df in frames], ignore_index=True, sort=False)
+    merged = merged.drop_duplicates('run_id', keep='last')
+    if since is not None:
+        merged = merged[merged['start_time'] >= since]
+    return merged.reset_index(drop=True)
+
+
+def job_run_statistics(runs_df, now=None, window=STATISTICS_WINDOW, recent_window=RECENT_WINDOW):
+    """Statistics per job over the runs that started within `window` of `now`, indexed by job_id.
+
+    - runs: runs started in the window (including unfinished ones)
+    - p50_duration / p95_duration: seconds, over finished runs
+    - failure_rate: share of finished runs that failed (NEUTRAL_RESULT_STATES are left out)
+    - duration_trend: p50 of the recent window relative to the rest (0.25 = 25% slower)
+    - failure_rate_trend: failure rate of the recent window minus that of the rest
+
+    Trends are NaN for jobs without finished runs on both sides of the split.
+    """
+    if runs_df is None or runs_df.empty:
+        return pd.DataFrame(columns=STATISTICS_COLUMNS, index=pd.Index([], name='job_id'))
+    # Run start times are naive UTC
+    now = pd.Timestamp.now(tz='UTC').tz_localize(None) if now is None else now
+    runs = runs_df[runs_df['start_time'] >= now - window]
+    result = runs['result_state'].astype(object)
+    finished = runs[result.notna() & ~result.isin(NEUTRAL_RESULT_STATES)]
+    job_ids = finished['job_id']
+    durations = pd.to_numeric(finished['duration'], errors='coerce').astype('float64')
+    failed = finished['result_state'].astype(object).isin(FAILED_RESULT_STATES)
+
+    stats = pd.DataFrame({
+        'runs': runs.groupby('job_id').size(),
+        'p50_duration': durations.groupby(job_ids).quantile(0.5),
+        'p95_duration': durations.groupby(job_ids).quantile(0.95),
+        'failure_rate': failed.groupby(job_ids).mean()
+    })
+
+    recent = (finished['start_time'] >= now - recent_window).rename('recent')
+    p50 = durations.groupby([job_ids, recent]).median().unstack().reindex(columns=[False, True])
+    rates = failed.groupby([job_ids, recent]).mean().unstack().reindex(columns=[False, True])
+    stats['duration_trend'] = p50[True] / p50[False] - 1
+    stats['failure_rate_trend'] = rates[True] - rates[False]
+    stats['runs'] = stats['runs'].fillna(0).astype(int)
+    return stats.rename_axis('job_id')[STATISTICS_COLUMNS]
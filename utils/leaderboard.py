@@ -0,0 +1,169 @@
+"""Vectorized leaderboards over run and logged-model frames: top-k, Pareto fronts and per-group ranking."""
+import numpy as np
+import pandas as pd
+
+
+def _scores(df, metric, higher_is_better=False):
+    """Metric values as floats where smaller is better; missing values become +inf."""
+    values = pd.to_numeric(df[metric], errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+    if higher_is_better:
+        values = -values
+    return np.where(np.isnan(values), np.inf, values)
+
+
+def top_k(df, metric, k=10, higher_is_better=False):
+    """The k best rows by metric, best first. Rows without the metric are never selected.
+
+    Selection uses np.argpartition, so only the k winners are sorted.
+    """
+    if df is None or df.empty or metric not in df.columns or k <= 0:
+        return pd.DataFrame() if df is None else df.iloc[0:0]
+    scores = _scores(df, metric, higher_is_better)
+    candidates = np.flatnonzero(np.isfinite(scores))
+    if len(candidates) > k:
+        candidates = candidates[np.argpartition(scores[candidates], k - 1)[:k]]
+    order = candidates[np.argsort(scores[candidates], kind='stable')]
+    return df.iloc[order]
+
+
+def dataset_metric_columns(columns, metric_key):
+    """{dataset: column} for the wide logged-model columns of one metric ('' for no dataset)."""
+    suffix = f"_{metric_key}"
+    found = {'': metric_key} if metric_key in columns else {}
+    for column in columns:
+        if column.endswith(suffix) and not column.startswith('param_'):
+            found[column[:-len(suffix)]] = column
+    return found
+
+
+def top_k_per_dataset(models_df, metric_key, k=10, higher_is_better=False):
+    """Top-k logged models for one metric on every dataset it was logged on.
+
+    Returns a long frame with dataset, rank and value columns in front of
+    the model columns.
+    """
+    leaders = []
+    for dataset, column in sorted(dataset_metric_columns(models_df.columns, metric_key).items()):
+        best = top_k(models_df, column, k, higher_is_better)
+        if best.empty:
+            continue
+        leaders.append(pd.concat([
+            pd.DataFrame({'dataset': dataset, 'rank': np.arange(1, len(best) + 1), 'value': best[column].to_numpy()}),
+            best.reset_index(drop=True)
+        ], axis=1))
+    if not leaders:
+        return pd.DataFrame()
+    return pd.concat(leaders, ignore_index=True)
+
+
+def pareto_front(df, metrics, higher_is_better=None):
+    """Rows that no other row beats on every metric (the Pareto front), sorted by the first metric.
+
+    higher_is_better is a list of flags aligned with metrics (default: all
+    lower-is-better). Rows missing any of the metrics are ignored. Each
+    surviving candidate knocks out everything it dominates in one
+    vectorized comparison, so the cost is about n * len(front).
+    """
+    if df is None or df.empty or any(metric not in df.columns for metric in metrics):
+        return pd.DataFrame() if df is None else df.iloc[0:0]
+    flags = higher_is_better or [False] * len(metrics)
+    scores = np.column_stack([_scores(df, metric, flag) for metric, flag in zip(metrics, flags)])
+    candidates = np.flatnonzero(np.isfinite(scores).all(axis=1))
+    scores = scores[candidates]
+
+    # Visit points in lexicographic order so strong points are tried first
+    order = np.lexsort(scores.T[::-1])
+    efficient = np.ones(len(scores), dtype=bool)
+    for i in order:
+        if not efficient[i]:
+            continue
+        dominated = (scores >= scores[i]).all(axis=1) & (scores > scores[i]).any(axis=1)
+        efficient[dominated] = False
+
+    front = candidates[efficient]
+    return df.iloc[front[np.argsort(scores[efficient][:, 0], kind='stable')]]
+
+
+def _group_stats(df, metric, by, higher_is_better):
+    values = pd.to_numeric(df[metric], errors='coerce')
+    grouped = values.groupby([df[column] for column in by], dropna=False, observed=True, sort=False)
+    return pd.DataFrame({
+        'best': grouped.max() if higher_is_better else grouped.min(),
+        'total': grouped.sum(),
+        'count': grouped.count()
+    })
+
+
+def _finish_group_ranking(stats, metric, higher_is_better):
+    stats = stats[stats['count'] > 0]
+    ranked = pd.DataFrame({
+        f'best_{metric}': stats['best'],
+        f'mean_{metric}': stats['total'] / stats['count'],
+        'runs': stats['count'].astype(int)
+    }).sort_values(f'best_{metric}', ascending=not higher_is_better, kind='stable')
+    ranked.insert(0, 'rank', np.arange(1, len(ranked) + 1))
+    return ranked.reset_index()
+
+
+def rank_by_group(df, metric, by, higher_is_better=False):
+    """One row per distinct value of the `by` column(s) with the group's best and mean metric, ranked by best."""
+    by = [by] if isinstance(by, str) else list(by)
+    if df is None or df.empty or metric not in df.columns or any(column not in df.columns for column in by):
+        return pd.DataFrame()
+    return _finish_group_ranking(_group_stats(df, metric, by, higher_is_better), metric, higher_is_better)
+
+
+class StreamingLeaderboard:
+    """Top-k, Pareto front and group ranking over a stream of frames, e.g. pages of runs.
+
+    Only the current candidates (k rows, the front so far and one small
+    aggregate per group) are kept between pages, so memory does not grow
+    with the number of rows seen.
+    """
+
+    def __init__(self, metric, k=10, higher_is_better=False, pareto_metrics=None,
+                 pareto_higher_is_better=None, group_by=None):
+        self.metric = metric
+        self.k = k
+        self.higher_is_better = higher_is_better
+        self.pareto_metrics = list(pareto_metrics or [])
+        self.pareto_higher_is_better = pareto_higher_is_better
+        self.group_by = [group_by] if isinstance(group_by, str) else list(group_by or [])
+        self.rows_seen = 0
+        self._top = None
+        self._front = None
+        self._groups = None
+
+    def update(self, frame):
+        """Fold one page into the running results."""
+        if frame is None or frame.empty:
+            return
+        self.rows_seen += len(frame)
+        if self.metric in frame.columns:
+            pool = frame if self._top is None else pd.concat([self._top, frame], ignore_index=True, sort=False)
+            self._top = top_k(pool, self.metric, self.k, self.higher_is_better)
+        if len(self.pareto_metrics) >= 2 and all(metric in frame.columns for metric in self.pareto_metrics):
+            pool = frame if self._front is None else pd.concat([self._front, frame], ignore_index=True, sort=False)
+            self._front = pareto_front(pool, self.pareto_metrics, self.pareto_higher_is_better)
+        if self.group_by and self.metric in frame.columns and all(column in frame.columns for column in self.group_by):
+            stats = _group_stats(frame, self.metric, self.group_by, self.higher_is_better)
+            if self._groups is not None:
+                combined = pd.concat([self._groups, stats]).groupby(level=list(range(len(self.group_by))),
+                                                                     dropna=False, sort=False)
+                stats = pd.DataFrame({
+                    'best': combined['best'].max() if self.higher_is_better else combined['best'].min(),
+                    'total': combined['total'].sum(),
+                    'count': combined['count'].sum()
+                })
+            self._groups = stats
+
+    def result(self):
+        """{'top': DataFrame, 'pareto': DataFrame, 'groups': DataFrame}; empty frames when nothing qualified."""
+        groups = pd.DataFrame()
+        if self._groups is not None:
+            groups = _finish_group_ranking(self._groups, self.metric, self.higher_is_better)
+        return {
+            'top': self._top.reset_index(drop=True) if self._top is not None else pd.DataFrame(),
+            'pareto': self._front.reset_index(drop=True) if self._front is not None else pd.DataFrame(),
+            'groups': groups
+        }
@@ -0,0 +1,124 @@
+"""Run heavy DataFrame transforms in a process pool so Dash request threads keep the GIL free.
+
+Frames cross the process boundary as Arrow IPC streams, which are
+cheaper to produce and parse than pickled object columns. Small inputs
+run inline, where the round trip would cost more than it saves.
+"""
+import json
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import pandas as pd
+
+# Worker processes for offloaded transforms; set MLOPS_OFFLOAD_WORKERS=0 to run everything inline
+OFFLOAD_MAX_WORKERS = int(os.getenv('MLOPS_OFFLOAD_WORKERS', min(4, os.cpu_count() or 1)))
+
+# Inputs smaller than this many cells (rows x columns, summed over frames) run inline
+OFFLOAD_MIN_CELLS = 200_000
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def to_ipc(df):
+    """Serialize a DataFrame as an Arrow IPC stream (bytes)."""
+    import pyarrow as pa
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def from_ipc(payload):
+    """Inverse of to_ipc."""
+    import pyarrow as pa
+
+    return pa.ipc.open_stream(payload).read_all().to_pandas()
+
+
+def _get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # spawn: forking a process that runs threads can copy held locks into the child
+            _pool = ProcessPoolExecutor(max_workers=OFFLOAD_MAX_WORKERS,
+                                        mp_context=multiprocessing.get_context('spawn'))
+        return _pool
+
+
+def _reset_pool():
+    """Drop a pool whose workers died, so the next offload starts a fresh one."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+def _cells(frames):
+    return sum(df.shape[0] * max(df.shape[1], 1) for df in frames)
+
+
+def _run_transform(fn, payloads, args):
+    result = fn(*[from_ipc(payload) for payload in payloads], *args)
+    return ('frame', to_ipc(result)) if isinstance(result, pd.DataFrame) else ('value', result)
+
+
+def offload(fn, *frames, args=(), min_cells=OFFLOAD_MIN_CELLS):
+    """Return fn(*frames, *args), computed in the process pool when the frames are large.
+
+    fn must be a module-level function (it is pickled by reference) and
+    its result a DataFrame or any picklable value. If the pool cannot be
+    used, fn runs inline instead.
+    """
+    if OFFLOAD_MAX_WORKERS <= 0 or _cells(frames) < min_cells:
+        return fn(*frames, *args)
+    try:
+        payloads = [to_ipc(df) for df in frames]
+        kind, result = _get_pool().submit(_run_transform, fn, payloads, args).result()
+    except BrokenProcessPool as e:
+        _reset_pool()
+        print(f"Offload pool failed, running {getattr(fn, '__name__', fn)} inline: {str(e)}")
+        return fn(*frames, *args)
+    except Exception as e:
+        print(f"Offloading {getattr(fn, '__name__', fn)} failed, running inline: {str(e)}")
+        return fn(*frames, *args)
+    return from_ipc(result) if kind == 'frame' else result
+
+
+def _format_records(df):
+    """df.to_dict('records') with datetimes as ISO 8601 strings and missing datetimes as None.
+
+    The single formatting step behind records(), inline or offloaded.
+    """
+    datetime_columns = [col for col in df.columns
+                        if pd.api.types.is_datetime64_any_dtype(df[col]) or isinstance(df[col].dtype, pd.DatetimeTZDtype)]
+    if datetime_columns:
+        df = df.assign(**{col: df[col].map(lambda value: value.isoformat(), na_action='ignore').astype(object)
+                          for col in datetime_columns})
+        df[datetime_columns] = df[datetime_columns].where(df[datetime_columns].notna(), None)
+    return df.to_dict('records')
+
+
+def _records_json(df):
+    # json.dumps writes floats with repr, so they parse back unchanged
+    return json.dumps(_format_records(df))
+
+
+def records(df, min_cells=OFFLOAD_MIN_CELLS):
+    """Row dicts (see _format_records) for grid rowData, with large frames encoded in the process pool.
+
+    Large frames come back as JSON text parsed by the C json decoder, so
+    the request thread never walks the frame cell by cell. Both paths
+    produce the same values.
+    """
+    if df is None or df.empty:
+        return []
+    if OFFLOAD_MAX_WORKERS <= 0 or _cells([df]) < min_cells:
+        return _format_records(df)
+    return json.loads(offload(_records_json, df, min_cells=0))
@@ -0,0 +1,182 @@
+"""Client-side rate limiting for Databricks REST calls, shared by every client in the process.
+
+Each API family (MLflow, Jobs, everything else) has a token bucket that
+caps the request rate and an AIMD concurrency window: the window grows
+by about one slot per window's worth of successful calls and halves on
+an HTTP 429, and a Retry-After header pauses the whole family until it
+expires. The limiter lives in a requests transport adapter, so it sees
+every attempt, including the SDK's own retries.
+"""
+import email.utils
+import threading
+import time
+from urllib.parse import urlsplit
+
+from requests.adapters import HTTPAdapter
+
+# family -> (requests per second, burst size)
+FAMILY_RATES = {
+    'mlflow': (20.0, 40),
+    'jobs': (10.0, 20),
+    'default': (20.0, 40),
+}
+
+# Concurrency window of a family: where it starts and how far it may grow or shrink
+INITIAL_CONCURRENCY = 8
+MIN_CONCURRENCY = 1
+MAX_CONCURRENCY = 32
+
+# 429s arriving within this many seconds of a decrease count as the same overload and halve the window once
+DECREASE_COOLDOWN = 1.0
+
+# Longest Retry-After honored, so a bad header cannot stall a family indefinitely
+MAX_RETRY_AFTER = 60.0
+
+
+def api_family(url):
+    """Rate-limit family of a request URL: 'mlflow', 'jobs' or 'default'."""
+    path = urlsplit(url).path
+    if '/mlflow/' in path:
+        return 'mlflow'
+    if '/jobs/' in path:
+        return 'jobs'
+    return 'default'
+
+
+def parse_retry_after(value):
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date), or None."""
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = email.utils.parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+
+class TokenBucket:
+    """Thread-safe token bucket; acquire() blocks until a token is available."""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class AdaptiveLimiter:
+    """Token bucket plus an AIMD concurrency window for one API family.
+
+    Callers wrap each HTTP attempt in acquire() / release(status, retry_after).
+    """
+
+    def __init__(self, family, rate, burst, initial_concurrency=INITIAL_CONCURRENCY,
+                 min_concurrency=MIN_CONCURRENCY, max_concurrency=MAX_CONCURRENCY):
+        self.family = family
+        self.bucket = TokenBucket(rate, burst)
+        self.limit = float(initial_concurrency)
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.in_flight = 0
+        self.requests = 0
+        self.throttled = 0
+        self._paused_until = 0.0
+        self._decreased_at = 0.0
+        self._condition = threading.Condition()
+
+    def acquire(self):
+        """Block until the family is not paused, a concurrency slot is free and a token is available."""
+        with self._condition:
+            while True:
+                pause = self._paused_until - time.monotonic()
+                if pause > 0:
+                    self._condition.wait(pause)
+                elif self.in_flight >= int(self.limit):
+                    self._condition.wait()
+                else:
+                    break
+            self.in_flight += 1
+            self.requests += 1
+        self.bucket.acquire()
+
+    def release(self, status=None, retry_after=None):
+        """Free the slot and adapt the window to the response status (None when the request failed)."""
+        with self._condition:
+            self.in_flight -= 1
+            now = time.monotonic()
+            if status == 429:
+                self.throttled += 1
+                if now - self._decreased_at > DECREASE_COOLDOWN:
+                    self.limit = max(self.min_concurrency, self.limit / 2)
+                    self._decreased_at = now
+                if retry_after:
+                    self._paused_until = max(self._paused_until, now + retry_after)
+            elif status is not None and status < 500:
+                self.limit = min(self.max_concurrency, self.limit + 1 / self.limit)
+            self._condition.notify_all()
+
+    def stats(self):
+        with self._condition:
+            return {
+                'family': self.family,
+                'concurrency': int(self.limit),
+                'in_flight': self.in_flight,
+                'requests': self.requests,
+                'throttled': self.throttled,
+                'paused_for': max(0.0, self._paused_until - time.monotonic())
+            }
+
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+def get_limiter(family):
+    """The process-wide limiter of an API family."""
+    with _limiters_lock:
+        limiter = _limiters.get(family)
+        if limiter is None:
+            rate, burst = FAMILY_RATES.get(family, FAMILY_RATES['default'])
+            limiter = _limiters[family] = AdaptiveLimiter(family, rate, burst)
+        return limiter
+
+
+def limiter_stats():
+    """stats() of every limiter created so far."""
+    with _limiters_lock:
+        limiters = list(_limiters.values())
+    return [limiter.stats() for limiter in limiters]
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """HTTPAdapter that passes every request through the limiter of its API family."""
+
+    def send(self, request, **kwargs):
+        limiter = get_limiter(api_family(request.url))
+        limiter.acquire()
+        status = retry_after = None
+        try:
+            response = super().send(request, **kwargs)
+            status = response.status_code
+            if status == 429:
+                retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            return response
+        finally:
+            limiter.release(status, retry_after)
+
@@ -0,0 +1,113 @@
+"""Parent/child index over a runs frame, for rolling up hyperparameter sweeps."""
+import pandas as pd
+
+# Tag MLflow sets on child runs, and the runs frame column it is flattened into
+PARENT_RUN_TAG = 'mlflow.parentRunId'
+PARENT_RUN_COLUMN = 'parent_run_id'
+
+_STATISTICS = ['mean', 'std', 'min', 'max']
+
+
+def aggregate_children(children_df):
+    """Per-parent rollup of child runs, indexed by parent_run_id.
+
+    Columns: child_count, one status_<STATUS> count per status, and
+    <metric>_mean/_std/_min/_max for every metric_ column.
+    """
+    if children_df.empty:
+        return pd.DataFrame()
+    # Plain objects, so categorical columns do not add rows or columns for values not present here
+    parents = children_df[PARENT_RUN_COLUMN].astype(object)
+    parts = [parents.groupby(parents, sort=False).size().rename('child_count')]
+    if 'status' in children_df.columns:
+        statuses = pd.crosstab(parents, children_df['status'].astype(object))
+        parts.append(statuses.add_prefix('status_'))
+    metric_columns = [col for col in children_df.columns if col.startswith('metric_')]
+    if metric_columns:
+        metrics = children_df[metric_columns].apply(pd.to_numeric, errors='coerce')
+        stats = metrics.groupby(parents, sort=False).agg(_STATISTICS)
+        stats.columns = [f"{metric}_{statistic}" for metric, statistic in stats.columns]
+        parts.append(stats)
+    return pd.concat(parts, axis=1)
+
+
+class RunHierarchy:
+    """Children of every parent run plus their per-parent aggregates (see aggregate_children).
+
+    Built from the parent_run_id column of a runs frame. merged() folds in
+    changed runs and re-aggregates only the parents those runs belong to,
+    so a sync that brings in a few new children of one sweep costs one
+    small groupby rather than a pass over the whole experiment. Instances
+    are never modified in place, so readers can keep using an old one.
+    """
+
+    def __init__(self, children, aggregates):
+        self.children = children  # child runs indexed by run_id
+        self.aggregates = aggregates  # indexed by parent_run_id
+
+    @classmethod
+    def from_runs(cls, runs_df):
+        children = cls._child_rows(runs_df)
+        return cls(children, aggregate_children(children))
+
+    @staticmethod
+    def _child_rows(runs_df):
+        if runs_df is None or runs_df.empty or PARENT_RUN_COLUMN not in runs_df.columns:
+            return pd.DataFrame(columns=[PARENT_RUN_COLUMN])
+        children = runs_df[runs_df[PARENT_RUN_COLUMN].notna()]
+        return children.drop_duplicates('run_id', keep='last').set_index('run_id')
+
+    def merged(self, changed_df):
+        """A new hierarchy with changed runs upserted and their parents re-aggregated."""
+        changed = self._child_rows(changed_df)
+        if changed.empty:
+            return self
+        touched = set(changed[PARENT_RUN_COLUMN])
+        # A child that moved to another parent also changes its old parent
+        previous = self.children[PARENT_RUN_COLUMN].reindex(changed.index).dropna()
+        touched.update(previous)
+
+        kept = self.children.drop(changed.index, errors='ignore')
+        children = pd.concat([kept, changed], sort=False) if not kept.empty else changed
+        refreshed = aggregate_children(children[children[PARENT_RUN_COLUMN].isin(touched)].reset_index())
+        untouched = self.aggregates.drop(list(touched), errors='ignore') if not self.aggregates.empty else self.aggregates
+        aggregates = pd.concat([untouched, refreshed], sort=False) if not untouched.empty else refreshed
+        counts = [col for col in aggregates.columns if col.startswith('status_')]
+        aggregates[counts] = aggregates[counts].fillna(0).astype(int)
+        return RunHierarchy(children, aggregates)
+
+    @property
+    def parent_ids(self):
+        return list(self.aggregates.index)
+
+    def children_of(self, parent_run_id):
+        """Child runs of one parent, with run_id as a column."""
+        return self.children[self.children[PARENT_RUN_COLUMN] == parent_run_id].reset_index()
+
+    def best_child(self, parent_run_id, metric, higher_is_better=False):
+        """The child row with the best value of metric, or None."""
+        children = self.children_of(parent_run_id)
+        if metric not in children.columns:
+            return None
+        values = pd.to_numeric(children[metric], errors='coerce')
+        if values.notna().sum() == 0:
+            return None
+        return children.loc[values.idxmax() if higher_is_better else values.idxmin()]
+
+    def parents_frame(self, runs_df, metric=None):
+        """One row per parent: its standard run columns (when in runs_df) joined with its aggregates.
+
+        With metric, the aggregate columns are limited to that metric's.
+        """
+        if self.aggregates.empty:
+            return pd.DataFrame()
+        aggregates = self.aggregates
+        if metric is not None:
+            keep = [col for col in aggregates.columns
+                    if not col.startswith('metric_') or col.rsplit('_', 1)[0] == metric]
+            aggregates = aggregates[keep]
+        parents = aggregates.rename_axis('run_id').reset_index()
+        if runs_df is not None and not runs_df.empty:
+            info = runs_df[[col for col in ['run_id', 'run_name', 'status', 'start_time'] if col in runs_df.columns]]
+            parents = info.drop_duplicates('run_id').merge(parents, on='run_id', how='right')
+        return parents
@@ -0,0 +1,86 @@
+"""Join of logged models to the runs that produced them, kept in step with both snapshots.
+
+Datasets are not part of the join. The run snapshots do not carry run
+dataset inputs (search_runs results are decoded into metrics, params and
+tags only), and the logged-model frames keep a metric's dataset only in its
+'<dataset>_<metric>' column name, which cannot be split back reliably (a
+general metric may be called 'val_rmse'). Dataset-scoped metrics of a model
+stay available on its row of the logged-models frame.
+"""
+import pandas as pd
+
+# Model columns kept in the linkage frame (metrics and params stay in the models frame)
+LINK_MODEL_COLUMNS = ['model_id', 'model_name', 'source_run_id', 'last_updated_timestamp']
+
+# Run columns carried over; each is prefixed with 'run_' unless it already is
+LINK_RUN_COLUMNS = ['run_name', 'status', 'start_time', 'end_time']
+
+
+def _run_side(runs_df):
+    """Run columns to join, indexed by run_id and prefixed so they cannot clash with model columns."""
+    if runs_df is None or runs_df.empty:
+        return pd.DataFrame(index=pd.Index([], name='run_id'))
+    columns = [col for col in LINK_RUN_COLUMNS if col in runs_df.columns]
+    columns += [col for col in runs_df.columns if col.startswith('param_')]
+    runs = runs_df.drop_duplicates('run_id', keep='last').set_index('run_id')[columns]
+    return runs.rename(columns=lambda col: col if col.startswith('run_') else f'run_{col}')
+
+
+class RunModelLinks:
+    """Logged models joined to their source runs, indexed by model_id.
+
+    sync() is called with the current models and runs frames. Only what
+    changed is re-joined: new or updated models (by last_updated_timestamp),
+    and models whose source run is in changed_run_ids. Passing
+    changed_run_ids=None re-joins the run side of every model, which is
+    still a single vectorized reindex.
+    """
+
+    def __init__(self):
+        self.links = pd.DataFrame(columns=LINK_MODEL_COLUMNS).set_index('model_id')
+        self._models_by_run = None
+
+    def _join(self, models, run_side):
+        return models.join(run_side.reindex(models['source_run_id'].to_numpy()).set_axis(models.index), how='left')
+
+    def sync(self, models_df, runs_df, models_changed=True, changed_run_ids=None):
+        """Bring the links up to date with the given frames; returns the links frame."""
+        run_side = _run_side(runs_df)
+        links = self.links
+
+        if models_changed and models_df is not None:
+            if models_df.empty or 'source_run_id' not in models_df.columns:
+                links = self.links.iloc[0:0]
+            else:
+                models = models_df[[col for col in LINK_MODEL_COLUMNS if col in models_df.columns]]
+                models = models.drop_duplicates('model_id', keep='last').set_index('model_id')
+                previous = links['last_updated_timestamp'].reindex(models.index)
+                fresh = previous.isna() | (previous != models['last_updated_timestamp'])
+                kept = links[links.index.isin(models.index[~fresh])]
+                joined = self._join(models[fresh], run_side)
+                links = pd.concat([kept, joined], sort=False) if not kept.empty else joined
+                links = links.reindex(models.index)
+
+        if changed_run_ids is None:
+            stale = slice(None)
+        else:
+            stale = links['source_run_id'].isin(list(changed_run_ids)).to_numpy()
+        if not links.empty and len(run_side.columns):
+            refreshed = self._join(links.loc[stale, LINK_MODEL_COLUMNS[1:]], run_side)
+            links = pd.concat([links.drop(refreshed.index), refreshed], sort=False).reindex(links.index)
+
+        self.links = links
+        self._models_by_run = None
+        return links
+
+    def source_run(self, model_id):
+        """The linked row (model and source-run columns) of one model, or None."""
+        if model_id not in self.links.index:
+            return None
+        return self.links.loc[model_id]
+
+    def models_for_run(self, run_id):
+        """model_ids logged from one run."""
+        if self._models_by_run is None:
+            self._models_by_run = self.links.groupby('source_run_id', sort=False, observed=True).groups
+        return list(self._models_by_run.get(run_id, []))
@@ -0,0 +1,198 @@
+"""Local Parquet persistence of DataFrame snapshots, so the app can start (or keep running) without the workspace."""
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+# Bump when the layout of persisted frames changes; older files are ignored
+SNAPSHOT_FORMAT_VERSION = 4
+
+# Where snapshots are written; set MLOPS_SNAPSHOT_DIR to an empty string to disable persistence
+DEFAULT_SNAPSHOT_DIR = os.getenv('MLOPS_SNAPSHOT_DIR', '.snapshots')
+
+_METADATA_KEY = b'mlops_snapshot'
+
+
+def snapshot_key(kind, *parts):
+    """Filesystem-safe snapshot name, e.g. snapshot_key('runs', '/ML/exp') -> 'runs-ML_exp-<hash>'."""
+    raw = '|'.join(str(part) for part in parts)
+    readable = re.sub(r'[^A-Za-z0-9]+', '_', raw).strip('_')[:60]
+    digest = hashlib.sha1(raw.encode('utf-8')).hexdigest()[:10]
+    return f"{kind}-{readable}-{digest}" if readable else f"{kind}-{digest}"
+
+
+class SnapshotStore:
+    """Saves and loads DataFrames as Parquet files with version and schema metadata."""
+
+    def __init__(self, directory=DEFAULT_SNAPSHOT_DIR):
+        self.directory = directory
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='snapshot-writer')
+
+    @property
+    def enabled(self):
+        return bool(self.directory)
+
+    def path(self, key):
+        return os.path.join(self.directory, f"{key}.parquet")
+
+    def save(self, key, df, **metadata):
+        """Write a snapshot atomically. Returns True on success."""
+        if not self.enabled:
+            return False
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            
+            os.makedirs(self.directory, exist_ok=True)
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            snapshot_metadata = {
+                'version': SNAPSHOT_FORMAT_VERSION,
+                'saved_at': time.time(),
+                'rows': len(df),
+                **metadata
+            }
+            table = table.replace_schema_metadata({
+                **(table.schema.metadata or {}),
+                _METADATA_KEY: json.dumps(snapshot_metadata, default=str).encode('utf-8')
+            })
+            tmp_path = f"{self.path(key)}.tmp"
+            pq.write_table(table, tmp_path)
+            os.replace(tmp_path, self.path(key))
+            return True
+        except Exception as e:
+            print(f"Error saving snapshot '{key}': {str(e)}")
+            return False
+
+    def save_async(self, key, df, **metadata):
+        """Queue a save on the background writer thread."""
+        if self.enabled:
+            self._writer.submit(self.save, key, df, **metadata)
+
+    def load(self, key):
+        """Load a snapshot as (DataFrame, metadata), or None if missing, unreadable or from another version.
+
+        The file is memory-mapped rather than read into a buffer first.
+        """
+        if not self.enabled or not os.path.exists(self.path(key)):
+            return None
+        try:
+            import pyarrow.parquet as pq
+            
+            table = pq.read_table(self.path(key), memory_map=True)
+            raw_metadata = (table.schema.metadata or {}).get(_METADATA_KEY)
+            metadata = json.loads(raw_metadata) if raw_metadata else {}
+            if metadata.get('version') != SNAPSHOT_FORMAT_VERSION:
+                print(f"Ignoring snapshot '{key}' with format version {metadata.get('version')}")
+                return None
+            return table.to_pandas(), metadata
+        except Exception as e:
+            print(f"Error loading snapshot '{key}': {str(e)}")
+            return None
+
+    def delete(self, key):
+        if self.enabled and os.path.exists(self.path(key)):
+            os.remove(self.path(key))
+
+
+class PersistentFrame:
+    """A DataFrame produced by `loader`, cached in memory and mirrored to a SnapshotStore.
+
+    get() serves the in-memory frame while it is younger than max_age. On a
+    cold start the persisted copy is served immediately and refreshed in
+    the background. If refreshing fails the last known data keeps being
+    served and `degraded` is set until a refresh succeeds. The loader
+    should raise on failure rather than return an empty frame.
+    """
+
+    def __init__(self, store, key, loader, max_age, **metadata):
+        self.store = store
+        self.key = key
+        self.loader = loader
+        self.max_age = max_age
+        self.metadata = metadata
+        self.df = None
+        self.fetched_at = None
+        self.from_disk = False
+        self.degraded = False
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._disk_checked = False
+        self._refreshing = False
+
+    @property
+    def age(self):
+        return None if self.fetched_at is None else time.time() - self.fetched_at
+
+    def _load_from_disk(self):
+        with self._lock:
+            if self._disk_checked:
+                return
+            self._disk_checked = True
+        loaded = self.store.load(self.key)
+        if loaded is None:
+            return
+        df, metadata = loaded
+        with self._lock:
+            if self.df is None:
+                self.df = df
+                self.fetched_at = metadata.get('fetched_at', metadata.get('saved_at'))
+                self.from_disk = True
+
+    def get(self, max_age=None):
+        """Return the frame, refreshing it first when it is older than max_age."""
+        max_age = self.max_age if max_age is None else max_age
+        if self.df is None:
+            self._load_from_disk()
+        df, age = self.df, self.age
+        if df is not None and age is not None and age < max_age:
+            return df
+        if df is not None and self.from_disk and max_age > 0:
+            self.refresh_in_background()
+            return df
+        refreshed = self.refresh()
+        if refreshed is not None:
+            return refreshed
+        return df if df is not None else pd.DataFrame()
+
+    def refresh(self):
+        """Run the loader now. Returns the new frame, or None if the loader failed."""
+        with self._refresh_lock:
+            started_at = time.time()
+            try:
+                df = self.loader()
+            except Exception as e:
+                print(f"Error refreshing '{self.key}': {str(e)}")
+                self.degraded = self.df is not None
+                return None
+            with self._lock:
+                self.df = df
+                self.fetched_at = started_at
+                self.from_disk = False
+                self.degraded = False
+            self.store.save_async(self.key, df, fetched_at=started_at, **self.metadata)
+            return df
+
+    def refresh_in_background(self):
+        """Start a refresh on a daemon thread unless one is already running."""
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        def run():
+            try:
+                self.refresh()
+            finally:
+                with self._lock:
+                    self._refreshing = False
+
+        threading.Thread(target=run, name=f"refresh-{self.key}", daemon=True).start()
+
+
+# Process-wide store shared by the service layer and the tabs
+snapshot_store = SnapshotStore()
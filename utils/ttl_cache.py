@@ -0,0 +1,54 @@
+"""Bounded, thread-safe LRU cache whose entries expire, shared by the detail panels of the services."""
+import threading
+import time
+from collections import OrderedDict
+
+
+class TTLCache:
+    """LRU cache of at most max_entries values that are served until they are max_age seconds old.
+
+    max_age may be a number, or a function of the cached value returning
+    one (e.g. a shorter age for active runs). A value can be put with a
+    version; a get() asking for another version misses.
+    """
+
+    def __init__(self, max_entries, max_age=None):
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> (value, version, fetched_at)
+
+    def get(self, key, max_age=None, version=None):
+        """The cached value if it is young enough (max_age overrides the default) and of version (any when None)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, cached_version, fetched_at = entry
+            if version is not None and version != cached_version:
+                return None
+            if max_age is None:
+                max_age = self.max_age(value) if callable(self.max_age) else self.max_age
+            if max_age is not None and time.time() - fetched_at > max_age:
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key, value, version=None):
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (value, version, time.time())
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key=None):
+        """Drop one entry, or everything."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
@@ -0,0 +1,79 @@
+"""Process-wide Databricks WorkspaceClient of the app.
+
+Resolving auth and opening HTTPS connections are the slow parts of a
+WorkspaceClient, so the app keeps one client for its own identity, and
+every session (the SDK's and the MLflow REST client's) sends through one
+rate-limited connection pool (see utils.rate_limit), so connections stay
+alive and are reused whichever client makes the call. Services look the
+client up here on every use rather than keeping their own reference, so
+clear() takes effect everywhere.
+"""
+import threading
+
+# Shared connection pool: hosts kept, and keep-alive connections per host
+CLIENT_POOL_CONNECTIONS = 4
+CLIENT_POOL_MAXSIZE = 32
+
+
+class WorkspaceClientRegistry:
+    """The app's WorkspaceClient, on the shared connection pool."""
+
+    def __init__(self, pool_connections=CLIENT_POOL_CONNECTIONS, pool_maxsize=CLIENT_POOL_MAXSIZE):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self._client = None
+        self._adapter = None
+        self._lock = threading.Lock()
+
+    @property
+    def adapter(self):
+        """The rate-limited transport adapter every session is mounted on."""
+        with self._lock:
+            if self._adapter is None:
+                from utils.rate_limit import RateLimitedAdapter
+                # pool_block: wait for a free connection rather than opening throwaway ones
+                self._adapter = RateLimitedAdapter(pool_connections=self.pool_connections,
+                                                   pool_maxsize=self.pool_maxsize, pool_block=True)
+            return self._adapter
+
+    def mount(self, session):
+        """Send a requests session's traffic through the shared pool and limiter; returns the session."""
+        session.mount('https://', self.adapter)
+        session.mount('http://', self.adapter)
+        return session
+
+    def get(self):
+        """The app's own WorkspaceClient, created on first use. Raises if auth cannot be resolved."""
+        if self._client is None:
+            from databricks.sdk import WorkspaceClient
+
+            client = WorkspaceClient()
+            # The SDK has no hook for its transport, so the adapter goes on its internal session when there is one
+            session = getattr(getattr(client.api_client, '_api_client', None), '_session', None)
+            if session is not None and hasattr(session, 'mount'):
+                self.mount(session)
+            else:
+                print("Warning: the Databricks SDK session could not be found; its requests are not rate limited.")
+            with self._lock:
+                if self._client is None:
+                    self._client = client
+        return self._client
+
+    @property
+    def config(self):
+        """Resolved SDK Config of the app's client (host and authenticate())."""
+        return self.get().config
+
+    def clear(self):
+        """Drop the client (e.g. after credentials change) so the next use resolves auth again; the pool is kept."""
+        with self._lock:
+            self._client = None
+
+
+# Global instance
+workspace_clients = WorkspaceClientRegistry()
+
+
+def get_workspace_client():
+    """The shared WorkspaceClient of the app (see WorkspaceClientRegistry.get)."""
+    return workspace_clients.get()